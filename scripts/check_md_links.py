@@ -14,12 +14,37 @@ It skips external URLs, mailto links, and pure fragments (e.g. `#section`).
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+# Fan out to worker processes only for docs trees at least this large
+PARALLEL_MIN_FILES = 200
+
+# Bytes pattern: files are scanned raw and only the matched spans are decoded
+LINK_RE = re.compile(rb"\[([^\]]*)\]\(([^)]+)\)")
+
+
+def _read_links(md_file: Path) -> list[tuple[str, str]]:
+    """Extract (display, target) pairs from a markdown file.
+
+    Memory-maps the file and runs LINK_RE over the raw bytes, so only the
+    link spans are decoded instead of the whole document.
+    """
+    with md_file.open("rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [
+                (m.group(1).decode("utf-8"), m.group(2).decode("utf-8"))
+                for m in LINK_RE.finditer(mm)
+            ]
 
 
 def is_url(s: str) -> bool:
@@ -87,6 +112,55 @@ def _is_mirrored_hardcover_api_doc(md_file: Path, *, docs_dir: Path) -> bool:
     return rel_path.parts[:3] == ("reference", "hardcover", "api")
 
 
+def _scan_file(
+    md_file: Path, *, docs_dir: Path, repo_root: Path
+) -> tuple[int, list[tuple[Path, str, str]]]:
+    """Check the links in one markdown file.
+
+    Returns:
+        Tuple of (links checked, broken links as (rel_path, target, display))
+    """
+    broken: list[tuple[Path, str, str]] = []
+    checked = 0
+
+    try:
+        links = _read_links(md_file)
+    except UnicodeDecodeError as e:
+        logger.error(f"Encoding error reading {md_file}: {e}")
+        return checked, broken
+    except (FileNotFoundError, PermissionError) as e:
+        logger.error(f"Cannot read {md_file}: {e}")
+        return checked, broken
+
+    for display, target in links:
+        checked += 1
+
+        # The upstream Hardcover API docs use site-relative URLs that don't map
+        # to repo files once mirrored into this workspace.
+        if _is_mirrored_hardcover_api_doc(md_file, docs_dir=docs_dir):
+            stripped = target.strip()
+            if stripped.startswith("/") and not stripped.startswith("//"):
+                continue
+
+            path_part, _fragment = _split_target(stripped)
+
+            # Many links in these docs are route-like (no extension) and map to
+            # the upstream site's router, not a real file path in this repo.
+            if path_part and not is_url(path_part):
+                p = Path(path_part)
+                if p.suffix == "" and not path_part.endswith("/"):
+                    continue
+
+        resolved = resolve_target(md_file, target, repo_root=repo_root)
+
+        if resolved is None and not is_url(target) and target.strip():
+            # This might be a broken link
+            rel_path = md_file.relative_to(docs_dir)
+            broken.append((rel_path, target, display))
+
+    return checked, broken
+
+
 def check_links() -> int:
     """Check all markdown links in docs/ folder."""
     repo_root = Path.cwd()
@@ -95,44 +169,33 @@ def check_links() -> int:
         logger.error("docs/ not found. Run from repo root.")
         return 2
 
-    broken = []
+    broken: list[tuple[Path, str, str]] = []
     checked = 0
 
-    for md_file in sorted(list(docs_dir.rglob("*.md")) + list(docs_dir.rglob("*.mdx"))):
-        try:
-            text = md_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError as e:
-            logger.error(f"Encoding error reading {md_file}: {e}")
-            continue
-        except (FileNotFoundError, PermissionError) as e:
-            logger.error(f"Cannot read {md_file}: {e}")
-            continue
-
-        for display, target in LINK_RE.findall(text):
-            checked += 1
-
-            # The upstream Hardcover API docs use site-relative URLs that don't map
-            # to repo files once mirrored into this workspace.
-            if _is_mirrored_hardcover_api_doc(md_file, docs_dir=docs_dir):
-                stripped = target.strip()
-                if stripped.startswith("/") and not stripped.startswith("//"):
-                    continue
-
-                path_part, _fragment = _split_target(stripped)
-
-                # Many links in these docs are route-like (no extension) and map to
-                # the upstream site's router, not a real file path in this repo.
-                if path_part and not is_url(path_part):
-                    p = Path(path_part)
-                    if p.suffix == "" and not path_part.endswith("/"):
-                        continue
-
-            resolved = resolve_target(md_file, target, repo_root=repo_root)
-
-            if resolved is None and not is_url(target) and target.strip():
-                # This might be a broken link
-                rel_path = md_file.relative_to(docs_dir)
-                broken.append((rel_path, target, display))
+    # One os.walk pass instead of two rglob() calls; Path objects are only
+    # built for markdown files
+    md_files = [
+        Path(root) / name
+        for root, _dirs, files in os.walk(docs_dir)
+        for name in files
+        if name.endswith((".md", ".mdx"))
+    ]
+    md_files.sort(key=os.fspath)
+    scan = partial(_scan_file, docs_dir=docs_dir, repo_root=repo_root)
+
+    # Process startup costs more than scanning a small docs tree serially
+    if len(md_files) >= PARALLEL_MIN_FILES:
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(scan, md_files, chunksize=max(1, len(md_files) // (4 * workers)))
+            )
+    else:
+        results = [scan(md_file) for md_file in md_files]
+
+    for file_checked, file_broken in results:
+        checked += file_checked
+        broken.extend(file_broken)
 
     if broken:
         logger.error(f"Found {len(broken)} broken link(s):")
@@ -10,6 +10,7 @@ This is intentionally small and dependency-light. Uses httpx and rich.
 from __future__ import annotations
 
 import argparse
+import asyncio
 from collections.abc import Iterable
 from typing import Any, cast
 
@@ -27,12 +28,12 @@ API_BASE = "https://api.audnex.us/books"
 DEFAULT_REGIONS = ["au", "ca", "de", "es", "fr", "in", "it", "jp", "us", "uk"]
 
 
-def query_region(
+async def query_region(
+    client: httpx.AsyncClient,
     asin: str,
     region: str,
     seed_authors: bool = False,
     update: bool = False,
-    timeout: float = 10.0,
 ) -> dict[str, Any] | None:
     params = {"region": region}
     if seed_authors:
@@ -42,8 +43,7 @@ def query_region(
 
     url = f"{API_BASE}/{asin}"
     try:
-        with httpx.Client(timeout=timeout, http2=True) as client:
-            r = client.get(url, params=params)
+        r = await client.get(url, params=params)
         if r.status_code == 200:
             # r.json() returns Any; ensure we return a dict when possible
             payload = r.json()
@@ -57,28 +57,48 @@ def query_region(
         return {"_error": str(exc)}
 
 
-def run(
+async def query_regions(
     asin: str,
-    regions: Iterable[str],
+    regions: list[str],
     seed_authors: bool,
     update: bool,
     timeout: float,
-    json_out: bool,
-) -> int:
-    results: dict[str, dict[str, Any] | None] = {}
+) -> dict[str, dict[str, Any] | None]:
+    """Query all regions concurrently over one shared client."""
     with Progress(SpinnerColumn(), TextColumn("{task.description}"), transient=True) as progress:
-        task = progress.add_task("Querying Audnex…", total=len(list(regions)))
-        for region in regions:
-            progress.update(task, description=f"Querying region: {region}")
-            res = query_region(
+        task = progress.add_task(f"Querying {len(regions)} Audnex regions…", total=len(regions))
+
+        async def query(client: httpx.AsyncClient, region: str) -> dict[str, Any] | None:
+            res = await query_region(
+                client,
                 asin,
                 region,
                 seed_authors=seed_authors,
                 update=update,
-                timeout=timeout,
             )
-            results[region] = res
             progress.advance(task)
+            return res
+
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=len(regions) or 1),
+        ) as client:
+            responses = await asyncio.gather(*(query(client, region) for region in regions))
+
+    return dict(zip(regions, responses, strict=True))
+
+
+def run(
+    asin: str,
+    regions: Iterable[str],
+    seed_authors: bool,
+    update: bool,
+    timeout: float,
+    json_out: bool,
+) -> int:
+    regions = list(regions)
+    results = asyncio.run(query_regions(asin, regions, seed_authors, update, timeout))
 
     # Table summary
     table = Table(title=f"Audnex lookup for {asin}", box=box.SIMPLE)
@@ -13,6 +13,7 @@ from shelfr.abs.asin import (
     extract_asin,
     extract_asin_from_abs_item,
     extract_asin_with_source,
+    extract_asin_with_span,
     is_valid_asin,
     match_search_results,
     resolve_asin_via_abs_search,
@@ -79,6 +80,7 @@ __all__ = [
     "extract_asin",
     "extract_asin_from_abs_item",
     "extract_asin_with_source",
+    "extract_asin_with_span",
     "extract_all_asins",
     "is_valid_asin",
     "match_search_results",
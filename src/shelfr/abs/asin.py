@@ -71,7 +71,7 @@ ASIN_PATTERNS = [
 ASIN_REGEX = re.compile(r"^(?:B[0-9A-Z]{9}|[0-9]{10})$")
 
 
-@dataclass
+@dataclass(slots=True)
 class AsinSource:
     """Tracks where an ASIN was found."""
 
@@ -112,13 +112,33 @@ def extract_asin(text: str) -> str | None:
         >>> extract_asin("Book B0ABC12345 extra")
         'B0ABC12345'
     """
+    return extract_asin_with_span(text)[0]
+
+
+def extract_asin_with_span(text: str) -> tuple[str | None, int, int]:
+    """Extract ASIN along with the span of the text it was found in.
+
+    Same pattern cascade as extract_asin(). The span covers the whole match,
+    including braces/brackets for the marker formats, so callers can cut
+    the marker out without searching again.
+
+    Args:
+        text: Folder name, file name, or other text to search
+
+    Returns:
+        Tuple of (asin, start, end), or (None, -1, -1) if no ASIN found
+
+    Examples:
+        >>> extract_asin_with_span("Book {ASIN.B0DK9TS6D9}")
+        ('B0DK9TS6D9', 5, 22)
+    """
     if not text:
-        return None
+        return None, -1, -1
     for pattern in ASIN_PATTERNS:
         match = pattern.search(text)
         if match:
-            return match.group(1)
-    return None
+            return match.group(1), match.start(), match.end()
+    return None, -1, -1
 
 
 def extract_asin_with_source(text: str, source_type: str) -> AsinSource | None:
@@ -11,13 +11,21 @@ See docs/UNKNOWN_ASIN_HANDLING.md for unknown ASIN handling design (Phase 1+).
 
 from __future__ import annotations
 
+import contextlib
+import errno
 import fnmatch
+import functools
 import json
 import logging
 import os
 import re
+import shutil
+import stat
+import threading
+import uuid
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -28,7 +36,7 @@ import httpx
 from shelfr.abs.asin import (
     AsinEntry,
     asin_exists,
-    extract_asin,
+    extract_asin_with_span,
     normalize_asin_to_preferred_region,
     resolve_asin_from_folder_with_mediainfo,
     resolve_asin_via_abs_search,
@@ -113,6 +121,39 @@ logger = logging.getLogger(__name__)
 
 # Audio extensions recognized by the importer
 AUDIO_EXTENSIONS = frozenset({".m4b", ".m4a", ".mp3", ".ogg", ".flac", ".opus", ".wav"})
+# Tuple form for str.endswith() checks on raw file names
+_AUDIO_SUFFIXES = tuple(AUDIO_EXTENSIONS)
+
+# Hidden folder in the library root where overwritten targets are moved before
+# being deleted in the background (dot-folders are ignored by ABS scans)
+TRASH_DIR_NAME = ".shelfr-trash"
+
+# Background deletes for overwritten targets; outstanding work is finished at
+# interpreter exit
+_TRASH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="shelfr-trash")
+
+# Trash entries this process has queued for deletion, so a sweep for leftovers
+# from earlier runs doesn't delete the same entry twice
+_trash_pending: set[Path] = set()
+_trash_pending_lock = threading.Lock()
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pre-compiled patterns for parse_mam_folder_name()
+# ─────────────────────────────────────────────────────────────────────────────
+
+_MULTI_SPACE_PATTERN = re.compile(r"\s{2,}")
+# {ASIN.xxx}, [ASIN.xxx] or bare [B0xxx] markers, anywhere in the name
+_ASIN_MARKER_PATTERN = re.compile(
+    r"\s*(?:\{ASIN\.[A-Z0-9]+\}|\[ASIN\.[A-Z0-9]+\]|\[B0[A-Z0-9]{8,9}\])\s*"
+)
+_PAREN_PATTERN = re.compile(r"\(([^)]+)\)")
+_VOL_PATTERN = re.compile(r"\bvol[_.]?\s*(\d+)\b", re.IGNORECASE)
+_VOL_SERIES_PATTERN = re.compile(r"^(.+?)\s+(?:Vol\.?\s*\d+\s+)?vol[_.]?\s*\d+", re.IGNORECASE)
+_TRAILING_VOL_PATTERN = re.compile(r"\s+Vol\.?\s*\d+\s*$", re.IGNORECASE)
+_SERIES_PATTERN = re.compile(
+    r"^(.+?)\s+(?:vol[_.]?|#)\s*(\d+(?:\.\d+)?)\s+-\s+(.+)$",
+    re.IGNORECASE,
+)
 
 
 class UnknownAsinPolicy(str, Enum):
@@ -147,7 +188,7 @@ class DuplicateError(ImportError):
         super().__init__(f"ASIN {asin} already exists at {existing_path}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Result of a single import operation."""
 
@@ -160,7 +201,7 @@ class ImportResult:
     cleanup: CleanupResult | None = None  # Post-import cleanup result
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchImportResult:
     """Result of a batch import operation."""
 
@@ -229,9 +270,13 @@ class UnknownAsinContext:
         return self.file_count > 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedFolderName:
-    """Parsed components from MAM-style folder name."""
+    """Parsed components from MAM-style folder name.
+
+    Frozen so parse results can be cached and shared; use
+    dataclasses.replace() to derive an updated copy.
+    """
 
     author: str
     title: str
@@ -244,6 +289,39 @@ class ParsedFolderName:
     is_standalone: bool  # True if no series info
 
 
+# Closing bracket -> opening bracket for trailing ripper tags
+_TAG_BRACKETS = {"]": "[", "}": "{"}
+
+
+def _split_trailing_tag(name: str) -> tuple[str, str | None]:
+    """Split a trailing ``[Tag]`` or ``{Tag}`` group off a folder name.
+
+    Single right-to-left scan using str.rfind instead of running two
+    anchored regex searches over the whole name.
+
+    Args:
+        name: Folder name with ASIN markers already removed
+
+    Returns:
+        Tuple of (name without the tag, tag content or None)
+    """
+    stripped = name.rstrip()
+    if not stripped:
+        return name, None
+    closer = stripped[-1]
+    opener = _TAG_BRACKETS.get(closer)
+    if opener is None:
+        return name, None
+    # The tag may not contain its own closer, so it starts at the first
+    # opener after the previous closer
+    end = len(stripped) - 1
+    start = stripped.find(opener, stripped.rfind(closer, 0, end) + 1, end)
+    if start < 0 or start + 1 == end:
+        return name, None
+    return stripped[:start].strip(), stripped[start + 1 : end]
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_mam_folder_name(folder_name: str) -> ParsedFolderName:
     """Parse MAM-compliant folder name into components.
 
@@ -260,18 +338,29 @@ def parse_mam_folder_name(folder_name: str) -> ParsedFolderName:
     Note:
         This function is lenient and will always return a ParsedFolderName,
         even if parsing fails (fields may be set to "Unknown" or None).
+        Results are memoized; the returned object is frozen and shared.
     """
     # Try to extract ASIN first (multiple formats supported)
-    asin = extract_asin(folder_name)
+    asin, asin_start, asin_end = extract_asin_with_span(folder_name)
+
+    # Strip ASIN markers from ANYWHERE in the string (not just end)
+    # This handles cases like "Title {ASIN.B0xxx} [RipperTag]" where
+    # ripper tag comes after ASIN. The marker the ASIN came from is cut by
+    # span; bare (unbracketed) ASINs are left in place.
+    clean_folder = folder_name
+    if asin and folder_name[asin_start] in "[{":
+        clean_folder = f"{folder_name[:asin_start]} {folder_name[asin_end:]}"
+    # Only rescan when another marker is left (some legacy names carry two)
+    if "ASIN." in clean_folder or "[B0" in clean_folder:
+        clean_folder = _ASIN_MARKER_PATTERN.sub(" ", clean_folder)
 
     # Strip format indicators BEFORE parsing to avoid "(Light Novel)" etc. being
     # misidentified as author in Libation-style folder names
     # Format indicators are loaded from naming.json (cached) with fallback defaults
-    clean_folder = folder_name
     for indicator in _get_format_indicators():
         clean_folder = clean_folder.replace(indicator, "").strip()
     # Collapse multiple spaces
-    clean_folder = re.sub(r"\s{2,}", " ", clean_folder).strip()
+    clean_name = _MULTI_SPACE_PATTERN.sub(" ", clean_folder).strip()
 
     # Extract components using patterns
     # Pattern parts:
@@ -283,58 +372,41 @@ def parse_mam_folder_name(folder_name: str) -> ParsedFolderName:
     # - Optional ripper tag in braces
     # - Optional ASIN in brackets
 
-    # Strip ASIN markers from ANYWHERE in the string (not just end)
-    # This handles cases like "Title {ASIN.B0xxx} [RipperTag]" where
-    # ripper tag comes after ASIN
-    clean_name = re.sub(r"\s*\{ASIN\.[A-Z0-9]+\}\s*", " ", clean_folder)
-    clean_name = re.sub(r"\s*\[ASIN\.[A-Z0-9]+\]\s*", " ", clean_name)
-    clean_name = re.sub(r"\s*\[B0[A-Z0-9]{8,9}\]\s*", " ", clean_name)
-    # Collapse multiple spaces after ASIN removal
-    clean_name = re.sub(r"\s{2,}", " ", clean_name).strip()
-
     # Extract ripper tag if present - can be [Tag] or {Tag} format
-    ripper_match = re.search(r"\[([^\]]+)\]\s*$", clean_name)
-    if not ripper_match:
-        ripper_match = re.search(r"\{([^}]+)\}\s*$", clean_name)
-    ripper_tag = ripper_match.group(1) if ripper_match else None
-    if ripper_match:
-        clean_name = clean_name[: ripper_match.start()].strip()
+    clean_name, ripper_tag = _split_trailing_tag(clean_name)
 
     # Extract narrator if present (e.g., (Narrator Name))
     # This is typically the last parenthetical that's not a year
     narrator = None
     year = None
 
-    # Find all parentheticals from the end
-    paren_matches = list(re.finditer(r"\(([^)]+)\)", clean_name))
-    for match in reversed(paren_matches):
+    # Find all parentheticals from the end, remembering the span of each pick
+    # (only the last occurrence of the chosen year is removed)
+    remove_spans: list[tuple[int, int]] = []
+    year_spans: dict[str, tuple[int, int]] = {}
+    for match in reversed(list(_PAREN_PATTERN.finditer(clean_name))):
         content = match.group(1)
-        if re.match(r"^\d{4}$", content):
+        if len(content) == 4 and content.isdecimal():
             year = content
-        elif narrator is None and not re.match(r"^\d{4}$", content):
+            year_spans.setdefault(content, match.span())
+        elif narrator is None:
             narrator = content
+            remove_spans.append(match.span())
         if year and narrator:
             break
-
-    # Remove specific parentheticals by position (from end to preserve indices)
-    # Only remove the last occurrence of each to avoid unintended replacements
-    remove_spans: list[tuple[int, int]] = []
-    if narrator:
-        for match in reversed(paren_matches):
-            if match.group(1) == narrator:
-                remove_spans.append((match.start(), match.end()))
-                break
     if year:
-        for match in reversed(paren_matches):
-            if match.group(1) == year:
-                remove_spans.append((match.start(), match.end()))
-                break
-    # Remove spans from the string (sort by start, process from end to preserve indices)
+        remove_spans.append(year_spans[year])
+
+    # Rebuild the name around the picked spans in a single join
     if remove_spans:
-        remove_spans.sort(reverse=True)  # Process from end first
-        for start, end in remove_spans:
-            clean_name = clean_name[:start] + clean_name[end:]
-        clean_name = clean_name.strip()
+        remove_spans.sort()
+        pieces: list[str] = []
+        pos = 0
+        for span_start, span_end in remove_spans:
+            pieces.append(clean_name[pos:span_start])
+            pos = span_end
+        pieces.append(clean_name[pos:])
+        clean_name = "".join(pieces).strip()
 
     # Split by " - " to get author and rest
     parts = clean_name.split(" - ", 1)
@@ -344,17 +416,15 @@ def parse_mam_folder_name(folder_name: str) -> ParsedFolderName:
         title = clean_name
 
         # Look for vol_XX or vol.XX pattern in title
-        vol_match = re.search(r"\bvol[_.]?\s*(\d+)\b", title, re.IGNORECASE)
+        vol_match = _VOL_PATTERN.search(title)
         if vol_match:
             series_position = vol_match.group(1)
             # Extract series name (everything before vol_XX pattern)
-            vol_pattern_match = re.search(
-                r"^(.+?)\s+(?:Vol\.?\s*\d+\s+)?vol[_.]?\s*\d+", title, re.IGNORECASE
-            )
+            vol_pattern_match = _VOL_SERIES_PATTERN.search(title)
             if vol_pattern_match:
                 series = vol_pattern_match.group(1).strip()
                 # Clean "Vol. X" from series name if present
-                series = re.sub(r"\s+Vol\.?\s*\d+\s*$", "", series, flags=re.IGNORECASE)
+                series = _TRAILING_VOL_PATTERN.sub("", series)
             else:
                 series = None
             is_standalone = False
@@ -383,11 +453,7 @@ def parse_mam_folder_name(folder_name: str) -> ParsedFolderName:
     rest = parts[1].strip()
 
     # Check for series pattern: "Series vol_XX - Title" or "Series #XX - Title"
-    series_match = re.match(
-        r"^(.+?)\s+(?:vol[_.]?|#)\s*(\d+(?:\.\d+)?)\s+-\s+(.+)$",
-        rest,
-        re.IGNORECASE,
-    )
+    series_match = _SERIES_PATTERN.match(rest)
 
     if series_match:
         series = series_match.group(1).strip()
@@ -452,6 +518,7 @@ def enrich_from_audnex(
 
     # Use the naming module's normalizer for consistent series extraction
     normalized = normalize_audnex_book(audnex_data)
+    updates: dict[str, Any] = {}
 
     # Extract author from Audnex - ALWAYS prefer Audnex author over parsed author
     # This handles Libation format where title/author are swapped ("Title - Author")
@@ -469,7 +536,7 @@ def enrich_from_audnex(
                     else ""
                 ),
             )
-            parsed.author = first_author
+            updates["author"] = first_author
 
     # Apply series info from normalized data
     # ALWAYS prefer Audnex series over parsed series - Audnex is authoritative
@@ -482,8 +549,8 @@ def enrich_from_audnex(
                 normalized.series_name,
                 f" (was: {parsed.series})" if parsed.series else "",
             )
-        parsed.series = normalized.series_name
-        parsed.is_standalone = False
+        updates["series"] = normalized.series_name
+        updates["is_standalone"] = False
 
     if normalized.series_position:
         if parsed.series_position != normalized.series_position:
@@ -492,7 +559,7 @@ def enrich_from_audnex(
                 normalized.series_position,
                 f" (was: {parsed.series_position})" if parsed.series_position else "",
             )
-        parsed.series_position = normalized.series_position
+        updates["series_position"] = normalized.series_position
 
     # Apply title from normalized data - ALWAYS prefer Audnex title
     # This handles Libation format where title/author are swapped
@@ -506,7 +573,7 @@ def enrich_from_audnex(
                 else ""
             ),
         )
-        parsed.title = normalized.display_title
+        updates["title"] = normalized.display_title
 
     # Extract year from release date if missing
     release_date = audnex_data.get("releaseDate")
@@ -514,10 +581,10 @@ def enrich_from_audnex(
         # Format: "2025-11-25T00:00:00.000Z" → "2025"
         year = release_date[:4] if len(release_date) >= 4 else None
         if year and year.isdigit():
-            parsed.year = year
+            updates["year"] = year
             logger.info("Enriched year from Audnex: %s", year)
 
-    return parsed, audnex_data, audnex_region
+    return replace(parsed, **updates), audnex_data, audnex_region
 
 
 # No path length limit for ABS imports (only applies to MAM uploads)
@@ -1160,22 +1227,12 @@ def _find_matching_series_folder(
     return None, cleaned_series
 
 
-def _same_filesystem(path1: Path, path2: Path) -> bool:
-    """Check if two paths are on the same filesystem.
-
-    Args:
-        path1: First path (must exist)
-        path2: Second path (must exist)
-
-    Returns:
-        True if same filesystem (same st_dev)
-    """
+def _safe_stat(path: Path) -> os.stat_result | None:
+    """Stat a path, returning None if it doesn't exist or can't be accessed."""
     try:
-        stat1 = path1.stat()
-        stat2 = path2.stat()
-        return stat1.st_dev == stat2.st_dev
+        return path.stat()
     except OSError:
-        return False
+        return None
 
 
 def validate_import_prerequisites(
@@ -1189,6 +1246,9 @@ def validate_import_prerequisites(
     2. Library root exists and is writable
     3. Both are on the same filesystem (for atomic moves)
 
+    Each path is stat'ed once and every check is derived from that result,
+    which keeps this cheap on network filesystems.
+
     Args:
         staging_root: Staging directory (seed_root)
         library_root: ABS library root
@@ -1197,26 +1257,28 @@ def validate_import_prerequisites(
         List of error messages (empty if all checks pass)
     """
     errors: list[str] = []
+    staging_stat = _safe_stat(staging_root)
+    library_stat = _safe_stat(library_root)
 
     # Check staging exists
-    if not staging_root.exists():
+    if staging_stat is None:
         errors.append(f"Staging directory does not exist: {staging_root}")
-    elif not staging_root.is_dir():
+    elif not stat.S_ISDIR(staging_stat.st_mode):
         errors.append(f"Staging path is not a directory: {staging_root}")
 
     # Check library root exists and is writable
-    if not library_root.exists():
+    if library_stat is None:
         errors.append(f"Library root does not exist: {library_root}")
-    elif not library_root.is_dir():
+    elif not stat.S_ISDIR(library_stat.st_mode):
         errors.append(f"Library path is not a directory: {library_root}")
     elif not os.access(library_root, os.W_OK):
         errors.append(f"Library root is not writable: {library_root}")
 
     # Check same filesystem (only if both exist)
     if (
-        staging_root.exists()
-        and library_root.exists()
-        and not _same_filesystem(staging_root, library_root)
+        staging_stat is not None
+        and library_stat is not None
+        and staging_stat.st_dev != library_stat.st_dev
     ):
         errors.append(
             f"Staging ({staging_root}) and library ({library_root}) "
@@ -1401,6 +1463,93 @@ def _handle_duplicate(
         )
 
 
+def _move_to_trash(path: Path, library_root: Path) -> Path:
+    """Rename path into the library's trash folder.
+
+    The trash folder lives inside library_root, so this is a same-filesystem
+    rename regardless of how large the folder is.
+
+    Returns:
+        New location of the folder inside the trash
+
+    Raises:
+        OSError: If the trash folder can't be created or the rename fails
+    """
+    trash_dir = library_root / TRASH_DIR_NAME
+    trash_dir.mkdir(exist_ok=True)
+    trash_path = trash_dir / uuid.uuid4().hex
+    os.rename(path, trash_path)
+    return trash_path
+
+
+def _purge_trash(trash_path: Path) -> None:
+    """Delete a trashed folder or file (runs on _TRASH_EXECUTOR)."""
+    try:
+        if trash_path.is_dir() and not trash_path.is_symlink():
+            shutil.rmtree(trash_path)
+        else:
+            # Overwrite can also trash a stray file that sat at the target path
+            trash_path.unlink()
+        logger.debug("Purged trashed folder: %s", trash_path)
+    except OSError as e:
+        logger.warning("Failed to purge trashed folder %s: %s", trash_path, e)
+    finally:
+        with _trash_pending_lock:
+            _trash_pending.discard(trash_path)
+
+
+def _queue_purge(trash_path: Path) -> None:
+    """Delete a trash entry in the background."""
+    with _trash_pending_lock:
+        _trash_pending.add(trash_path)
+    _TRASH_EXECUTOR.submit(_purge_trash, trash_path)
+
+
+def _sweep_trash(library_root: Path) -> int:
+    """Queue deletion of trash left behind by earlier runs.
+
+    A run that crashed, or exited before the background deletes finished,
+    leaves entries in the library's trash folder that nothing else removes.
+
+    Returns:
+        Number of leftover entries queued for deletion
+    """
+    trash_dir = library_root / TRASH_DIR_NAME
+    try:
+        with os.scandir(trash_dir) as entries:
+            found = [Path(entry.path) for entry in entries]
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning("Failed to scan trash folder %s: %s", trash_dir, e)
+        return 0
+
+    with _trash_pending_lock:
+        leftovers = [path for path in found if path not in _trash_pending]
+    for path in leftovers:
+        _queue_purge(path)
+    if leftovers:
+        logger.info("Purging %d leftover trashed folder(s) in %s", len(leftovers), trash_dir)
+    return len(leftovers)
+
+
+def _target_exists_result(
+    staging_folder: Path,
+    target_path: Path,
+    asin: str,
+    parsed: ParsedFolderName,
+) -> ImportResult:
+    """Build the duplicate result for a target folder that already exists on disk."""
+    return ImportResult(
+        staging_path=staging_folder,
+        target_path=target_path,
+        asin=asin,
+        status="duplicate",
+        error=f"Target path already exists: {target_path}",
+        parsed=parsed,
+    )
+
+
 def import_single(
     staging_folder: Path,
     library_root: Path,
@@ -1476,7 +1625,7 @@ def import_single(
             asin = resolution.asin
             # Update parsed object so downstream functions (build_target_path, rename_files)
             # have access to the resolved ASIN for naming
-            parsed.asin = asin
+            parsed = replace(parsed, asin=asin)
             logger.info(
                 "Resolved ASIN %s from %s (%s)",
                 asin,
@@ -1500,11 +1649,11 @@ def import_single(
         )
         if resolution.found:
             asin = resolution.asin
-            parsed.asin = asin
+            parsed = replace(parsed, asin=asin)
             # Update author from search result if we don't have one
             # (e.g., Libation folder without author in name)
             if resolution.resolved_author and (not parsed.author or parsed.author == "Unknown"):
-                parsed.author = resolution.resolved_author
+                parsed = replace(parsed, author=resolution.resolved_author)
                 logger.debug("Updated author from ABS search: %s", resolution.resolved_author)
             logger.info(
                 "Resolved ASIN %s from %s (%s)",
@@ -1674,7 +1823,7 @@ def import_single(
             # Update ASIN to the normalized (preferred region) version
             old_asin = asin
             asin = norm_result.normalized_asin
-            parsed.asin = asin
+            parsed = replace(parsed, asin=asin)
             logger.info(
                 "Using normalized ASIN %s (was %s from %s region)",
                 asin,
@@ -1700,33 +1849,11 @@ def import_single(
     # Build target path (preserves nested structure if present)
     target_path = build_target_path(library_root, parsed, staging_folder, staging_root)
 
-    # Check if target already exists on disk
-    if target_path.exists():
-        if duplicate_policy == "overwrite":
-            if not dry_run:
-                import shutil
-
-                try:
-                    shutil.rmtree(target_path)
-                    logger.info("Removed existing target: %s", target_path)
-                except Exception as e:
-                    logger.error("Failed to remove existing target %s: %s", target_path, e)
-                    return ImportResult(
-                        staging_path=staging_folder,
-                        target_path=target_path,
-                        asin=asin,
-                        status="failed",
-                        error=f"Failed to remove existing target: {e}",
-                    )
-        else:
-            return ImportResult(
-                staging_path=staging_folder,
-                target_path=target_path,
-                asin=asin,
-                status="duplicate",
-                error=f"Target path already exists: {target_path}",
-                parsed=parsed,
-            )
+    # Check for an existing target before touching the staging folder, so a
+    # duplicate is left in staging untouched (an empty target dir or a stray
+    # file both count). Overwrite is handled at the rename below.
+    if duplicate_policy != "overwrite" and target_path.exists():
+        return _target_exists_result(staging_folder, target_path, asin, parsed)
 
     # Remove ignored files before moving (e.g., .metadata.json)
     if ignore_patterns:
@@ -1779,16 +1906,50 @@ def import_single(
 
     # Atomic move (rename) - preserves hardlinks
     try:
-        staging_folder.rename(target_path)
-        logger.info("Moved: %s → %s", staging_folder.name, target_path)
+        os.rename(staging_folder, target_path)
     except OSError as e:
-        return ImportResult(
-            staging_path=staging_folder,
-            target_path=target_path,
-            asin=asin,
-            status="failed",
-            error=f"Move failed: {e}",
-        )
+        # Anything other than an existing target (non-empty directory, or a
+        # file where the directory should go) is a real failure
+        if e.errno not in (errno.EEXIST, errno.ENOTEMPTY, errno.ENOTDIR):
+            return ImportResult(
+                staging_path=staging_folder,
+                target_path=target_path,
+                asin=asin,
+                status="failed",
+                error=f"Move failed: {e}",
+            )
+        if duplicate_policy != "overwrite":
+            return _target_exists_result(staging_folder, target_path, asin, parsed)
+
+        # Move the existing target aside (instant rename) rather than deleting
+        # it inline; the actual delete happens in the background
+        try:
+            trash_path = _move_to_trash(target_path, library_root)
+        except OSError as e:
+            logger.error("Failed to remove existing target %s: %s", target_path, e)
+            return ImportResult(
+                staging_path=staging_folder,
+                target_path=target_path,
+                asin=asin,
+                status="failed",
+                error=f"Failed to remove existing target: {e}",
+            )
+        try:
+            os.rename(staging_folder, target_path)
+        except OSError as e:
+            # Put the previous version back so the library isn't left without it
+            with contextlib.suppress(OSError):
+                os.rename(trash_path, target_path)
+            return ImportResult(
+                staging_path=staging_folder,
+                target_path=target_path,
+                asin=asin,
+                status="failed",
+                error=f"Move failed: {e}",
+            )
+        logger.info("Removed existing target: %s", target_path)
+        _queue_purge(trash_path)
+    logger.info("Moved: %s → %s", staging_folder.name, target_path)
 
     # Rename files to match clean MAM naming convention
     rename_files_in_folder(target_path, parsed)
@@ -1949,6 +2110,9 @@ def import_batch(
     batch_result = BatchImportResult()
     total = len(staging_folders)
 
+    if not dry_run:
+        _sweep_trash(library_root)
+
     for i, folder in enumerate(staging_folders):
         # Call progress callback before processing each folder
         if progress_callback:
@@ -2006,6 +2170,25 @@ def trigger_scan_safe(client: AbsClient, library_id: str) -> bool:
         return False
 
 
+def _has_audio_files(directory: str) -> bool:
+    """Check if directory directly contains audio files.
+
+    Stops scanning at the first audio file found. Like Path.suffix, a bare
+    dotfile such as ``.mp3`` has no extension and doesn't count: the last
+    dot must not be the first character of the name.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(
+                child.name.lower().endswith(_AUDIO_SUFFIXES)
+                and child.name.rfind(".") > 0
+                and child.is_file()
+                for child in entries
+            )
+    except PermissionError:
+        return False
+
+
 def discover_staged_books(staging_root: Path, *, recursive: bool = True) -> list[Path]:
     """Discover audiobook folders in staging directory.
 
@@ -2025,34 +2208,25 @@ def discover_staged_books(staging_root: Path, *, recursive: bool = True) -> list
 
     staged: list[Path] = []
 
-    # Audio extensions to look for
-    audio_exts = {".m4b", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".wav"}
-
-    def has_audio_files(directory: Path) -> bool:
-        """Check if directory directly contains audio files."""
-        try:
-            for child in directory.iterdir():
-                if child.is_file() and child.suffix.lower() in audio_exts:
-                    return True
-        except PermissionError:
-            pass
-        return False
-
-    def search_directory(directory: Path) -> None:
+    # os.scandir() DirEntry objects cache the file type from readdir, so
+    # is_dir() doesn't need an extra stat per entry
+    def search_directory(directory: str | Path) -> None:
         """Recursively search for audiobook folders."""
         try:
-            for item in directory.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # If this directory has audio files, it's an audiobook folder
-                if has_audio_files(item):
-                    staged.append(item)
-                elif recursive:
-                    # Otherwise, search deeper
-                    search_directory(item)
+            with os.scandir(directory) as entries:
+                for item in entries:
+                    if not item.is_dir():
+                        continue
+
+                    # If this directory has audio files, it's an audiobook folder
+                    if _has_audio_files(item.path):
+                        staged.append(Path(item.path))
+                    elif recursive:
+                        # Otherwise, search deeper
+                        search_directory(item.path)
         except PermissionError:
             pass
 
     search_directory(staging_root)
-    return sorted(staged)
+    # Plain string keys compare much faster than Path objects
+    return sorted(staged, key=os.fspath)
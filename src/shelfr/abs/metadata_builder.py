@@ -6,7 +6,6 @@ by Audiobookshelf's metadata.json for library imports.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import tempfile
@@ -226,16 +225,17 @@ def write_abs_metadata_json(
     result: Path | None = None
     temp_path: str | None = None
     try:
-        # Serialize using Pydantic's model_dump with by_alias for camelCase
-        json_data = metadata.model_dump(
+        # Serialize in Pydantic's compiled core (no intermediate dict), by_alias for camelCase
+        payload = metadata.model_dump_json(
             by_alias=True,
             exclude_none=True,  # Don't include null fields
-        )
+            indent=2,
+        ).encode()
 
         # Write to a temporary file in the same directory and fsync to ensure durability
-        with tempfile.NamedTemporaryFile("w", dir=dst_folder, delete=False, encoding="utf-8") as tf:
+        with tempfile.NamedTemporaryFile("wb", dir=dst_folder, delete=False) as tf:
             temp_path = tf.name
-            tf.write(json.dumps(json_data, indent=2, ensure_ascii=False))
+            tf.write(payload)
             tf.flush()
             try:
                 os.fsync(tf.fileno())
@@ -34,6 +34,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Trailing ASIN markers ({ASIN.xxx}, [ASIN.xxx], [B0xxx]) stripped in one pass;
+# stacked markers are all removed, in any order
+_TRAILING_ASIN_PATTERN = re.compile(
+    r"(?:\s*(?:\{ASIN\.[A-Z0-9]+\}|\[ASIN\.[A-Z0-9]+\]|\[B0[A-Z0-9]{8,9}\]))+\s*$"
+)
+_TRAILING_BRACKET_TAG_PATTERN = re.compile(r"\[([^\]]+)\]\s*$")
+_TRAILING_BRACE_TAG_PATTERN = re.compile(r"\{([^}]+)\}\s*$")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Enums
@@ -336,14 +344,12 @@ def _extract_ripper_tag(folder_name: str) -> str | None:
         Ripper tag without brackets, or None if not found
     """
     # Try bracket format first [Tag] - must be at end, after stripping ASIN markers
-    clean_name = re.sub(r"\s*\{ASIN\.[A-Z0-9]+\}\s*$", "", folder_name)
-    clean_name = re.sub(r"\s*\[ASIN\.[A-Z0-9]+\]\s*$", "", clean_name)
-    clean_name = re.sub(r"\s*\[B0[A-Z0-9]{8,9}\]\s*$", "", clean_name)
+    clean_name = _TRAILING_ASIN_PATTERN.sub("", folder_name)
 
     # Look for ripper tag at end - brackets or braces
-    match = re.search(r"\[([^\]]+)\]\s*$", clean_name)
+    match = _TRAILING_BRACKET_TAG_PATTERN.search(clean_name)
     if not match:
-        match = re.search(r"\{([^}]+)\}\s*$", clean_name)
+        match = _TRAILING_BRACE_TAG_PATTERN.search(clean_name)
 
     return match.group(1) if match else None
 
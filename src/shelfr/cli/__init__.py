@@ -17,7 +17,9 @@ to internal workflow - use `shelfr run` for full pipeline.
 
 from __future__ import annotations
 
+import importlib
 import sys
+from typing import Any
 
 # Re-export key components for backward compatibility
 from shelfr.cli._app import (
@@ -96,7 +98,7 @@ register_core_commands(app)
 register_diagnostics_commands(app)
 register_state_commands(state_app)
 register_abs_commands(abs_app)  # Register on sub-app now
-register_abs_deprecated_aliases(app)  # Deprecated aliases on main app
+register_abs_deprecated_aliases(app, abs_app)  # Deprecated aliases on main app
 register_libation_commands(libation_app)
 register_tools_commands(tools_app)
 register_mam_commands(mam_app)
@@ -153,19 +155,29 @@ def main() -> int:
 # Backwards-Compatible Exports
 # =============================================================================
 
-# Re-export argparse parser for tests
-from shelfr.cli_argparse import build_parser  # noqa: E402
-
-# Re-export ABS command handlers for external callers
-from shelfr.commands.abs import (  # noqa: E402
-    cmd_abs_check_duplicate,
-    cmd_abs_cleanup,
-    cmd_abs_import,
-    cmd_abs_init,
-    cmd_abs_resolve_asins,
-    cmd_abs_restore,
-    cmd_abs_trump_check,
-)
+# These pull in the argparse CLI and every command module, so they are
+# resolved lazily on first attribute access instead of on every invocation.
+_LAZY_EXPORTS = {
+    "build_parser": "shelfr.cli_argparse",
+    "cmd_abs_check_duplicate": "shelfr.commands.abs",
+    "cmd_abs_cleanup": "shelfr.commands.abs",
+    "cmd_abs_import": "shelfr.commands.abs",
+    "cmd_abs_init": "shelfr.commands.abs",
+    "cmd_abs_resolve_asins": "shelfr.commands.abs",
+    "cmd_abs_restore": "shelfr.commands.abs",
+    "cmd_abs_trump_check": "shelfr.commands.abs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve backwards-compatible exports on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # App instances
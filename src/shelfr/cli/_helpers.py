@@ -9,10 +9,48 @@ NOTE: This is deprecated. New commands should use RuntimeContext from ctx.obj.
 from __future__ import annotations
 
 import argparse
+import functools
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import typer
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
+
+
+@functools.cache
+def cached_option(*param_decls: Any, **kwargs: Any) -> Any:
+    """Return a shared ``typer.Option`` for identical declarations.
+
+    Typer copies parameter info before mutating it, so one instance can back
+    every command that declares the same option (e.g. the deprecated abs-*
+    aliases that mirror the abs sub-app).
+    """
+    return typer.Option(*param_decls, **kwargs)
+
+
+@functools.cache
+def cached_argument(*param_decls: Any, **kwargs: Any) -> Any:
+    """Return a shared ``typer.Argument`` for identical declarations."""
+    return typer.Argument(*param_decls, **kwargs)
+
+
+@functools.cache
+def misplaced_dry_run_message(command: str) -> Text:
+    """Return the parsed warning shown when --dry-run follows the subcommand.
+
+    Args:
+        command: Subcommand as typed after "shelfr" (e.g. "tools prepare")
+    """
+    # Highlight once here, as console.print() would for a plain markup string
+    return ReprHighlighter()(
+        Text.from_markup(
+            "[yellow]--dry-run must come BEFORE the subcommand:[/]\n\n"
+            f"    [green]shelfr --dry-run {command}[/]  [OK]\n"
+            f"    [red]shelfr {command} --dry-run[/]  [X]\n"
+        )
+    )
 
 
 class ArgsNamespace(argparse.Namespace):
@@ -20,10 +58,11 @@ class ArgsNamespace(argparse.Namespace):
 
     DEPRECATED: New commands should use RuntimeContext from ctx.obj instead.
     This exists only for backward compatibility with existing handlers.
-    """
 
-    def __init__(self, **kwargs: object) -> None:
-        super().__init__(**kwargs)
+    Kept as an argparse.Namespace subclass (rather than a __slots__ class)
+    because handlers are typed against argparse.Namespace and some copy it
+    via ``vars(args)``. Namespace's own __init__ is inherited unchanged.
+    """
 
 
 def get_args(ctx: typer.Context, **kwargs: Any) -> ArgsNamespace:
@@ -49,3 +88,28 @@ def get_args(ctx: typer.Context, **kwargs: Any) -> ArgsNamespace:
         **kwargs,
     )
     return args
+
+
+def make_args_builder(
+    command: str, *, enum_fields: tuple[str, ...] = ()
+) -> Callable[..., ArgsNamespace]:
+    """Create a get_args wrapper bound to a single command.
+
+    The command name and the set of Enum-valued options are fixed once at
+    registration time, so each invocation only passes the parsed values.
+
+    Args:
+        command: Command name stored on the namespace (e.g. "abs import")
+        enum_fields: Options holding Enum members; their ``.value`` is
+            stored instead (unset options are stored as None)
+
+    Returns:
+        Callable taking (ctx, **kwargs) and returning an ArgsNamespace
+    """
+
+    def build(ctx: typer.Context, **kwargs: Any) -> ArgsNamespace:
+        for name in enum_fields:
+            kwargs[name] = getattr(kwargs.get(name), "value", None)
+        return get_args(ctx, command=command, **kwargs)
+
+    return build
@@ -9,8 +9,11 @@ Deprecated aliases (hidden): abs-init, abs-import, abs-check-duplicate, abs-trum
 
 from __future__ import annotations
 
+import copy
+import functools
+from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 
@@ -20,9 +23,22 @@ from shelfr.cli._app import (
     DuplicatePolicy,
     TrumpAggressiveness,
 )
-from shelfr.cli._helpers import get_args
+from shelfr.cli._helpers import cached_argument, cached_option, make_args_builder
 from shelfr.console import console
 
+# Per-command argument builders, shared by the sub-app and deprecated aliases.
+_abs_init_args = make_args_builder("abs init")
+_abs_import_args = make_args_builder(
+    "abs import", enum_fields=("cleanup_strategy", "duplicate_policy", "trump_aggressiveness")
+)
+_abs_check_asin_args = make_args_builder("abs check-asin")
+_abs_trump_preview_args = make_args_builder("abs trump-preview")
+_abs_restore_args = make_args_builder("abs restore")
+_abs_cleanup_args = make_args_builder("abs cleanup", enum_fields=("strategy",))
+_abs_rename_args = make_args_builder("abs rename")
+_abs_orphans_args = make_args_builder("abs orphans")
+_abs_resolve_asins_args = make_args_builder("abs resolve-asins")
+
 
 def _deprecation_warning(old_cmd: str, new_cmd: str) -> None:
     """Print deprecation warning for old command name."""
@@ -63,64 +79,64 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_init
 
-        args = get_args(ctx, command="abs init")
+        args = _abs_init_args(ctx)
         result = cmd_abs_init(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("import")
     def abs_import(
         ctx: typer.Context,
         paths: Annotated[
             list[Path] | None,
-            typer.Argument(help="Specific folder(s) to import."),
+            cached_argument(help="Specific folder(s) to import."),
         ] = None,
         duplicate_policy: Annotated[
             DuplicatePolicy | None,
-            typer.Option("-d", "--duplicate-policy", help="Duplicate handling policy."),
+            cached_option("-d", "--duplicate-policy", help="Duplicate handling policy."),
         ] = None,
         no_scan: Annotated[
             bool,
-            typer.Option("--no-scan", help="Don't trigger ABS library scan after import."),
+            cached_option("--no-scan", help="Don't trigger ABS library scan after import."),
         ] = False,
         no_abs_search: Annotated[
             bool,
-            typer.Option("--no-abs-search", help="Disable ABS metadata search for missing ASINs."),
+            cached_option("--no-abs-search", help="Disable ABS metadata search for missing ASINs."),
         ] = False,
         confidence: Annotated[
             float | None,
-            typer.Option(help="Minimum confidence (0.0-1.0) for ABS search matches."),
+            cached_option(help="Minimum confidence (0.0-1.0) for ABS search matches."),
         ] = None,
         no_trump: Annotated[
             bool,
-            typer.Option("--no-trump", help="Disable trumping for this run."),
+            cached_option("--no-trump", help="Disable trumping for this run."),
         ] = False,
         trump_aggressiveness: Annotated[
             TrumpAggressiveness | None,
-            typer.Option(help="Override trumping aggressiveness."),
+            cached_option(help="Override trumping aggressiveness."),
         ] = None,
         cleanup_strategy: Annotated[
             CleanupStrategy | None,
-            typer.Option(help="Override cleanup strategy."),
+            cached_option(help="Override cleanup strategy."),
         ] = None,
         cleanup_path: Annotated[
             Path | None,
-            typer.Option(help="Override cleanup path for 'move' strategy."),
+            cached_option(help="Override cleanup path for 'move' strategy."),
         ] = None,
         no_cleanup: Annotated[
             bool,
-            typer.Option("--no-cleanup", help="Disable post-import cleanup."),
+            cached_option("--no-cleanup", help="Disable post-import cleanup."),
         ] = False,
         no_metadata: Annotated[
             bool,
-            typer.Option("--no-metadata", help="Disable metadata.json generation."),
+            cached_option("--no-metadata", help="Disable metadata.json generation."),
         ] = False,
         opf: Annotated[
             bool,
-            typer.Option("--opf", help="Enable metadata.opf sidecar generation."),
+            cached_option("--opf", help="Enable metadata.opf sidecar generation."),
         ] = False,
         no_opf: Annotated[
             bool,
-            typer.Option("--no-opf", help="Disable metadata.opf sidecar generation."),
+            cached_option("--no-opf", help="Disable metadata.opf sidecar generation."),
         ] = False,
     ) -> None:
         """Import staged audiobooks to Audiobookshelf.
@@ -134,30 +150,29 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_import
 
-        args = get_args(
+        args = _abs_import_args(
             ctx,
             paths=paths or [],
-            duplicate_policy=duplicate_policy.value if duplicate_policy else None,
+            duplicate_policy=duplicate_policy,
             no_scan=no_scan,
             no_abs_search=no_abs_search,
             confidence=confidence,
             no_trump=no_trump,
-            trump_aggressiveness=trump_aggressiveness.value if trump_aggressiveness else None,
-            cleanup_strategy=cleanup_strategy.value if cleanup_strategy else None,
+            trump_aggressiveness=trump_aggressiveness,
+            cleanup_strategy=cleanup_strategy,
             cleanup_path=cleanup_path,
             no_cleanup=no_cleanup,
             no_metadata=no_metadata,
             opf=True if opf else (False if no_opf else None),
-            command="abs import",
         )
         result = cmd_abs_import(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("check-asin")
     def abs_check_asin(
         ctx: typer.Context,
         asin: Annotated[
-            str, typer.Argument(metavar="ASIN", help="ASIN to check (e.g., B0DK27WWT8).")
+            str, cached_argument(metavar="ASIN", help="ASIN to check (e.g., B0DK27WWT8).")
         ],
     ) -> None:
         """Check if ASIN exists in library.
@@ -169,20 +184,20 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_check_duplicate
 
-        args = get_args(ctx, asin=asin, command="abs check-asin")
+        args = _abs_check_asin_args(ctx, asin=asin)
         result = cmd_abs_check_duplicate(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("trump-preview")
     def abs_trump_preview(
         ctx: typer.Context,
         paths: Annotated[
             list[Path] | None,
-            typer.Argument(help="Specific folder(s) to check."),
+            cached_argument(help="Specific folder(s) to check."),
         ] = None,
         detailed: Annotated[
             bool,
-            typer.Option("--detailed", help="Show detailed quality comparison tables."),
+            cached_option("--detailed", help="Show detailed quality comparison tables."),
         ] = False,
     ) -> None:
         """Preview trumping decisions for staged folders.
@@ -191,21 +206,21 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_trump_check
 
-        args = get_args(ctx, paths=paths or [], detailed=detailed, command="abs trump-preview")
+        args = _abs_trump_preview_args(ctx, paths=paths or [], detailed=detailed)
         result = cmd_abs_trump_check(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("restore")
     def abs_restore(
         ctx: typer.Context,
         archive_path: Annotated[
             Path | None,
-            typer.Argument(help="Specific archive folder to restore."),
+            cached_argument(help="Specific archive folder to restore."),
         ] = None,
         asin: AsinArg = None,
         list_archives: Annotated[
             bool,
-            typer.Option("--list", help="List available archives without restoring."),
+            cached_option("--list", help="List available archives without restoring."),
         ] = False,
     ) -> None:
         """Restore archived books to library.
@@ -219,41 +234,40 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_restore
 
-        args = get_args(
+        args = _abs_restore_args(
             ctx,
             archive_path=archive_path,
             asin=asin,
             list=list_archives,
-            command="abs restore",
         )
         result = cmd_abs_restore(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("cleanup")
     def abs_cleanup(
         ctx: typer.Context,
         paths: Annotated[
             list[Path] | None,
-            typer.Argument(help="Specific folder(s) to cleanup."),
+            cached_argument(help="Specific folder(s) to cleanup."),
         ] = None,
         strategy: Annotated[
             CleanupStrategy | None,
-            typer.Option(help="Cleanup strategy."),
+            cached_option(help="Cleanup strategy."),
         ] = None,
         cleanup_path: Annotated[
             Path | None,
-            typer.Option(help="Destination for 'move' strategy."),
+            cached_option(help="Destination for 'move' strategy."),
         ] = None,
         no_verify_seed: Annotated[
             bool,
-            typer.Option(
+            cached_option(
                 "--no-verify-seed",
                 help=("[red]DANGEROUS:[/] Skip seed hardlink verification."),
             ),
         ] = False,
         min_age_days: Annotated[
             int | None,
-            typer.Option(help="Only cleanup sources older than N days."),
+            cached_option(help="Only cleanup sources older than N days."),
         ] = None,
     ) -> None:
         """Cleanup Libation source files after import.
@@ -263,52 +277,51 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_cleanup
 
-        args = get_args(
+        args = _abs_cleanup_args(
             ctx,
             paths=paths or [],
-            strategy=strategy.value if strategy else None,
+            strategy=strategy,
             cleanup_path=cleanup_path,
             no_verify_seed=no_verify_seed,
             min_age_days=min_age_days,
-            command="abs cleanup",
         )
         result = cmd_abs_cleanup(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("rename")
     def abs_rename(
         ctx: typer.Context,
         source: Annotated[
             Path | None,
-            typer.Option(help="Directory to scan (default: ABS library from config)."),
+            cached_option(help="Directory to scan (default: ABS library from config)."),
         ] = None,
         pattern: Annotated[
             str,
-            typer.Option(help="Glob pattern to filter folders."),
+            cached_option(help="Glob pattern to filter folders."),
         ] = "*",
         fetch_metadata: Annotated[
             bool,
-            typer.Option("--fetch-metadata", help="Fetch missing metadata from Audnex API."),
+            cached_option("--fetch-metadata", help="Fetch missing metadata from Audnex API."),
         ] = False,
         abs_search: Annotated[
             bool,
-            typer.Option("--abs-search", help="Use ABS Audible search for ASIN resolution."),
+            cached_option("--abs-search", help="Use ABS Audible search for ASIN resolution."),
         ] = False,
         abs_search_confidence: Annotated[
             float,
-            typer.Option(help="Minimum confidence for ABS search matches."),
+            cached_option(help="Minimum confidence for ABS search matches."),
         ] = 0.75,
         interactive: Annotated[
             bool,
-            typer.Option("--interactive", help="Prompt for confirmation on each rename."),
+            cached_option("--interactive", help="Prompt for confirmation on each rename."),
         ] = False,
         force: Annotated[
             bool,
-            typer.Option("--force", help="Rename files even when folder names are correct."),
+            cached_option("--force", help="Rename files even when folder names are correct."),
         ] = False,
         report: Annotated[
             Path | None,
-            typer.Option(help="Output JSON report of changes to file."),
+            cached_option(help="Output JSON report of changes to file."),
         ] = None,
     ) -> None:
         """Rename folders to match MAM naming schema.
@@ -318,7 +331,7 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_rename
 
-        args = get_args(
+        args = _abs_rename_args(
             ctx,
             source=source,
             pattern=pattern,
@@ -328,37 +341,38 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
             interactive=interactive,
             force=force,
             report=report,
-            command="abs rename",
         )
         result = cmd_abs_rename(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("orphans")
     def abs_orphans(
         ctx: typer.Context,
         source: Annotated[
             Path | None,
-            typer.Option(help="Directory to scan (default: ABS library from config)."),
+            cached_option(help="Directory to scan (default: ABS library from config)."),
         ] = None,
         cleanup: Annotated[
             bool,
-            typer.Option("--cleanup", help="Remove orphaned folders (with matching audio folder)."),
+            cached_option(
+                "--cleanup", help="Remove orphaned folders (with matching audio folder)."
+            ),
         ] = False,
         cleanup_all: Annotated[
             bool,
-            typer.Option("--cleanup-all", help="[red]DANGEROUS:[/] Remove ALL orphaned folders."),
+            cached_option("--cleanup-all", help="[red]DANGEROUS:[/] Remove ALL orphaned folders."),
         ] = False,
         yes: Annotated[
             bool,
-            typer.Option("--yes", "-y", help="Skip confirmation prompt for --cleanup-all."),
+            cached_option("--yes", "-y", help="Skip confirmation prompt for --cleanup-all."),
         ] = False,
         min_match_score: Annotated[
             float,
-            typer.Option(help="Minimum similarity score to consider a match."),
+            cached_option(help="Minimum similarity score to consider a match."),
         ] = 0.5,
         report: Annotated[
             Path | None,
-            typer.Option(help="Output JSON report of orphaned folders."),
+            cached_option(help="Output JSON report of orphaned folders."),
         ] = None,
     ) -> None:
         """Find and clean up orphaned folders.
@@ -368,7 +382,7 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_orphans
 
-        args = get_args(
+        args = _abs_orphans_args(
             ctx,
             source=source,
             cleanup=cleanup,
@@ -376,25 +390,24 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
             yes=yes,
             min_match_score=min_match_score,
             report=report,
-            command="abs orphans",
         )
         result = cmd_abs_orphans(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @abs_app.command("resolve-asins")
     def abs_resolve_asins(
         ctx: typer.Context,
         path: Annotated[
             Path | None,
-            typer.Option(help="Specific folder to resolve (default: scan Unknown/)."),
+            cached_option(help="Specific folder to resolve (default: scan Unknown/)."),
         ] = None,
         confidence: Annotated[
             float,
-            typer.Option(help="Minimum confidence threshold (0-1)."),
+            cached_option(help="Minimum confidence threshold (0-1)."),
         ] = 0.75,
         write_sidecar: Annotated[
             bool,
-            typer.Option("--write-sidecar", help="Write resolved ASINs to sidecar JSON files."),
+            cached_option("--write-sidecar", help="Write resolved ASINs to sidecar JSON files."),
         ] = False,
     ) -> None:
         """Resolve ASINs for Unknown/ books via ABS search.
@@ -403,350 +416,68 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
         """
         from shelfr.commands import cmd_abs_resolve_asins
 
-        args = get_args(
+        args = _abs_resolve_asins_args(
             ctx,
             path=path,
             confidence=confidence,
             write_sidecar=write_sidecar,
-            command="abs resolve-asins",
         )
         result = cmd_abs_resolve_asins(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
+
+
+# Deprecated top-level name -> abs sub-app command it forwards to.
+_DEPRECATED_ALIASES: tuple[tuple[str, str], ...] = (
+    ("abs-init", "init"),
+    ("abs-import", "import"),
+    ("abs-check-duplicate", "check-asin"),
+    ("abs-trump-check", "trump-preview"),
+    ("abs-restore", "restore"),
+    ("abs-cleanup", "cleanup"),
+    ("abs-rename", "rename"),
+    ("abs-orphans", "orphans"),
+    ("abs-resolve-asins", "resolve-asins"),
+)
 
 
-def register_abs_deprecated_aliases(app: typer.Typer) -> None:
-    """Register deprecated abs-* aliases on the main app for backward compatibility.
+def _make_deprecated_alias(
+    old_cmd: str, new_cmd: str, target: Callable[..., None]
+) -> Callable[..., None]:
+    """Wrap a sub-app command so it warns before running.
 
-    These hidden commands print a deprecation warning and call the actual command.
+    functools.wraps exposes the target's signature, so Typer builds the
+    alias with exactly the same options as the sub-app command.
     """
 
-    @app.command("abs-init", hidden=True)
-    def abs_init_deprecated(ctx: typer.Context) -> None:
-        """[deprecated] Use 'abs init' instead."""
-        _deprecation_warning("abs-init", "abs init")
-        from shelfr.commands import cmd_abs_init
-
-        args = get_args(ctx, command="abs init")
-        result = cmd_abs_init(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-import", hidden=True)
-    def abs_import_deprecated(
-        ctx: typer.Context,
-        paths: Annotated[
-            list[Path] | None,
-            typer.Argument(help="Specific folder(s) to import."),
-        ] = None,
-        duplicate_policy: Annotated[
-            DuplicatePolicy | None,
-            typer.Option("-d", "--duplicate-policy", help="Duplicate handling policy."),
-        ] = None,
-        no_scan: Annotated[
-            bool,
-            typer.Option("--no-scan", help="Don't trigger ABS library scan after import."),
-        ] = False,
-        no_abs_search: Annotated[
-            bool,
-            typer.Option("--no-abs-search", help="Disable ABS metadata search for missing ASINs."),
-        ] = False,
-        confidence: Annotated[
-            float | None,
-            typer.Option(help="Minimum confidence (0.0-1.0) for ABS search matches."),
-        ] = None,
-        no_trump: Annotated[
-            bool,
-            typer.Option("--no-trump", help="Disable trumping for this run."),
-        ] = False,
-        trump_aggressiveness: Annotated[
-            TrumpAggressiveness | None,
-            typer.Option(help="Override trumping aggressiveness."),
-        ] = None,
-        cleanup_strategy: Annotated[
-            CleanupStrategy | None,
-            typer.Option(help="Override cleanup strategy."),
-        ] = None,
-        cleanup_path: Annotated[
-            Path | None,
-            typer.Option(help="Override cleanup path for 'move' strategy."),
-        ] = None,
-        no_cleanup: Annotated[
-            bool,
-            typer.Option("--no-cleanup", help="Disable post-import cleanup."),
-        ] = False,
-        no_metadata: Annotated[
-            bool,
-            typer.Option("--no-metadata", help="Disable metadata.json generation."),
-        ] = False,
-    ) -> None:
-        """[deprecated] Use 'abs import' instead."""
-        _deprecation_warning("abs-import", "abs import")
-        from shelfr.commands import cmd_abs_import
-
-        args = get_args(
-            ctx,
-            paths=paths or [],
-            duplicate_policy=duplicate_policy.value if duplicate_policy else None,
-            no_scan=no_scan,
-            no_abs_search=no_abs_search,
-            confidence=confidence,
-            no_trump=no_trump,
-            trump_aggressiveness=trump_aggressiveness.value if trump_aggressiveness else None,
-            cleanup_strategy=cleanup_strategy.value if cleanup_strategy else None,
-            cleanup_path=cleanup_path,
-            no_cleanup=no_cleanup,
-            no_metadata=no_metadata,
-            command="abs import",
-        )
-        result = cmd_abs_import(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-check-duplicate", hidden=True)
-    def abs_check_duplicate_deprecated(
-        ctx: typer.Context,
-        asin: Annotated[
-            str, typer.Argument(metavar="ASIN", help="ASIN to check (e.g., B0DK27WWT8).")
-        ],
-    ) -> None:
-        """[deprecated] Use 'abs check-asin' instead."""
-        _deprecation_warning("abs-check-duplicate", "abs check-asin")
-        from shelfr.commands import cmd_abs_check_duplicate
-
-        args = get_args(ctx, asin=asin, command="abs check-asin")
-        result = cmd_abs_check_duplicate(args)
-        raise typer.Exit(result)
-
-    # Also keep abs-dup as a deprecated alias
-    @app.command("abs-dup", hidden=True)
-    def abs_dup_deprecated(
-        ctx: typer.Context,
-        asin: Annotated[
-            str, typer.Argument(metavar="ASIN", help="ASIN to check (e.g., B0DK27WWT8).")
-        ],
-    ) -> None:
-        """[deprecated] Use 'abs check-asin' instead."""
-        _deprecation_warning("abs-dup", "abs check-asin")
-        from shelfr.commands import cmd_abs_check_duplicate
-
-        args = get_args(ctx, asin=asin, command="abs check-asin")
-        result = cmd_abs_check_duplicate(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-trump-check", hidden=True)
-    def abs_trump_check_deprecated(
-        ctx: typer.Context,
-        paths: Annotated[
-            list[Path] | None,
-            typer.Argument(help="Specific folder(s) to check."),
-        ] = None,
-        detailed: Annotated[
-            bool,
-            typer.Option("--detailed", help="Show detailed quality comparison tables."),
-        ] = False,
-    ) -> None:
-        """[deprecated] Use 'abs trump-preview' instead."""
-        _deprecation_warning("abs-trump-check", "abs trump-preview")
-        from shelfr.commands import cmd_abs_trump_check
-
-        args = get_args(ctx, paths=paths or [], detailed=detailed, command="abs trump-preview")
-        result = cmd_abs_trump_check(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-restore", hidden=True)
-    def abs_restore_deprecated(
-        ctx: typer.Context,
-        archive_path: Annotated[
-            Path | None,
-            typer.Argument(help="Specific archive folder to restore."),
-        ] = None,
-        asin: AsinArg = None,
-        list_archives: Annotated[
-            bool,
-            typer.Option("--list", help="List available archives without restoring."),
-        ] = False,
-    ) -> None:
-        """[deprecated] Use 'abs restore' instead."""
-        _deprecation_warning("abs-restore", "abs restore")
-        from shelfr.commands import cmd_abs_restore
-
-        args = get_args(
-            ctx,
-            archive_path=archive_path,
-            asin=asin,
-            list=list_archives,
-            command="abs restore",
-        )
-        result = cmd_abs_restore(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-cleanup", hidden=True)
-    def abs_cleanup_deprecated(
-        ctx: typer.Context,
-        paths: Annotated[
-            list[Path] | None,
-            typer.Argument(help="Specific folder(s) to cleanup."),
-        ] = None,
-        strategy: Annotated[
-            CleanupStrategy | None,
-            typer.Option(help="Cleanup strategy."),
-        ] = None,
-        cleanup_path: Annotated[
-            Path | None,
-            typer.Option(help="Destination for 'move' strategy."),
-        ] = None,
-        no_verify_seed: Annotated[
-            bool,
-            typer.Option(
-                "--no-verify-seed",
-                help=("[red]DANGEROUS:[/] Skip seed hardlink verification."),
-            ),
-        ] = False,
-        min_age_days: Annotated[
-            int | None,
-            typer.Option(help="Only cleanup sources older than N days."),
-        ] = None,
-    ) -> None:
-        """[deprecated] Use 'abs cleanup' instead."""
-        _deprecation_warning("abs-cleanup", "abs cleanup")
-        from shelfr.commands import cmd_abs_cleanup
-
-        args = get_args(
-            ctx,
-            paths=paths or [],
-            strategy=strategy.value if strategy else None,
-            cleanup_path=cleanup_path,
-            no_verify_seed=no_verify_seed,
-            min_age_days=min_age_days,
-            command="abs cleanup",
-        )
-        result = cmd_abs_cleanup(args)
-        raise typer.Exit(result)
+    @functools.wraps(target)
+    def alias(*args: Any, **kwargs: Any) -> None:
+        # Report the name actually typed, so shared aliases (abs-dup) warn correctly
+        ctx = kwargs.get("ctx")
+        _deprecation_warning(getattr(ctx, "info_name", None) or old_cmd, new_cmd)
+        target(*args, **kwargs)
 
-    @app.command("abs-rename", hidden=True)
-    def abs_rename_deprecated(
-        ctx: typer.Context,
-        source: Annotated[
-            Path | None,
-            typer.Option(help="Directory to scan (default: ABS library from config)."),
-        ] = None,
-        pattern: Annotated[
-            str,
-            typer.Option(help="Glob pattern to filter folders."),
-        ] = "*",
-        fetch_metadata: Annotated[
-            bool,
-            typer.Option("--fetch-metadata", help="Fetch missing metadata from Audnex API."),
-        ] = False,
-        abs_search: Annotated[
-            bool,
-            typer.Option("--abs-search", help="Use ABS Audible search for ASIN resolution."),
-        ] = False,
-        abs_search_confidence: Annotated[
-            float,
-            typer.Option(help="Minimum confidence for ABS search matches."),
-        ] = 0.75,
-        interactive: Annotated[
-            bool,
-            typer.Option("--interactive", help="Prompt for confirmation on each rename."),
-        ] = False,
-        force: Annotated[
-            bool,
-            typer.Option("--force", help="Rename files even when folder names are correct."),
-        ] = False,
-        report: Annotated[
-            Path | None,
-            typer.Option(help="Output JSON report of changes to file."),
-        ] = None,
-    ) -> None:
-        """[deprecated] Use 'abs rename' instead."""
-        _deprecation_warning("abs-rename", "abs rename")
-        from shelfr.commands import cmd_abs_rename
+    alias.__doc__ = f"[deprecated] Use '{new_cmd}' instead."
+    return alias
 
-        args = get_args(
-            ctx,
-            source=source,
-            pattern=pattern,
-            fetch_metadata=fetch_metadata,
-            abs_search=abs_search,
-            abs_search_confidence=abs_search_confidence,
-            interactive=interactive,
-            force=force,
-            report=report,
-            command="abs rename",
-        )
-        result = cmd_abs_rename(args)
-        raise typer.Exit(result)
-
-    @app.command("abs-orphans", hidden=True)
-    def abs_orphans_deprecated(
-        ctx: typer.Context,
-        source: Annotated[
-            Path | None,
-            typer.Option(help="Directory to scan (default: ABS library from config)."),
-        ] = None,
-        cleanup: Annotated[
-            bool,
-            typer.Option("--cleanup", help="Remove orphaned folders (with matching audio folder)."),
-        ] = False,
-        cleanup_all: Annotated[
-            bool,
-            typer.Option("--cleanup-all", help="[red]DANGEROUS:[/] Remove ALL orphaned folders."),
-        ] = False,
-        min_match_score: Annotated[
-            float,
-            typer.Option(help="Minimum similarity score to consider a match."),
-        ] = 0.5,
-        report: Annotated[
-            Path | None,
-            typer.Option(help="Output JSON report of orphaned folders."),
-        ] = None,
-        yes: Annotated[
-            bool,
-            typer.Option("--yes", "-y", help="Skip confirmation prompts."),
-        ] = False,
-    ) -> None:
-        """[deprecated] Use 'abs orphans' instead."""
-        _deprecation_warning("abs-orphans", "abs orphans")
-        from shelfr.commands import cmd_abs_orphans
-
-        args = get_args(
-            ctx,
-            source=source,
-            cleanup=cleanup,
-            cleanup_all=cleanup_all,
-            min_match_score=min_match_score,
-            report=report,
-            yes=yes,
-            command="abs orphans",
-        )
-        result = cmd_abs_orphans(args)
-        raise typer.Exit(result)
 
-    @app.command("abs-resolve-asins", hidden=True)
-    def abs_resolve_asins_deprecated(
-        ctx: typer.Context,
-        path: Annotated[
-            Path | None,
-            typer.Option(help="Specific folder to resolve (default: scan Unknown/)."),
-        ] = None,
-        confidence: Annotated[
-            float,
-            typer.Option(help="Minimum confidence threshold (0-1)."),
-        ] = 0.75,
-        write_sidecar: Annotated[
-            bool,
-            typer.Option("--write-sidecar", help="Write resolved ASINs to sidecar JSON files."),
-        ] = False,
-    ) -> None:
-        """[deprecated] Use 'abs resolve-asins' instead."""
-        _deprecation_warning("abs-resolve-asins", "abs resolve-asins")
-        from shelfr.commands import cmd_abs_resolve_asins
+def register_abs_deprecated_aliases(app: typer.Typer, abs_app: typer.Typer) -> None:
+    """Register deprecated abs-* aliases on the main app for backward compatibility.
 
-        args = get_args(
-            ctx,
-            path=path,
-            confidence=confidence,
-            write_sidecar=write_sidecar,
-            command="abs resolve-asins",
-        )
-        result = cmd_abs_resolve_asins(args)
-        raise typer.Exit(result)
+    These hidden commands print a deprecation warning and call the actual command.
+    Must run after register_abs_commands() has populated abs_app.
+    """
+    commands = {info.name: info.callback for info in abs_app.registered_commands}
+    for old_name, sub_command in _DEPRECATED_ALIASES:
+        target = commands[sub_command]
+        assert target is not None
+        alias = _make_deprecated_alias(old_name, f"abs {sub_command}", target)
+        app.command(old_name, hidden=True)(alias)
+
+    # Also keep abs-dup as a deprecated alias, reusing abs-check-duplicate's
+    # registration instead of running it through the decorator again
+    check_duplicate = next(
+        info for info in app.registered_commands if info.name == "abs-check-duplicate"
+    )
+    abs_dup = copy.copy(check_duplicate)
+    abs_dup.name = "abs-dup"
+    app.registered_commands.append(abs_dup)
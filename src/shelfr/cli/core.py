@@ -10,7 +10,7 @@ from typing import Annotated
 import typer
 
 from shelfr.cli._app import CORE_COMMANDS
-from shelfr.cli._helpers import get_args
+from shelfr.cli._helpers import cached_option, get_args, misplaced_dry_run_message
 
 
 def register_core_commands(app: typer.Typer) -> None:
@@ -25,22 +25,22 @@ def register_core_commands(app: typer.Typer) -> None:
         ctx: typer.Context,
         skip_scan: Annotated[
             bool,
-            typer.Option("--skip-scan", help="Skip Libation scan step."),
+            cached_option("--skip-scan", help="Skip Libation scan step."),
         ] = False,
         skip_metadata: Annotated[
             bool,
-            typer.Option("--skip-metadata", help="Skip metadata fetching step."),
+            cached_option("--skip-metadata", help="Skip metadata fetching step."),
         ] = False,
         no_run_lock: Annotated[
             bool,
-            typer.Option(
+            cached_option(
                 "--no-run-lock",
                 help="[red]DANGEROUS:[/] Bypass run lock (can cause data corruption).",
             ),
         ] = False,
         dry_run_hint: Annotated[
             bool,
-            typer.Option(
+            cached_option(
                 "--dry-run",
                 hidden=True,
                 help="(Use 'shelfr --dry-run run' instead)",
@@ -65,11 +65,7 @@ def register_core_commands(app: typer.Typer) -> None:
 
         # Handle misplaced --dry-run flag
         if dry_run_hint:
-            console.print(
-                "[yellow]--dry-run must come BEFORE the subcommand:[/]\n\n"
-                "    [green]shelfr --dry-run run[/]  [OK]\n"
-                "    [red]shelfr run --dry-run[/]  [X]\n"
-            )
+            console.print(misplaced_dry_run_message("run"))
             raise typer.Exit(2)
 
         from shelfr.commands import cmd_run
@@ -82,7 +78,7 @@ def register_core_commands(app: typer.Typer) -> None:
             command="run",
         )
         result = cmd_run(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command(rich_help_panel=CORE_COMMANDS)
     def status(ctx: typer.Context) -> None:
@@ -101,7 +97,7 @@ def register_core_commands(app: typer.Typer) -> None:
 
         args = get_args(ctx, command="status")
         result = cmd_status(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command(rich_help_panel=CORE_COMMANDS)
     def config(ctx: typer.Context) -> None:
@@ -117,4 +113,4 @@ def register_core_commands(app: typer.Typer) -> None:
 
         args = get_args(ctx, command="config")
         result = cmd_config(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
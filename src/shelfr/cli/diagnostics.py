@@ -59,7 +59,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
             command="check",
         )
         result = cmd_check(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command(rich_help_panel=DIAG_COMMANDS)
     def validate(
@@ -89,7 +89,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
 
         args = get_args(ctx, asin=asin, json=json_output, command="validate")
         result = cmd_validate(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command("validate-config", rich_help_panel=DIAG_COMMANDS)
     def validate_config(ctx: typer.Context) -> None:
@@ -104,7 +104,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
 
         args = get_args(ctx, command="validate-config")
         result = cmd_validate_config(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command("preview-naming", rich_help_panel=DIAG_COMMANDS)
     def preview_naming_cmd(
@@ -136,7 +136,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
 
         args = get_args(ctx, limit=limit, asin=asin, json=json_output, command="preview-naming")
         result = cmd_preview_naming(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command("check-duplicates", rich_help_panel=DIAG_COMMANDS)
     def check_duplicates(
@@ -182,7 +182,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
             command="check-duplicates",
         )
         result = cmd_check_duplicates(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @app.command("check-suspicious", rich_help_panel=DIAG_COMMANDS)
     def check_suspicious(
@@ -220,7 +220,7 @@ def register_diagnostics_commands(app: typer.Typer) -> None:
             command="check-suspicious",
         )
         result = cmd_check_suspicious(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     # Command Aliases
     app.command("dupes", hidden=True)(check_duplicates)
@@ -5,7 +5,6 @@ Commands for editing configuration files with $EDITOR integration.
 
 from __future__ import annotations
 
-import logging
 from pathlib import Path
 from typing import Annotated
 
@@ -13,9 +12,6 @@ import typer
 
 from shelfr.console import console, print_error, print_success, print_warning
 
-logger = logging.getLogger(__name__)
-
-
 # =============================================================================
 # Edit Command Group
 # =============================================================================
@@ -47,7 +47,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
             args = get_args(ctx, refresh=False, command="libation")
             result = cmd_libation_status(args)
-            raise typer.Exit(result)
+            raise SystemExit(result)
 
     @libation_app.command("scan")
     def libation_scan(
@@ -69,7 +69,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, liberate=liberate, command="libation")
         result = cmd_libation_scan(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("liberate")
     def libation_liberate(
@@ -99,7 +99,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, asin=asin, yes=yes, command="libation")
         result = cmd_libation_liberate(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("status")
     def libation_status(
@@ -117,7 +117,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, refresh=refresh, command="libation")
         result = cmd_libation_status(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("search")
     def libation_search(
@@ -144,7 +144,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, query=query, limit=limit, format=format_.value, command="libation")
         result = cmd_libation_search(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("export")
     def libation_export(
@@ -170,7 +170,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, output=output, format=format_.value, command="libation")
         result = cmd_libation_export(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("settings")
     def libation_settings(
@@ -188,7 +188,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, raw=raw, command="libation")
         result = cmd_libation_settings(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("books")
     def libation_books(
@@ -229,7 +229,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
             ctx, status=status_value, format=format_.value, limit=limit, command="libation"
         )
         result = cmd_libation_books(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("redownload")
     def libation_redownload(
@@ -257,7 +257,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
         # Handler expects asins as a list
         args = get_args(ctx, asins=[asin], yes=yes, command="libation")
         result = cmd_libation_redownload(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("set-status")
     def libation_set_status(
@@ -293,7 +293,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
             command="libation",
         )
         result = cmd_libation_set_status(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("convert")
     def libation_convert(
@@ -327,7 +327,7 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
         asins = [asin] if asin else []
         args = get_args(ctx, asins=asins, quality=quality, yes=yes, command="libation")
         result = cmd_libation_convert(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @libation_app.command("guide")
     def libation_guide(
@@ -348,4 +348,4 @@ def register_libation_commands(libation_app: typer.Typer) -> None:
 
         args = get_args(ctx, section=section, command="libation")
         result = cmd_libation_guide(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
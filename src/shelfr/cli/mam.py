@@ -7,14 +7,11 @@ Commands for MAM tracker workflows:
 
 from __future__ import annotations
 
-import logging
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
-logger = logging.getLogger(__name__)
-
 
 def register_mam_commands(mam_app: typer.Typer) -> None:
     """Register mam commands on the mam sub-app."""
@@ -67,7 +64,7 @@ def register_mam_commands(mam_app: typer.Typer) -> None:
 
         args = get_args(ctx, path=path, command="mam-bbcode")
         result = cmd_mam_bbcode(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @mam_app.command("render")
     def mam_render(
@@ -104,4 +101,4 @@ def register_mam_commands(mam_app: typer.Typer) -> None:
 
         args = get_args(ctx, path=path, command="mam-render")
         result = cmd_mam_render(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
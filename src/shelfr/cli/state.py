@@ -57,7 +57,7 @@ def register_state_commands(state_app: typer.Typer) -> None:
             command="state",
         )
         result = cmd_state(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @state_app.command("prune")
     def state_prune(ctx: typer.Context) -> None:
@@ -71,7 +71,7 @@ def register_state_commands(state_app: typer.Typer) -> None:
 
         args = get_args(ctx, state_command="prune", command="state")
         result = cmd_state(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @state_app.command("retry")
     def state_retry(
@@ -91,7 +91,7 @@ def register_state_commands(state_app: typer.Typer) -> None:
 
         args = get_args(ctx, state_command="retry", asin=asin, command="state")
         result = cmd_state(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @state_app.command("clear")
     def state_clear(
@@ -111,7 +111,7 @@ def register_state_commands(state_app: typer.Typer) -> None:
 
         args = get_args(ctx, state_command="clear", asin=asin, command="state")
         result = cmd_state(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @state_app.command("export")
     def state_export(
@@ -133,4 +133,4 @@ def register_state_commands(state_app: typer.Typer) -> None:
 
         args = get_args(ctx, state_command="export", output=output, command="state")
         result = cmd_state(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
@@ -5,16 +5,13 @@ Commands: tools prepare, tools mamff, tools bbcode
 
 from __future__ import annotations
 
-import logging
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
 from shelfr.cli._app import AsinArg
-from shelfr.cli._helpers import get_args
-
-logger = logging.getLogger(__name__)
+from shelfr.cli._helpers import cached_argument, cached_option, get_args, misplaced_dry_run_message
 
 
 def register_tools_commands(tools_app: typer.Typer) -> None:
@@ -44,7 +41,7 @@ def register_tools_commands(tools_app: typer.Typer) -> None:
         asin: AsinArg = None,
         dry_run_hint: Annotated[
             bool,
-            typer.Option("--dry-run", hidden=True),
+            cached_option("--dry-run", hidden=True),
         ] = False,
     ) -> None:
         """Stage audiobooks for upload.
@@ -65,32 +62,28 @@ def register_tools_commands(tools_app: typer.Typer) -> None:
         from shelfr.console import console
 
         if dry_run_hint:
-            console.print(
-                "[yellow]--dry-run must come BEFORE the subcommand:[/]\n\n"
-                "    [green]shelfr --dry-run tools prepare[/]  [OK]\n"
-                "    [red]shelfr tools prepare --dry-run[/]  [X]\n"
-            )
+            console.print(misplaced_dry_run_message("tools prepare"))
             raise typer.Exit(2)
 
         from shelfr.commands import cmd_prepare
 
         args = get_args(ctx, asin=asin, command="prepare")
         result = cmd_prepare(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
 
     @tools_app.command("mamff")
     def tools_mamff(
         ctx: typer.Context,
         path: Annotated[
             Path,
-            typer.Argument(
+            cached_argument(
                 help="Path to release folder or audio file.",
                 exists=True,
             ),
         ],
         output: Annotated[
             Path | None,
-            typer.Option(
+            cached_option(
                 "--output",
                 "-o",
                 help="Output JSON path (default: same folder as audio file).",
@@ -118,4 +111,4 @@ def register_tools_commands(tools_app: typer.Typer) -> None:
 
         args = get_args(ctx, path=path, output=output, command="tools-mamff")
         result = cmd_tools_mamff(args)
-        raise typer.Exit(result)
+        raise SystemExit(result)
@@ -14,38 +14,93 @@ Use `shelfr run` for full pipeline, or `shelfr libation` subcommands.
 
 from __future__ import annotations
 
-from shelfr.commands.abs import (
-    cmd_abs_check_duplicate,
-    cmd_abs_cleanup,
-    cmd_abs_import,
-    cmd_abs_init,
-    cmd_abs_orphans,
-    cmd_abs_rename,
-    cmd_abs_resolve_asins,
-    cmd_abs_restore,
-    cmd_abs_trump_check,
-)
-from shelfr.commands.core import (
-    cmd_prepare,
-    cmd_run,
-)
-from shelfr.commands.diagnostics import (
-    cmd_check_duplicates,
-    cmd_check_suspicious,
-    cmd_preview_naming,
-)
-from shelfr.commands.libation import (
-    add_libation_parser,
-    cmd_libation,
-)
-from shelfr.commands.state import cmd_state
-from shelfr.commands.utility import (
-    cmd_check,
-    cmd_config,
-    cmd_status,
-    cmd_validate,
-    cmd_validate_config,
-)
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from shelfr.commands.abs import (
+        cmd_abs_check_duplicate,
+        cmd_abs_cleanup,
+        cmd_abs_import,
+        cmd_abs_init,
+        cmd_abs_orphans,
+        cmd_abs_rename,
+        cmd_abs_resolve_asins,
+        cmd_abs_restore,
+        cmd_abs_trump_check,
+    )
+    from shelfr.commands.core import (
+        cmd_prepare,
+        cmd_run,
+    )
+    from shelfr.commands.diagnostics import (
+        cmd_check_duplicates,
+        cmd_check_suspicious,
+        cmd_preview_naming,
+    )
+    from shelfr.commands.libation import (
+        add_libation_parser,
+        cmd_libation,
+    )
+    from shelfr.commands.state import cmd_state
+    from shelfr.commands.utility import (
+        cmd_check,
+        cmd_config,
+        cmd_status,
+        cmd_validate,
+        cmd_validate_config,
+    )
+
+# Handlers are imported on first access so that running one command does not
+# import every other command module (PEP 562). Set SHELFR_EAGER_IMPORT=1 to
+# resolve everything up front, e.g. in CI to surface import errors early.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Core workflow
+    "cmd_prepare": "shelfr.commands.core",
+    "cmd_run": "shelfr.commands.core",
+    # Utility
+    "cmd_status": "shelfr.commands.utility",
+    "cmd_check": "shelfr.commands.utility",
+    "cmd_validate": "shelfr.commands.utility",
+    "cmd_validate_config": "shelfr.commands.utility",
+    "cmd_config": "shelfr.commands.utility",
+    # Diagnostics
+    "cmd_preview_naming": "shelfr.commands.diagnostics",
+    "cmd_check_duplicates": "shelfr.commands.diagnostics",
+    "cmd_check_suspicious": "shelfr.commands.diagnostics",
+    # State management
+    "cmd_state": "shelfr.commands.state",
+    # Libation
+    "cmd_libation": "shelfr.commands.libation._parser",
+    "add_libation_parser": "shelfr.commands.libation._parser",
+    # ABS
+    "cmd_abs_init": "shelfr.commands.abs.init",
+    "cmd_abs_import": "shelfr.commands.abs.import_",
+    "cmd_abs_check_duplicate": "shelfr.commands.abs.check",
+    "cmd_abs_trump_check": "shelfr.commands.abs.trump",
+    "cmd_abs_restore": "shelfr.commands.abs.restore",
+    "cmd_abs_cleanup": "shelfr.commands.abs.cleanup",
+    "cmd_abs_rename": "shelfr.commands.abs.rename",
+    "cmd_abs_orphans": "shelfr.commands.abs.orphans",
+    "cmd_abs_resolve_asins": "shelfr.commands.abs.resolve",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command handler on first access and cache it on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported handlers in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Core workflow
@@ -77,3 +132,8 @@ __all__ = [
     "cmd_abs_orphans",
     "cmd_abs_resolve_asins",
 ]
+
+if os.environ.get("SHELFR_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
@@ -7,7 +7,6 @@ scan → discover → prepare → metadata → torrent → upload → run
 from __future__ import annotations
 
 import argparse
-import logging
 from pathlib import Path
 
 from shelfr.console import (
@@ -25,8 +24,6 @@ from shelfr.console import (
     render_libation_status,
 )
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_scan(args: argparse.Namespace) -> int:
     """Run Libation scan."""
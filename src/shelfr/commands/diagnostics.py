@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import argparse
 import json as json_module
-import logging
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -26,8 +25,6 @@ if TYPE_CHECKING:
     from shelfr.config import NamingConfig
     from shelfr.console import DryRunTransform
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_preview_naming(args: argparse.Namespace) -> int:
     """Preview naming transformations without making changes."""
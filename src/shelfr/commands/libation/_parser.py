@@ -6,7 +6,6 @@ This module provides the argparse subparser configuration (deprecated, kept for
 from __future__ import annotations
 
 import argparse
-import logging
 from typing import Any
 
 from shelfr.utils.validation import validate_asin
@@ -18,8 +17,6 @@ from .management import cmd_libation_convert, cmd_libation_redownload, cmd_libat
 from .search import cmd_libation_books, cmd_libation_search
 from .settings import cmd_libation_settings
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_libation(args: argparse.Namespace) -> int:
     """Dispatcher for libation subcommands (default: status)."""
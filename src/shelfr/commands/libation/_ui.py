@@ -5,7 +5,6 @@ This module contains Rich UI helpers used across Libation commands.
 
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 from rich.columns import Columns
@@ -15,8 +14,6 @@ from rich.text import Text
 
 from shelfr.console import console
 
-logger = logging.getLogger(__name__)
-
 
 def print_libation_header(
     title: str,
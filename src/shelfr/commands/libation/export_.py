@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import argparse
 import contextlib
-import logging
 import os
 from pathlib import Path
 
@@ -17,8 +16,6 @@ from shelfr.utils.cmd import CmdError, docker
 from ._common import run_libation_cmd as _run_libation_cmd
 from ._ui import print_libation_header
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_libation_export(args: argparse.Namespace) -> int:
     """Export Libation library data."""
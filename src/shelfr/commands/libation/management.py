@@ -6,7 +6,6 @@ These commands manage book status and redownload/conversion.
 from __future__ import annotations
 
 import argparse
-import logging
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -24,8 +23,6 @@ from ._common import (
 )
 from ._ui import print_hint_box, print_libation_header
 
-logger = logging.getLogger(__name__)
-
 
 def _save_libation_log(command: str, stdout: str, stderr: str) -> Path:
     """Save Libation command output to log file."""
@@ -6,7 +6,6 @@ These commands allow searching and listing audiobooks.
 from __future__ import annotations
 
 import argparse
-import logging
 from typing import Any
 
 from rich.panel import Panel
@@ -25,8 +24,6 @@ from ._common import (
 )
 from ._ui import print_hint_box, print_libation_header, print_status_dashboard
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_libation_search(args: argparse.Namespace) -> int:
     """Search Libation library."""
@@ -6,7 +6,6 @@ This command displays Libation configuration.
 from __future__ import annotations
 
 import argparse
-import logging
 
 from rich.panel import Panel
 from rich.table import Table
@@ -16,8 +15,6 @@ from shelfr.console import console
 from ._common import run_libation_cmd as _run_libation_cmd
 from ._ui import print_hint_box, print_libation_header
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_libation_settings(args: argparse.Namespace) -> int:
     """View Libation settings."""
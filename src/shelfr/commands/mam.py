@@ -8,13 +8,10 @@ Handlers for MAM-related CLI commands:
 from __future__ import annotations
 
 import argparse
-import logging
 from pathlib import Path
 
 from shelfr.console import console, print_error, print_info
 
-logger = logging.getLogger(__name__)
-
 # Audio file extensions to look for
 AUDIO_EXTENSIONS = {".m4b", ".mp3", ".m4a", ".flac", ".ogg"}
 
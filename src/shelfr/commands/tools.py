@@ -9,7 +9,6 @@ This module provides CLI tools for debugging and testing MAM upload functionalit
 from __future__ import annotations
 
 import argparse
-import logging
 from pathlib import Path
 
 from rich.markup import escape
@@ -17,8 +16,6 @@ from rich.panel import Panel
 
 from shelfr.console import console, print_error, print_info, print_success
 
-logger = logging.getLogger(__name__)
-
 # Audio file extensions to look for
 AUDIO_EXTENSIONS = {".m4b", ".mp3", ".m4a", ".flac", ".ogg"}
 
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import argparse
 import json as json_module
-import logging
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -31,8 +30,6 @@ from shelfr.console import (
     print_warning,
 )
 
-logger = logging.getLogger(__name__)
-
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show status."""
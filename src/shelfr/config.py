@@ -10,7 +10,7 @@ Settings are loaded from three sources:
    - mam: max_filename_length, allowed_extensions
    - mkbrr: image, preset, host_data_root, container_data_root, etc.
    - qbittorrent: category, tags, auto_start
-   - audnex: base_url, timeout_seconds
+   - audnex: base_url, timeout_seconds, cache_ttl_seconds
    - mediainfo: binary
    - filters: remove_book_numbers, transliterate_japanese
    - environment: can override any .env variable (see below)
@@ -153,6 +153,8 @@ class AudnexConfig:
     # Preferred ASIN region - when ASIN found in different region, use ABS search
     # to find the preferred region's ASIN. Set to None to disable normalization.
     preferred_asin_region: str | None = DEFAULT_ASIN_REGION
+    # How long successful responses stay in the on-disk cache (0 disables)
+    cache_ttl_seconds: int = 604800
 
 
 @dataclass
@@ -1134,6 +1136,7 @@ def load_settings(
         timeout_seconds=audnex_data.get("timeout_seconds", 30),
         regions=validated_regions,
         preferred_asin_region=validated_preferred,
+        cache_ttl_seconds=audnex_data.get("cache_ttl_seconds", 604800),
     )
 
     # Parse MediaInfo config
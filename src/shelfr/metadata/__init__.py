@@ -41,6 +41,9 @@ from shelfr.metadata.audnex import (
 from shelfr.metadata.audnex import (
     fetch_audnex_book as fetch_audnex_book,
 )
+from shelfr.metadata.audnex import (
+    fetch_audnex_books_batch as fetch_audnex_books_batch,
+)
 from shelfr.metadata.audnex import (
     fetch_audnex_chapters as fetch_audnex_chapters,
 )
@@ -250,6 +253,7 @@ logger = logging.getLogger(__name__)
 def fetch_metadata(
     asin: str | None = None,
     m4b_path: Path | None = None,
+    audnex_data: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
     """
     Fetch Audnex book metadata, chapters, and MediaInfo without saving.
@@ -257,11 +261,12 @@ def fetch_metadata(
     Args:
         asin: Audible ASIN (None to skip Audnex)
         m4b_path: Path to m4b file (None to skip MediaInfo)
+        audnex_data: Already-fetched Audnex book data (skips the book request)
 
     Returns:
         Tuple of (audnex_data, mediainfo_data, audnex_chapters), any may be None on error.
     """
-    return fetch_metadata_legacy(asin=asin, m4b_path=m4b_path)
+    return fetch_metadata_legacy(asin=asin, m4b_path=m4b_path, audnex_data=audnex_data)
 
 
 def save_metadata_files(
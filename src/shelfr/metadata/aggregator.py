@@ -14,8 +14,12 @@ Key features:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Any, get_args
 
 from .providers.base import MetadataProvider
@@ -25,10 +29,16 @@ from .providers.types import FieldName, IdType, LookupContext, ProviderResult
 logger = logging.getLogger(__name__)
 
 # Runtime set of all canonical fields (from Literal type)
-ALL_FIELDS: set[FieldName] = set(get_args(FieldName))
+ALL_FIELDS: frozenset[FieldName] = frozenset(get_args(FieldName))
 
+# Stable iteration order for reporting missing fields
+_ALL_FIELDS_ORDERED: tuple[FieldName, ...] = tuple(sorted(ALL_FIELDS))
 
-@dataclass
+# Sort key for tie-break score tuples: (priority, -quality, provider)
+_SCORE_KEY = itemgetter(0, 1, 2)
+
+
+@dataclass(slots=True)
 class FieldConflict:
     """Record of a field conflict between providers.
 
@@ -45,7 +55,7 @@ class FieldConflict:
     resolution_reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedResult:
     """Aggregated metadata from multiple providers.
 
@@ -118,7 +128,10 @@ class MetadataAggregator:
 
         Two-stage fetch when stop_on_complete=True:
         1. Run local providers first (cheap, parallelized)
-        2. Run network providers only if required_fields still missing
+        2. Run network providers (concurrently) only if required_fields still missing
+
+        Within each stage, providers after the one that fills required_fields
+        are cancelled (override providers always complete).
 
         Args:
             ctx: Lookup context with identifiers and paths
@@ -146,55 +159,93 @@ class MetadataAggregator:
 
         if not provider_list:
             logger.warning("No providers available for context: %s", ctx)
-            return AggregatedResult(missing=list(ALL_FIELDS))
-
-        # Build provider lookup for is_override check
-        provider_map = {p.name: p for p in provider_list}
+            return AggregatedResult(missing=list(_ALL_FIELDS_ORDERED))
 
         # Split by kind (not hardcoded names)
         local_providers = [p for p in provider_list if p.kind == "local"]
         network_providers = [p for p in provider_list if p.kind == "network"]
 
-        results: list[ProviderResult] = []
+        # Successful results, paired with the provider that produced them
+        results: list[tuple[MetadataProvider, ProviderResult]] = []
         errors: dict[str, str] = {}
 
+        # Early exit once required fields are filled (None = run every provider)
+        # Filled fields are tracked incrementally as each result arrives
+        filled: set[FieldName] = set()
+
+        def required_filled(provider: MetadataProvider, result: ProviderResult) -> bool:
+            filled.update(self._filled_fields(provider, result))
+            return required.issubset(filled)
+
+        stop_when = required_filled if stop_on_complete and required else None
+
         # Stage 1: Run local providers (cheap, parallelized)
         if local_providers:
             logger.debug("Stage 1: fetching from %d local providers", len(local_providers))
-            stage1 = await asyncio.gather(
-                *(self._safe_fetch(p, ctx, id_type) for p in local_providers)
-            )
-            for result in stage1:
-                if result.success:
-                    results.append(result)
-                elif result.error:
-                    errors[result.provider] = result.error
-
-        # Check if we can skip network calls
-        if stop_on_complete and required:
-            filled = self._get_filled_fields(results, provider_map)
-            if required.issubset(filled):
+            if await self._run_stage(local_providers, ctx, id_type, results, errors, stop_when):
                 logger.debug("Required fields filled by local providers, skipping network")
-                return self._merge(results, provider_map, errors)
+                return self._merge(results, errors)
 
-        # Stage 2: Run network providers (sequential to be nice to APIs)
+        # Stage 2: Run network providers (concurrently, same early exit)
         if network_providers:
             logger.debug("Stage 2: fetching from %d network providers", len(network_providers))
-            for provider in network_providers:
-                result = await self._safe_fetch(provider, ctx, id_type)
+            await self._run_stage(network_providers, ctx, id_type, results, errors, stop_when)
+
+        return self._merge(results, errors)
+
+    async def _run_stage(
+        self,
+        providers: list[MetadataProvider],
+        ctx: LookupContext,
+        id_type: IdType,
+        results: list[tuple[MetadataProvider, ProviderResult]],
+        errors: dict[str, str],
+        stop_when: Callable[[MetadataProvider, ProviderResult], bool] | None,
+    ) -> bool:
+        """Fetch from providers concurrently, collecting results in provider order.
+
+        Every provider starts at once, but results are consumed in list
+        (priority) order, so stopping early keeps exactly the results a
+        sequential run would have kept. Once stop_when() is true the
+        remaining providers are cancelled, except override providers, whose
+        results are always collected so intentional clears aren't lost.
+
+        Args:
+            providers: Providers to run, in priority order
+            ctx: Lookup context
+            id_type: Identifier type to use for lookup
+            results: Successful (provider, result) pairs are appended here
+            errors: Failed providers are recorded here
+            stop_when: Early-exit check called with each provider and its
+                result (None = never)
+
+        Returns:
+            True if stop_when was satisfied during this stage.
+        """
+        tasks = [asyncio.create_task(self._safe_fetch(p, ctx, id_type)) for p in providers]
+        stopped = False
+        try:
+            for provider, task in zip(providers, tasks, strict=True):
+                if stopped and not provider.is_override:
+                    continue  # Cancelled above
+                result = await task
                 if result.success:
-                    results.append(result)
+                    results.append((provider, result))
                 elif result.error:
                     errors[result.provider] = result.error
 
-                # Early exit if required fields now filled
-                if stop_on_complete and required:
-                    filled = self._get_filled_fields(results, provider_map)
-                    if required.issubset(filled):
-                        logger.debug("Required fields filled, stopping early")
-                        break
-
-        return self._merge(results, provider_map, errors)
+                if not stopped and stop_when is not None and stop_when(provider, result):
+                    logger.debug("Required fields filled after %s, stopping early", provider.name)
+                    stopped = True
+                    for other, pending in zip(providers, tasks, strict=True):
+                        if not other.is_override and not pending.done():
+                            pending.cancel()
+        finally:
+            pending_tasks = [t for t in tasks if not t.done()]
+            for task in pending_tasks:
+                task.cancel()
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+        return stopped
 
     async def _safe_fetch(
         self,
@@ -211,8 +262,7 @@ class MetadataAggregator:
 
     def _merge(
         self,
-        results: list[ProviderResult],
-        provider_map: dict[str, MetadataProvider],
+        results: list[tuple[MetadataProvider, ProviderResult]],
         errors: dict[str, str],
     ) -> AggregatedResult:
         """Merge multiple provider results.
@@ -225,27 +275,23 @@ class MetadataAggregator:
         aggregated = AggregatedResult(errors=errors)
 
         # Collect candidates per field: field -> [(provider, value, confidence, priority)]
-        candidates: dict[FieldName, list[tuple[str, Any, float, int]]] = {}
+        candidates: defaultdict[FieldName, list[tuple[str, Any, float, int]]] = defaultdict(list)
 
-        for result in results:
+        for provider, result in results:
             if not result.success:
                 continue
 
-            provider = provider_map.get(result.provider)
-            if not provider:
-                continue
+            # Override providers (is_override=True) can set empty values
+            # intentionally - user wants to clear a field
+            keep_empty = provider.is_override
+            priority = provider.priority
 
             for field_name, value in result.fields.items():
-                # Skip empty unless override provider
-                if self._should_skip_empty(provider, value):
+                if not keep_empty and self._is_empty(value):
                     continue
 
                 confidence = result.confidence.get(field_name, 1.0)
-                if field_name not in candidates:
-                    candidates[field_name] = []
-                candidates[field_name].append(
-                    (result.provider, value, confidence, provider.priority)
-                )
+                candidates[field_name].append((result.provider, value, confidence, priority))
 
         # Resolve each field
         for field_name, field_candidates in candidates.items():
@@ -272,42 +318,26 @@ class MetadataAggregator:
                 aggregated.conflicts.append(conflict)
 
         # Track missing fields
-        aggregated.missing = [f for f in ALL_FIELDS if f not in aggregated.fields]
+        aggregated.missing = [f for f in _ALL_FIELDS_ORDERED if f not in aggregated.fields]
 
         return aggregated
 
-    def _get_filled_fields(
+    def _filled_fields(
         self,
-        results: list[ProviderResult],
-        provider_map: dict[str, MetadataProvider],
+        provider: MetadataProvider,
+        result: ProviderResult,
     ) -> set[FieldName]:
-        """Get all fields that have non-empty values."""
-        filled: set[FieldName] = set()
-        for result in results:
-            if not result.success:
-                continue
-            provider = provider_map.get(result.provider)
-            for field_name, value in result.fields.items():
-                if provider and provider.is_override:
-                    # Override providers count even for empty
-                    filled.add(field_name)
-                elif not self._is_empty(value):
-                    filled.add(field_name)
-        return filled
+        """Get the fields a single result fills (empty for failed results)."""
+        if not result.success:
+            return set()
+        if provider.is_override:
+            # Override providers count even for empty
+            return set(result.fields)
+        return {name for name, value in result.fields.items() if not self._is_empty(value)}
 
     def _is_empty(self, value: Any) -> bool:
         """Check if a value is considered empty."""
-        return value is None or value == "" or value == []
-
-    def _should_skip_empty(self, provider: MetadataProvider, value: Any) -> bool:
-        """Check if an empty value should be skipped.
-
-        Override providers (is_override=True) can set empty values
-        intentionally - user wants to clear a field.
-        """
-        if provider.is_override:
-            return False
-        return self._is_empty(value)
+        return value is None or (isinstance(value, (str, list)) and not value)
 
     def _resolve_conflict(
         self,
@@ -324,34 +354,32 @@ class MetadataAggregator:
             (resolved_value, resolution_reason, provider_name)
         """
         if self.merge_strategy == "priority":
-            # Lowest priority number wins (use sorted() to avoid mutating input)
-            sorted_candidates = sorted(candidates, key=lambda x: (x[3], x[0]))
-            return sorted_candidates[0][1], "priority", sorted_candidates[0][0]
-
-        # Confidence strategy with full tie-breaker chain
-        # Sort by: max(confidence), min(priority), max(quality), name
-        scored = []
-        for provider, value, confidence, priority in candidates:
-            quality = self._value_quality(field_name, value)
-            scored.append((provider, value, confidence, priority, quality))
-
-        # Sort: highest confidence, lowest priority, highest quality, alpha name
-        scored.sort(key=lambda x: (-x[2], x[3], -x[4], x[0]))
-        winner = scored[0]
+            # Lowest priority number wins (name breaks ties)
+            best = min(candidates, key=itemgetter(3, 0))
+            return best[1], "priority", best[0]
+
+        # Confidence strategy. Fast path: a unique top confidence wins outright,
+        # without computing value quality for anyone
+        top_confidence = max(c[2] for c in candidates)
+        leaders = [c for c in candidates if c[2] == top_confidence]
+        if len(leaders) == 1:
+            return leaders[0][1], "confidence", leaders[0][0]
+
+        # Tie on confidence: break it among the leaders only. Score tuples
+        # sort ascending: lowest priority, highest quality, then alpha name
+        scored = [
+            (priority, -self._value_quality(field_name, value), provider, value)
+            for provider, value, _, priority in leaders
+        ]
+
+        # Only the top two matter (winner + runner-up for the reason)
+        top = heapq.nsmallest(2, scored, key=_SCORE_KEY)
+        winner = top[0]
 
         # Determine what broke the tie
-        if len(scored) > 1:
-            second = scored[1]
-            if winner[2] != second[2]:
-                reason = "confidence"
-            elif winner[3] != second[3]:
-                reason = "priority"
-            else:
-                reason = "quality"
-        else:
-            reason = "confidence"
+        reason = "priority" if winner[0] != top[1][0] else "quality"
 
-        return winner[1], reason, winner[0]
+        return winner[3], reason, winner[2]
 
     def _value_quality(self, field_name: FieldName, value: Any) -> int:
         """Compute quality score for a value (higher = better).
@@ -6,14 +6,20 @@ with region fallback support.
 
 Public API:
     fetch_audnex_book: Fetch book metadata by ASIN
+    fetch_audnex_books_batch: Fetch book metadata for many ASINs concurrently
     fetch_audnex_author: Fetch author metadata by ASIN
     fetch_audnex_chapters: Fetch chapter data by ASIN
     save_audnex_json: Save Audnex response to JSON file
+    reset_client: Close the pooled Audnex HTTP client
+    invalidate_cache: Evict cached Audnex responses for an ASIN
 """
 
 from __future__ import annotations
 
 # Private helpers (exposed for testing and backward compatibility)
+from shelfr.metadata.audnex.client import (
+    _fetch_audnex_author_region as _fetch_audnex_author_region,
+)
 from shelfr.metadata.audnex.client import (
     _fetch_audnex_book_region as _fetch_audnex_book_region,
 )
@@ -26,9 +32,18 @@ from shelfr.metadata.audnex.client import (
 from shelfr.metadata.audnex.client import (
     fetch_audnex_book as fetch_audnex_book,
 )
+from shelfr.metadata.audnex.client import (
+    fetch_audnex_books_batch as fetch_audnex_books_batch,
+)
 from shelfr.metadata.audnex.client import (
     fetch_audnex_chapters as fetch_audnex_chapters,
 )
+from shelfr.metadata.audnex.client import (
+    invalidate_cache as invalidate_cache,
+)
+from shelfr.metadata.audnex.client import (
+    reset_client as reset_client,
+)
 from shelfr.metadata.audnex.client import (
     save_audnex_json as save_audnex_json,
 )
@@ -37,9 +52,13 @@ __all__ = [
     # Public API
     "fetch_audnex_author",
     "fetch_audnex_book",
+    "fetch_audnex_books_batch",
     "fetch_audnex_chapters",
+    "invalidate_cache",
+    "reset_client",
     "save_audnex_json",
     # Private (for testing/backward compat)
+    "_fetch_audnex_author_region",
     "_fetch_audnex_book_region",
     "_fetch_audnex_chapters_region",
 ]
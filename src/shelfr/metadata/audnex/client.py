@@ -6,27 +6,381 @@ Audnex API: https://api.audnex.us
 - GET /books/{asin}/chapters - Get chapter data
 - GET /authors/{asin} - Get author info
 
-All functions support region fallback - they try configured regions in order
-until one succeeds. Some ASINs are region-specific.
+All functions support region fallback - the first configured region is tried
+alone, then the rest are queried concurrently and the first hit in configured
+order wins. Some ASINs are region-specific.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import contextlib
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar, cast
 
 import httpx
-from pydantic import ValidationError
 
 from shelfr.config import get_settings
+from shelfr.paths import cache_dir
 from shelfr.schemas.audnex import validate_audnex_book, validate_audnex_chapters
+from shelfr.utils import jsonio
 from shelfr.utils.circuit_breaker import CircuitOpenError, audnex_breaker
-from shelfr.utils.retry import NETWORK_EXCEPTIONS, retry_with_backoff
+from shelfr.utils.retry import NETWORK_EXCEPTIONS, RetryableError, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Gateway errors are usually transient (Audnex proxies Audible) - retry these
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Upper bound on fallback regions queried at once after the primary misses
+_REGION_FANOUT_WORKERS = 4
+
+_T = TypeVar("_T")
+
+# Response kinds stored in the cache (also the cache file name prefix)
+_CACHE_KINDS = ("book", "chapters", "author")
+
+
+# =============================================================================
+# Connection Pool
+# =============================================================================
+
+# Shared client so keep-alive connections (and the TLS session) to Audnex are
+# reused across ASINs and regions instead of re-handshaking per request.
+_client: httpx.Client | None = None
+_client_timeout: float | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client(timeout: float) -> httpx.Client:
+    """
+    Get the pooled Audnex HTTP client, creating it on first use.
+
+    The client is recreated if the configured timeout changes. Thread-safe.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        Shared httpx.Client with HTTP/2 and keep-alive enabled.
+    """
+    global _client, _client_timeout
+
+    with _client_lock:
+        if _client is not None and _client_timeout == timeout:
+            return _client
+        if _client is not None:
+            _client.close()
+
+        _client = httpx.Client(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        _client_timeout = timeout
+        return _client
+
+
+def reset_client() -> None:
+    """
+    Close and discard the pooled Audnex client.
+
+    Call this after configuration changes or to force new connections.
+    """
+    global _client, _client_timeout
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _client_timeout = None
+            logger.debug("Audnex client reset")
+
+
+atexit.register(reset_client)
+
+
+# =============================================================================
+# Region Fallback
+# =============================================================================
+
+
+def _single_attempt(fetcher: Callable[..., _T]) -> Callable[..., _T]:
+    """Return the function behind a retry_with_backoff wrapper (one attempt, no retries)."""
+    return cast("Callable[..., _T]", getattr(fetcher, "__wrapped__", fetcher))
+
+
+def _first_region_hit(
+    regions: list[str],
+    fetch_region: Callable[[str, bool], _T | None],
+) -> tuple[_T, str] | None:
+    """
+    Return the first region (in configured order) whose lookup has data.
+
+    The primary region is tried alone, with retries, since nearly every ASIN
+    is found there. If it misses, the remaining regions are queried
+    concurrently and their results consumed in configured order, so a miss
+    costs one extra round trip instead of one per region while the chosen
+    region stays the same as a sequential fallback.
+
+    Fallback lookups make a single attempt without retries. A thread that
+    is already running can't be stopped, so once a region hits, the lookups
+    still in flight finish within one request timeout instead of backing
+    off and retrying in the background (and holding up interpreter exit).
+
+    Args:
+        regions: Region codes in preference order
+        fetch_region: Looks up one region, returning None on a miss. The
+            second argument says whether to retry transient failures. Any
+            exception it raises propagates to the caller.
+
+    Returns:
+        Tuple of (data, region) or None if no region had data.
+    """
+    if not regions:
+        return None
+
+    primary, *fallbacks = regions
+    data = fetch_region(primary, True)
+    if data:
+        return data, primary
+    if not fallbacks:
+        return None
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(fallbacks), _REGION_FANOUT_WORKERS),
+        thread_name_prefix="audnex-region",
+    )
+    try:
+        futures = [executor.submit(fetch_region, r, False) for r in fallbacks]
+        for r, future in zip(fallbacks, futures, strict=True):
+            data = future.result()
+            if data:
+                return data, r
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+# Audnex metadata for an ASIN rarely changes, so successful responses are kept
+# on disk for audnex.cache_ttl_seconds and re-runs skip the network entirely.
+# A bounded in-process layer in front of the disk cache serves repeat lookups
+# within a run without re-reading the file. It keeps the encoded cache entry,
+# not the parsed dict, so every hit decodes a fresh copy the caller is free to
+# mutate (release metadata, builders and exporters all edit these dicts).
+
+_MEMORY_CACHE_MAXSIZE = 4096
+
+# (kind, asin) -> (expires_at, encoded {"region", "data"} entry, region)
+_memory_cache: dict[tuple[str, str], tuple[float, bytes, str]] = {}
+_memory_cache_lock = threading.Lock()
+
+# Authoritative misses (404/500) per region are remembered for a day so the
+# fallback doesn't re-probe regions known not to carry an ASIN.
+# (kind, asin, region) -> expires_at
+_MISS_CACHE_TTL_SECONDS = 86400
+_miss_cache: dict[tuple[str, str, str], float] = {}
+
+# Set to 1/true/yes to bypass both cache layers without editing config
+_CACHE_DISABLE_ENV = "SHELFR_AUDNEX_CACHE_DISABLE"
+
+
+def _cache_path(kind: str, asin: str) -> Path:
+    """Get the on-disk cache file for an Audnex response."""
+    return cache_dir() / "audnex" / f"{kind}_{asin}.json"
+
+
+def _cache_disabled() -> bool:
+    """Check the SHELFR_AUDNEX_CACHE_DISABLE escape hatch (read on every lookup)."""
+    return os.environ.get(_CACHE_DISABLE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _remember(kind: str, asin: str, region: str, entry: bytes, expires_at: float) -> None:
+    """Store an encoded cache entry in-process, evicting the oldest entry when full."""
+    key = (kind, asin)
+    with _memory_cache_lock:
+        _memory_cache.pop(key, None)
+        if len(_memory_cache) >= _MEMORY_CACHE_MAXSIZE:
+            del _memory_cache[next(iter(_memory_cache))]
+        _memory_cache[key] = (expires_at, entry, region)
+
+
+def _clear_memory_cache() -> None:
+    """Drop every in-process cache entry and known miss (the disk cache is left alone)."""
+    with _memory_cache_lock:
+        _memory_cache.clear()
+        _miss_cache.clear()
+
+
+def _record_miss(kind: str, asin: str, region: str) -> None:
+    """Remember that a region authoritatively has no data for an ASIN."""
+    key = (kind, asin, region)
+    with _memory_cache_lock:
+        _miss_cache.pop(key, None)
+        if len(_miss_cache) >= _MEMORY_CACHE_MAXSIZE:
+            del _miss_cache[next(iter(_miss_cache))]
+        _miss_cache[key] = time.time() + _MISS_CACHE_TTL_SECONDS
+
+
+def _is_known_miss(kind: str, asin: str, region: str, ttl: int) -> bool:
+    """
+    Check whether a region recently returned "not found" for an ASIN.
+
+    Honours the same switches as the response cache: ttl <= 0 or
+    SHELFR_AUDNEX_CACHE_DISABLE turn it off.
+    """
+    if ttl <= 0 or _cache_disabled():
+        return False
+    with _memory_cache_lock:
+        expires_at = _miss_cache.get((kind, asin, region))
+    if expires_at is None or expires_at <= time.time():
+        return False
+    logger.debug(f"Skipping Audnex {kind} lookup for {asin} (known miss in region {region})")
+    return True
+
+
+def invalidate_cache(asin: str) -> None:
+    """
+    Evict all cached Audnex responses for an ASIN.
+
+    Removes the book, chapters and author entries (including remembered
+    region misses) from both the in-process and on-disk caches, so the next
+    lookup goes to the network.
+
+    Args:
+        asin: Book or author ASIN to evict
+    """
+    for kind in _CACHE_KINDS:
+        with _memory_cache_lock:
+            _memory_cache.pop((kind, asin), None)
+            for key in [k for k in _miss_cache if k[:2] == (kind, asin)]:
+                del _miss_cache[key]
+        with contextlib.suppress(OSError):
+            _cache_path(kind, asin).unlink(missing_ok=True)
+    logger.debug(f"Invalidated Audnex cache for {asin}")
+
+
+def _read_cache(
+    kind: str, asin: str, region: str | None, ttl: int
+) -> tuple[dict[str, Any], str] | None:
+    """
+    Load a cached Audnex response if present and fresh.
+
+    Args:
+        kind: Response kind ("book", "chapters" or "author")
+        asin: ASIN the response was fetched for
+        region: Required region, or None to accept any cached region
+        ttl: Maximum age in seconds (0 disables the cache)
+
+    Returns:
+        Tuple of (data, region) on a cache hit, None otherwise.
+    """
+    if ttl <= 0 or _cache_disabled():
+        return None
+
+    now = time.time()
+    with _memory_cache_lock:
+        remembered = _memory_cache.get((kind, asin))
+    if remembered and remembered[0] > now and (not region or remembered[2] == region):
+        data: dict[str, Any] = jsonio.loads(remembered[1])["data"]
+        return data, remembered[2]
+
+    path = _cache_path(kind, asin)
+    try:
+        mtime = path.stat().st_mtime
+        if now - mtime > ttl:
+            return None
+        raw = path.read_bytes()
+        entry = jsonio.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+        return None
+    cached_region = entry.get("region")
+    if not isinstance(cached_region, str) or (region and cached_region != region):
+        return None
+
+    logger.debug(f"Audnex {kind} cache hit for {asin} (region={cached_region})")
+    _remember(kind, asin, cached_region, raw, mtime + ttl)
+    return entry["data"], cached_region
+
+
+def _write_cache(kind: str, asin: str, region: str, data: dict[str, Any], ttl: int) -> None:
+    """
+    Store a successful Audnex response in the on-disk cache.
+
+    Written to a temp file and swapped in with os.replace() so a concurrent
+    reader never sees a partial file. Failures are logged and ignored.
+    """
+    if ttl <= 0 or _cache_disabled():
+        return
+
+    # Encoding also snapshots the response, so callers mutating data later
+    # can't change what the cache hands out
+    entry = jsonio.dumps({"region": region, "data": data}).encode()
+    _remember(kind, asin, region, entry, time.time() + ttl)
+
+    path = _cache_path(kind, asin)
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(entry)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug(f"Failed to write Audnex cache for {asin}: {e}")
+        temp_path.unlink(missing_ok=True)
+
+
+# =============================================================================
+# Response Validation
+# =============================================================================
+
+# Schema validation only produces warnings, so it runs on a background worker
+# instead of delaying the fetch that is waiting on the response.
+_validation_executor: ThreadPoolExecutor | None = None
+_validation_executor_lock = threading.Lock()
+
+
+def _validate_response(kind: str, asin: str, data: dict[str, Any]) -> None:
+    """Validate an Audnex response and log (never raise) on mismatch."""
+    validator = validate_audnex_book if kind == "book" else validate_audnex_chapters
+    try:
+        validator(data)
+    except Exception as validation_error:
+        logger.warning(f"Audnex {kind} response validation warning for {asin}: {validation_error}")
+
+
+def _validate_in_background(kind: str, asin: str, data: dict[str, Any]) -> Future[None]:
+    """
+    Queue response validation on the shared background worker.
+
+    Args:
+        kind: Response kind ("book" or "chapters")
+        asin: ASIN the response was fetched for (for log messages)
+        data: Parsed response to validate
+
+    Returns:
+        Future for the validation (callers normally ignore it).
+    """
+    global _validation_executor
+    with _validation_executor_lock:
+        if _validation_executor is None:
+            _validation_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="audnex-validate"
+            )
+        return _validation_executor.submit(_validate_response, kind, asin, data)
+
 
 # =============================================================================
 # Book Metadata
@@ -61,6 +415,7 @@ def _fetch_audnex_book_region(
 
     Raises:
         CircuitOpenError: If Audnex API circuit breaker is open.
+        RetryableError: On 502/503/504 (will be retried by decorator).
         httpx.TimeoutException: On timeout (will be retried by decorator).
         httpx.ConnectError: On connection failure (will be retried by decorator).
     """
@@ -71,16 +426,18 @@ def _fetch_audnex_book_region(
 
     # Circuit breaker protects against cascading failures
     # Only network-level errors trip the breaker (not 404s which are normal)
-    with audnex_breaker, httpx.Client(timeout=timeout, http2=True) as client:
-        response = client.get(url, params=params)
+    with audnex_breaker:
+        response = _get_client(timeout).get(url, params=params)
 
         # 404/500 are authoritative "not found" - don't retry
         if response.status_code == 404:
             logger.debug(f"ASIN {asin} not found in region {region}")
+            _record_miss("book", asin, region)
             return None
 
         if response.status_code == 500:
             logger.debug(f"ASIN {asin} returned 500 for region {region} (likely not available)")
+            _record_miss("book", asin, region)
             return None
 
         # 401/403/429 are auth/rate limit - don't retry, return None
@@ -93,17 +450,17 @@ def _fetch_audnex_book_region(
             )
             return None
 
-        # Other HTTP errors - raise for retry
+        # Gateway errors are transient - raise for retry
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise RetryableError(
+                f"Audnex returned {response.status_code} for book {asin} (region={region})"
+            )
+
         response.raise_for_status()
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = jsonio.loads(response.content)
 
-        # Validate response structure (warns but doesn't fail)
-        try:
-            validate_audnex_book(data)
-        except ValidationError as validation_error:
-            logger.warning(
-                f"Audnex book response validation warning for {asin}: {validation_error}"
-            )
+        # Validate response structure off the fetch path (warns but doesn't fail)
+        _validate_in_background("book", asin, data)
 
         return data
 
@@ -115,7 +472,8 @@ def fetch_audnex_book(
     Fetch book metadata from Audnex API with region fallback.
 
     Tries configured regions in order until one succeeds. Some ASINs are
-    region-specific (e.g., B0BN2HMHZ8 only exists in US region).
+    region-specific (e.g., B0BN2HMHZ8 only exists in US region). Successful
+    responses are cached on disk for audnex.cache_ttl_seconds.
 
     Args:
         asin: Audible ASIN (e.g., "B000SEI1RG")
@@ -125,13 +483,20 @@ def fetch_audnex_book(
         Tuple of (parsed JSON response or None, region found in or None).
         The region is useful for ASIN normalization to a preferred region.
     """
-    settings = get_settings()
+    audnex_config = get_settings().audnex
+    ttl = audnex_config.cache_ttl_seconds
+
+    cached = _read_cache("book", asin, region, ttl)
+    if cached:
+        return cached
 
     # If specific region requested, only try that one
     if region:
+        if _is_known_miss("book", asin, region, ttl):
+            return None, None
         try:
             data = _fetch_audnex_book_region(
-                asin, region, settings.audnex.base_url, settings.audnex.timeout_seconds
+                asin, region, audnex_config.base_url, audnex_config.timeout_seconds
             )
         except Exception as e:
             # Handles failures after retries exhausted or immediate exceptions
@@ -141,39 +506,136 @@ def fetch_audnex_book(
 
         if data:
             logger.info(f"Fetched Audnex metadata for ASIN: {asin} (region={region})")
+            _write_cache("book", asin, region, data, ttl)
             return data, region
         logger.warning(f"ASIN {asin} not found in region {region}")
         return None, None
 
-    # Try each configured region in order
-    regions = settings.audnex.regions
-    for r in regions:
+    def _try_region(r: str, retry: bool) -> dict[str, Any] | None:
+        fetch = _fetch_audnex_book_region if retry else _single_attempt(_fetch_audnex_book_region)
         try:
-            data = _fetch_audnex_book_region(
-                asin, r, settings.audnex.base_url, settings.audnex.timeout_seconds
-            )
+            return fetch(asin, r, audnex_config.base_url, audnex_config.timeout_seconds)
         except CircuitOpenError:
             # Circuit open - skip to next region
             logger.debug(f"Circuit open for region {r}, trying next")
-            continue
+            return None
         except Exception as e:
             # After retries exhausted, try next region
             logger.debug(f"Failed to fetch book {asin} from region {r}: {e}")
-            continue
+            return None
 
-        if data:
-            logger.info(f"Fetched Audnex metadata for ASIN: {asin} (region={r})")
-            return data, r
+    # Try configured regions in preference order, skipping known misses
+    regions = audnex_config.regions
+    candidates = [r for r in regions if not _is_known_miss("book", asin, r, ttl)]
+    hit = _first_region_hit(candidates, _try_region)
+    if hit:
+        data, r = hit
+        logger.info(f"Fetched Audnex metadata for ASIN: {asin} (region={r})")
+        _write_cache("book", asin, r, data, ttl)
+        return data, r
 
     logger.warning(f"ASIN {asin} not found in any configured region: {regions}")
     return None, None
 
 
+async def fetch_audnex_books_batch(
+    asins: Iterable[str],
+    *,
+    max_concurrency: int = 16,
+) -> dict[str, tuple[dict[str, Any] | None, str | None]]:
+    """
+    Fetch book metadata for several ASINs concurrently.
+
+    Each lookup runs fetch_audnex_book() (region fallback, retries, circuit
+    breaker) in a worker thread over the shared connection pool, so total
+    wall time approaches the slowest lookup rather than the sum of all.
+
+    Args:
+        asins: ASINs to look up (duplicates are fetched once)
+        max_concurrency: Maximum number of lookups in flight at once
+
+    Returns:
+        Dict mapping each ASIN to its (data, region) tuple, as returned by
+        fetch_audnex_book(). Failed lookups map to (None, None).
+    """
+    unique = list(dict.fromkeys(asins))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(asin: str) -> tuple[dict[str, Any] | None, str | None]:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(fetch_audnex_book, asin)
+            except Exception as e:
+                logger.warning(f"Failed to fetch book {asin}: {e}")
+                return None, None
+
+    results = await asyncio.gather(*(_fetch(asin) for asin in unique))
+    return dict(zip(unique, results, strict=True))
+
+
 # =============================================================================
 # Author Metadata
 # =============================================================================
 
 
+@retry_with_backoff(
+    max_retries=3,
+    base_delay=1.0,
+    max_delay=10.0,
+    retry_exceptions=NETWORK_EXCEPTIONS,
+)
+def _fetch_audnex_author_region(
+    asin: str,
+    region: str,
+    base_url: str,
+    timeout: int,
+) -> dict[str, Any] | None:
+    """
+    Fetch author metadata from Audnex API for a specific region.
+
+    Internal helper - use fetch_audnex_author() which handles region fallback.
+
+    Args:
+        asin: Author ASIN
+        region: Region code
+        base_url: Audnex API base URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        Parsed JSON response or None if not found (404/500).
+
+    Raises:
+        CircuitOpenError: If Audnex API circuit breaker is open.
+        httpx.HTTPStatusError: On non-retryable HTTP errors (e.g. 401/403/429).
+        RetryableError: On 502/503/504 (will be retried by decorator).
+        httpx.TimeoutException: On timeout (will be retried by decorator).
+    """
+    url = f"{base_url}/authors/{asin}"
+    params = {"region": region}
+
+    logger.debug(f"Fetching Audnex author: {url} (region={region})")
+
+    # Circuit breaker protects against cascading failures
+    with audnex_breaker:
+        response = _get_client(timeout).get(url, params=params)
+
+        if response.status_code in (404, 500):
+            # Expected "not found" - keep at debug level
+            logger.debug(f"Author ASIN {asin} not found in region {region}")
+            _record_miss("author", asin, region)
+            return None
+
+        # Gateway errors are transient - raise for retry
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise RetryableError(
+                f"Audnex returned {response.status_code} for author {asin} (region={region})"
+            )
+
+        response.raise_for_status()
+        data: dict[str, Any] = jsonio.loads(response.content)
+        return data
+
+
 def fetch_audnex_author(asin: str, region: str | None = None) -> dict[str, Any] | None:
     """
     Fetch author metadata from Audnex API with region fallback.
@@ -185,37 +647,26 @@ def fetch_audnex_author(asin: str, region: str | None = None) -> dict[str, Any]
     Returns:
         Parsed JSON response or None if not found.
     """
-    settings = get_settings()
-
-    def _try_region(r: str) -> dict[str, Any] | None:
-        url = f"{settings.audnex.base_url}/authors/{asin}"
-        params = {"region": r}
+    audnex_config = get_settings().audnex
+    ttl = audnex_config.cache_ttl_seconds
 
-        logger.debug(f"Fetching Audnex author: {url} (region={r})")
+    cached = _read_cache("author", asin, region, ttl)
+    if cached:
+        return cached[0]
 
+    def _try_region(r: str, retry: bool) -> dict[str, Any] | None:
+        fetch = (
+            _fetch_audnex_author_region if retry else _single_attempt(_fetch_audnex_author_region)
+        )
         try:
-            # Circuit breaker protects against cascading failures
-            with (
-                audnex_breaker,
-                httpx.Client(timeout=settings.audnex.timeout_seconds, http2=True) as client,
-            ):
-                response = client.get(url, params=params)
-
-                if response.status_code in (404, 500):
-                    # Expected "not found" - keep at debug level
-                    logger.debug(f"Author ASIN {asin} not found in region {r}")
-                    return None
-
-                response.raise_for_status()
-                data: dict[str, Any] = response.json()
-                return data
+            return fetch(asin, r, audnex_config.base_url, audnex_config.timeout_seconds)
 
         except CircuitOpenError:
             # Re-raise circuit breaker errors - caller should handle
             raise
 
         except httpx.TimeoutException:
-            # Network issue - warn since this may indicate a problem
+            # Network issue (after retries) - warn since this may indicate a problem
             logger.warning(f"Timeout fetching author metadata for {asin} (region={r})")
             return None
 
@@ -241,17 +692,22 @@ def fetch_audnex_author(asin: str, region: str | None = None) -> dict[str, Any]
 
     # If specific region requested, only try that one
     if region:
-        data = _try_region(region)
+        if _is_known_miss("author", asin, region, ttl):
+            return None
+        data = _try_region(region, True)
         if data:
             logger.info(f"Fetched Audnex author: {asin} (region={region})")
+            _write_cache("author", asin, region, data, ttl)
         return data
 
-    # Try each configured region in order
-    for r in settings.audnex.regions:
-        data = _try_region(r)
-        if data:
-            logger.info(f"Fetched Audnex author: {asin} (region={r})")
-            return data
+    # Try configured regions in preference order, skipping known misses
+    candidates = [r for r in audnex_config.regions if not _is_known_miss("author", asin, r, ttl)]
+    hit = _first_region_hit(candidates, _try_region)
+    if hit:
+        data, r = hit
+        logger.info(f"Fetched Audnex author: {asin} (region={r})")
+        _write_cache("author", asin, r, data, ttl)
+        return data
 
     logger.warning(f"Author ASIN {asin} not found in any configured region")
     return None
@@ -290,6 +746,7 @@ def _fetch_audnex_chapters_region(
 
     Raises:
         CircuitOpenError: If Audnex API circuit breaker is open.
+        RetryableError: On 502/503/504 (will be retried by decorator).
         httpx.TimeoutException: On timeout (will be retried by decorator).
         httpx.ConnectError: On connection failure (will be retried by decorator).
     """
@@ -299,16 +756,18 @@ def _fetch_audnex_chapters_region(
     logger.debug(f"Fetching Audnex chapters: {url} (region={region})")
 
     # Circuit breaker protects against cascading failures
-    with audnex_breaker, httpx.Client(timeout=timeout, http2=True) as client:
-        response = client.get(url, params=params)
+    with audnex_breaker:
+        response = _get_client(timeout).get(url, params=params)
 
         # 404/500 are authoritative "not found" - don't retry
         if response.status_code == 404:
             logger.debug(f"Chapters for {asin} not found in region {region}")
+            _record_miss("chapters", asin, region)
             return None
 
         if response.status_code == 500:
             logger.debug(f"Chapters for {asin} returned 500 for region {region}")
+            _record_miss("chapters", asin, region)
             return None
 
         # 401/403/429 are auth/rate limit - don't retry, return None
@@ -321,17 +780,17 @@ def _fetch_audnex_chapters_region(
             )
             return None
 
-        # Other HTTP errors - raise for retry
+        # Gateway errors are transient - raise for retry
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise RetryableError(
+                f"Audnex returned {response.status_code} for chapters {asin} (region={region})"
+            )
+
         response.raise_for_status()
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = jsonio.loads(response.content)
 
-        # Validate response structure (warns but doesn't fail)
-        try:
-            validate_audnex_chapters(data)
-        except Exception as validation_error:
-            logger.warning(
-                f"Audnex chapters response validation warning for {asin}: {validation_error}"
-            )
+        # Validate response structure off the fetch path (warns but doesn't fail)
+        _validate_in_background("chapters", asin, data)
 
         return data
 
@@ -340,6 +799,8 @@ def fetch_audnex_chapters(asin: str, region: str | None = None) -> dict[str, Any
     """
     Fetch chapter data from Audnex API with region fallback.
 
+    Successful responses are cached like book metadata.
+
     Args:
         asin: Audible ASIN (e.g., "B000SEI1RG")
         region: Optional specific region to try (skips fallback if provided)
@@ -350,13 +811,20 @@ def fetch_audnex_chapters(asin: str, region: str | None = None) -> dict[str, Any
         chapters (list with lengthMs, startOffsetMs, startOffsetSec, title),
         runtimeLengthMs, runtimeLengthSec
     """
-    settings = get_settings()
+    audnex_config = get_settings().audnex
+    ttl = audnex_config.cache_ttl_seconds
+
+    cached = _read_cache("chapters", asin, region, ttl)
+    if cached:
+        return cached[0]
 
     # If specific region requested, only try that one
     if region:
+        if _is_known_miss("chapters", asin, region, ttl):
+            return None
         try:
             data = _fetch_audnex_chapters_region(
-                asin, region, settings.audnex.base_url, settings.audnex.timeout_seconds
+                asin, region, audnex_config.base_url, audnex_config.timeout_seconds
             )
         except Exception as e:
             # Handles failures after retries exhausted or immediate exceptions
@@ -369,28 +837,33 @@ def fetch_audnex_chapters(asin: str, region: str | None = None) -> dict[str, Any
             logger.info(
                 f"Fetched {chapter_count} chapters from Audnex for ASIN: {asin} (region={region})"
             )
+            _write_cache("chapters", asin, region, data, ttl)
         return data
 
-    # Try each configured region in order
-    regions = settings.audnex.regions
-    for r in regions:
+    def _try_region(r: str, retry: bool) -> dict[str, Any] | None:
+        fetch = (
+            _fetch_audnex_chapters_region
+            if retry
+            else _single_attempt(_fetch_audnex_chapters_region)
+        )
         try:
-            data = _fetch_audnex_chapters_region(
-                asin, r, settings.audnex.base_url, settings.audnex.timeout_seconds
-            )
+            return fetch(asin, r, audnex_config.base_url, audnex_config.timeout_seconds)
         except CircuitOpenError:
             logger.debug(f"Circuit open for region {r}, trying next")
-            continue
+            return None
         except Exception as e:
             logger.debug(f"Failed to fetch chapters {asin} from region {r}: {e}")
-            continue
+            return None
 
-        if data:
-            chapter_count = len(data.get("chapters", []))
-            logger.info(
-                f"Fetched {chapter_count} chapters from Audnex for ASIN: {asin} (region={r})"
-            )
-            return data
+    # Try configured regions in preference order, skipping known misses
+    candidates = [r for r in audnex_config.regions if not _is_known_miss("chapters", asin, r, ttl)]
+    hit = _first_region_hit(candidates, _try_region)
+    if hit:
+        data, r = hit
+        chapter_count = len(data.get("chapters", []))
+        logger.info(f"Fetched {chapter_count} chapters from Audnex for ASIN: {asin} (region={r})")
+        _write_cache("chapters", asin, r, data, ttl)
+        return data
 
     logger.warning(f"Chapters for ASIN {asin} not found in any configured region")
     return None
@@ -405,8 +878,7 @@ def save_audnex_json(data: dict[str, Any], output_path: Path) -> None:
     """Write Audnex metadata to JSON file."""
     from shelfr.utils.permissions import fix_ownership
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    jsonio.write_json(data, output_path)
 
     # Fix ownership to target UID:GID (e.g., Unraid's nobody:users)
     settings = get_settings()
@@ -20,6 +20,8 @@ from __future__ import annotations
 # Re-export cleaning functions from utils.naming
 # These are the functions most commonly used by metadata code
 from shelfr.utils.naming import (
+    # Translate table used by sanitize_filename
+    NORMALIZE_TRANS,
     # Normalization
     clean_series_name,
     # String utilities
@@ -68,6 +70,7 @@ __all__ = [
     "sanitize_filename",
     "transliterate_text",
     "truncate_filename",
+    "NORMALIZE_TRANS",
     # MediaInfo extraction
     "extract_non_authors_from_mediainfo",
     "extract_translators_from_mediainfo",
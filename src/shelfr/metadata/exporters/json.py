@@ -11,6 +11,7 @@ All writes go through write_abs_metadata_json() to enforce title validation.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,18 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _year_from_prefix(prefix: str) -> int | None:
+    """Parse the 4-character year prefix of a date string.
+
+    Cached because release dates repeat heavily across a series or catalog.
+    """
+    try:
+        return int(prefix)
+    except ValueError:
+        return None
+
+
 class JsonExporter:
     """Exporter for ABS metadata.json sidecar format.
 
@@ -146,9 +159,7 @@ class JsonExporter:
         genres = self._extract_names(fields.get("genres", []))
 
         # Tags - populate with Adult flag (matches OPF pattern)
-        tags: list[str] = []
-        if fields.get("is_adult"):
-            tags.append("Adult")
+        tags: list[str] = ["Adult"] if explicit else []
 
         # Date fields - ABS uses publishedYear and publishedDate
         published_year: str | None = None
@@ -192,14 +203,20 @@ class JsonExporter:
         Returns:
             List of name strings
         """
-        names = []
+        names: list[str] = []
+        append = names.append
         for item in items:
-            if isinstance(item, str):
-                names.append(item)
-            elif hasattr(item, "name"):
-                names.append(item.name)
-            elif isinstance(item, dict) and "name" in item:
-                names.append(item["name"])
+            if type(item) is str:
+                append(item)
+                continue
+            try:
+                # Person/Genre objects (the common case) - one attribute load
+                append(item.name)
+            except AttributeError:
+                if isinstance(item, str):
+                    append(item)  # str subclass
+                elif isinstance(item, dict) and "name" in item:
+                    append(item["name"])
         return names
 
     def _extract_year(self, date_value: Any) -> int | None:
@@ -221,10 +238,7 @@ class JsonExporter:
 
         # Handle string dates (ISO format: YYYY-MM-DD or YYYY)
         if isinstance(date_value, str) and len(date_value) >= 4:
-            try:
-                return int(date_value[:4])
-            except ValueError:
-                pass
+            return _year_from_prefix(date_value[:4])
 
         return None
 
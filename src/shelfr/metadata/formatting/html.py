@@ -6,9 +6,45 @@ from __future__ import annotations
 
 import html as html_lib
 import re
+import warnings
 
 __all__ = ["html_to_bbcode"]
 
+# Inline formatting tags -> BBCode tag name (<strong> and <b> both become [b], ...)
+_FORMAT_TAG_MAP = {
+    "b": "b",
+    "strong": "b",
+    "i": "i",
+    "em": "i",
+    "u": "u",
+    "s": "s",
+    "strike": "s",
+}
+# Group 1: opening tag name (attributes allowed), group 2: bare closing tag name
+_FORMAT_TAG_PATTERN = re.compile(
+    r"<(?:(b|strong|i|em|u|s|strike)\b[^>]*|/(b|strong|i|em|u|s|strike))>", re.IGNORECASE
+)
+_ANCHOR_HREF_PATTERN = re.compile(
+    r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL
+)
+_ANCHOR_PATTERN = re.compile(r"<a\s+[^>]*>(.*?)</a>", re.IGNORECASE | re.DOTALL)
+_EXCESS_BR_PATTERN = re.compile(r"(\[br\]){3,}")
+
+# Patterns shared by html_to_bbcode() and _clean_html()
+_P_CLOSE_PATTERN = re.compile(r"</p>\s*", re.IGNORECASE)
+_P_OPEN_PATTERN = re.compile(r"<p[^>]*>", re.IGNORECASE)
+_BR_TAG_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_HSPACE_PATTERN = re.compile(r"[ \t]+")
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
+def _format_tag_to_bbcode(match: re.Match[str]) -> str:
+    """Map a matched HTML formatting tag to its BBCode equivalent."""
+    if match[1]:
+        return f"[{_FORMAT_TAG_MAP[match[1].lower()]}]"
+    return f"[/{_FORMAT_TAG_MAP[match[2].lower()]}]"
+
 
 def html_to_bbcode(text: str) -> str:
     """
@@ -37,54 +73,30 @@ def html_to_bbcode(text: str) -> str:
     """
     # Convert anchor tags to BBCode [url=...] format
     # Match <a href="URL"> or <a href='URL'> with optional other attributes
-    text = re.sub(
-        r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>',
-        r"[url=\1]\2[/url]",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    text = _ANCHOR_HREF_PATTERN.sub(r"[url=\1]\2[/url]", text)
     # Handle anchor tags without href (just keep inner text)
-    text = re.sub(r"<a\s+[^>]*>(.*?)</a>", r"\1", text, flags=re.IGNORECASE | re.DOTALL)
-
-    # Convert bold tags to BBCode
-    text = re.sub(r"<b\b[^>]*>", "[b]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</b>", "[/b]", text, flags=re.IGNORECASE)
-    text = re.sub(r"<strong\b[^>]*>", "[b]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</strong>", "[/b]", text, flags=re.IGNORECASE)
-
-    # Convert italic tags to BBCode
-    text = re.sub(r"<i\b[^>]*>", "[i]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</i>", "[/i]", text, flags=re.IGNORECASE)
-    text = re.sub(r"<em\b[^>]*>", "[i]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</em>", "[/i]", text, flags=re.IGNORECASE)
-
-    # Convert underline tags to BBCode
-    text = re.sub(r"<u\b[^>]*>", "[u]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</u>", "[/u]", text, flags=re.IGNORECASE)
-
-    # Convert strikethrough tags to BBCode
-    text = re.sub(r"<s\b[^>]*>", "[s]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</s>", "[/s]", text, flags=re.IGNORECASE)
-    text = re.sub(r"<strike\b[^>]*>", "[s]", text, flags=re.IGNORECASE)
-    text = re.sub(r"</strike>", "[/s]", text, flags=re.IGNORECASE)
+    text = _ANCHOR_PATTERN.sub(r"\1", text)
+
+    # Convert bold/italic/underline/strikethrough tags to BBCode in one pass
+    text = _FORMAT_TAG_PATTERN.sub(_format_tag_to_bbcode, text)
 
     # Convert paragraph breaks to [br][br] for MAM
     # Handle both </p> and <p> as paragraph boundaries
-    text = re.sub(r"</p>\s*", "[br][br]", text, flags=re.IGNORECASE)
-    text = re.sub(r"<p[^>]*>", "", text, flags=re.IGNORECASE)
+    text = _P_CLOSE_PATTERN.sub("[br][br]", text)
+    text = _P_OPEN_PATTERN.sub("", text)
 
     # Convert <br> tags to [br]
-    text = re.sub(r"<br\s*/?>", "[br]", text, flags=re.IGNORECASE)
+    text = _BR_TAG_PATTERN.sub("[br]", text)
 
     # Remove any remaining HTML tags (that we don't support)
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _HTML_TAG_PATTERN.sub("", text)
 
     # Decode HTML entities (handles &amp;, &lt;, &#39;, etc.)
     text = html_lib.unescape(text)
 
     # Clean up excessive whitespace
-    text = re.sub(r"[ \t]+", " ", text)  # Collapse horizontal whitespace
-    text = re.sub(r"(\[br\]){3,}", "[br][br]", text)  # Max 2 [br] tags
+    text = _HSPACE_PATTERN.sub(" ", text)  # Collapse horizontal whitespace
+    text = _EXCESS_BR_PATTERN.sub("[br][br]", text)  # Max 2 [br] tags
     return text.strip()
 
 
@@ -101,8 +113,6 @@ def _clean_html(text: str) -> str:
     Converts HTML paragraphs to newlines, strips remaining tags,
     and decodes HTML entities.
     """
-    import warnings
-
     warnings.warn(
         "_clean_html is deprecated, use html_to_bbcode() instead",
         DeprecationWarning,
@@ -110,15 +120,15 @@ def _clean_html(text: str) -> str:
     )
     # Convert paragraph breaks to double newlines (before stripping tags)
     # Handle both </p> and <p> as paragraph boundaries
-    text = re.sub(r"</p>\s*", "\n\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<p[^>]*>", "", text, flags=re.IGNORECASE)
+    text = _P_CLOSE_PATTERN.sub("\n\n", text)
+    text = _P_OPEN_PATTERN.sub("", text)
     # Convert <br> tags to single newlines
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
+    text = _BR_TAG_PATTERN.sub("\n", text)
     # Remove remaining HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _HTML_TAG_PATTERN.sub("", text)
     # Decode HTML entities (handles &amp;, &lt;, &#39;, etc.)
     text = html_lib.unescape(text)
     # Clean up excessive whitespace while preserving intentional newlines
-    text = re.sub(r"[ \t]+", " ", text)  # Collapse horizontal whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)  # Max 2 newlines (1 blank line)
+    text = _HSPACE_PATTERN.sub(" ", text)  # Collapse horizontal whitespace
+    text = _EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Max 2 newlines (1 blank line)
     return text.strip()
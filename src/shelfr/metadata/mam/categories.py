@@ -7,6 +7,7 @@ classification.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Any
@@ -129,6 +130,28 @@ def _infer_fiction_or_nonfiction(audnex_data: dict[str, Any]) -> int:
     return 1
 
 
+@functools.lru_cache(maxsize=16)
+def _word_boundary_patterns(
+    keys: tuple[str, ...], min_length: int = 0
+) -> tuple[tuple[str, re.Pattern[str]], ...]:
+    """
+    Compile word-boundary patterns for keyword matching against genre text.
+
+    Cached per key tuple so patterns are built once per loaded map rather
+    than on every release.
+
+    Args:
+        keys: Map keys in map order (order matters - first match wins)
+        min_length: Skip keys shorter than this (reduces collision risk)
+
+    Returns:
+        Tuple of (key, compiled pattern) pairs in the same order.
+    """
+    return tuple(
+        (key, re.compile(rf"\b{re.escape(key)}\b")) for key in keys if len(key) >= min_length
+    )
+
+
 def _get_audiobook_category(audnex_data: dict[str, Any], is_fiction: bool) -> str:
     """
     Determine the MAM audiobook category string from genres.
@@ -176,16 +199,16 @@ def _get_audiobook_category(audnex_data: dict[str, Any], is_fiction: bool) -> st
     if not category_map:
         return default_category
 
-    # Build genre text for matching
+    # Build genre text for matching (lowercased once for all keywords)
     genres = audnex_data.get("genres", [])
-    genre_names_lower = [g.get("name", "").lower() for g in genres]
-    all_genre_text = " ".join(genre_names_lower)
+    all_genre_text = " ".join(g.get("name", "") for g in genres).lower()
 
     # Check each keyword in the map (order matters - first match wins)
     # Use word boundary matching to avoid false positives (e.g., "art" in "martial")
-    for keyword, category in category_map.items():
-        if re.search(rf"\b{re.escape(keyword)}\b", all_genre_text):
-            return category
+    for keyword, pattern in _word_boundary_patterns(tuple(category_map)):
+        # Cheap substring check first; regex only confirms the boundaries
+        if keyword in all_genre_text and pattern.search(all_genre_text):
+            return category_map[keyword]
 
     return default_category
 
@@ -212,6 +235,7 @@ def _map_genres_to_categories(genres: list[dict[str, Any]]) -> list[int]:
         return []
 
     categories: set[int] = set()
+    fallback_patterns: tuple[tuple[str, re.Pattern[str]], ...] | None = None
 
     for genre in genres:
         name = genre.get("name", "").lower().strip()
@@ -244,9 +268,12 @@ def _map_genres_to_categories(genres: list[dict[str, Any]]) -> list[int]:
         # (e.g., "art" matching "artificial intelligence")
         # Only try keys with 4+ characters to reduce collision risk
         if not matched:
-            for key, cat_id in category_map.items():
-                if len(key) >= 4 and re.search(rf"\b{re.escape(key)}\b", name):
-                    categories.add(cat_id)
+            if fallback_patterns is None:
+                fallback_patterns = _word_boundary_patterns(tuple(category_map), 4)
+            for key, pattern in fallback_patterns:
+                # Cheap substring check first; regex only confirms the boundaries
+                if key in name and pattern.search(name):
+                    categories.add(category_map[key])
                     break
 
     return sorted(categories)
@@ -7,7 +7,6 @@ combining Audnex API data, MediaInfo technical metadata, and BBCode descriptions
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,6 +21,7 @@ from shelfr.metadata.mam.categories import (
 )
 from shelfr.metadata.mediainfo import _extract_audio_info, _parse_chapters_from_mediainfo
 from shelfr.models import NormalizedBook
+from shelfr.utils import jsonio
 from shelfr.utils.naming import (
     extract_translators_from_mediainfo,
     filter_authors,
@@ -106,7 +106,7 @@ def _get_mediainfo_string(mediainfo_data: dict[str, Any] | None) -> str | None:
     """
     if not mediainfo_data:
         return None
-    return json.dumps(mediainfo_data, ensure_ascii=False)
+    return jsonio.dumps(mediainfo_data)
 
 
 def build_mam_json(
@@ -175,20 +175,21 @@ def build_mam_json(
                 "Filtering translators from MediaInfo in MAM JSON: %s",
                 mediainfo_translators,
             )
-            filtered_authors = [
-                a for a in filtered_authors if a.get("name", "") not in mediainfo_translators
-            ]
-        author_names = [a.get("name", "") for a in filtered_authors if a.get("name")]
         # Transliterate Japanese/foreign names
-        mam_json["authors"] = [transliterate_text(name, filters) for name in author_names]
+        mam_json["authors"] = [
+            transliterate_text(name, filters)
+            for a in filtered_authors
+            if (name := a.get("name")) and name not in mediainfo_translators
+        ]
     elif release.author:
         mam_json["authors"] = [transliterate_text(release.author, filters)]
 
     # Narrators (also transliterate)
     narrators = audnex.get("narrators", [])
     if narrators:
-        narrator_names = [n.get("name", "") for n in narrators if n.get("name")]
-        mam_json["narrators"] = [transliterate_text(name, filters) for name in narrator_names]
+        mam_json["narrators"] = [
+            transliterate_text(name, filters) for n in narrators if (name := n.get("name"))
+        ]
     elif release.narrator:
         mam_json["narrators"] = [transliterate_text(release.narrator, filters)]
 
@@ -455,8 +456,7 @@ def save_mam_json(
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(mam_data, f, indent=2, ensure_ascii=False)
+    jsonio.write_json(mam_data, output_path)
 
     # Fix ownership to target UID:GID (e.g., Unraid's nobody:users)
     # This ensures JSON files have same permissions as torrent files
@@ -13,14 +13,17 @@ Key functions:
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import logging
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from shelfr.config import get_settings
+from shelfr.utils import jsonio
 from shelfr.utils.permissions import fix_ownership
 from shelfr.utils.retry import SUBPROCESS_EXCEPTIONS, retry_with_backoff
 
@@ -279,29 +282,48 @@ def detect_audio_format_from_file(file_path: Path) -> AudioFormat | None:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_mediainfo_binary(binary: str) -> str:
+    """
+    Resolve the configured mediainfo binary to an absolute path once.
+
+    Cached per configured value so the PATH lookup is not repeated for every
+    release. Falls back to the configured value when the lookup fails, so a
+    missing binary still surfaces as FileNotFoundError from the subprocess.
+    """
+    return shutil.which(binary) or binary
+
+
 @retry_with_backoff(
     max_retries=3,
     base_delay=1.0,
     max_delay=10.0,
     exceptions=SUBPROCESS_EXCEPTIONS,
 )
-def _run_mediainfo_subprocess(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    """Run mediainfo subprocess with retry on transient failures."""
+def _run_mediainfo_subprocess(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
+    """
+    Run mediainfo subprocess with retry on transient failures.
+
+    Output is kept as raw bytes: the JSON parser decodes UTF-8 itself, so this
+    avoids holding a second, decoded copy of large MediaInfo dumps.
+    """
     return subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         check=True,
         timeout=60,  # Timeout for large files
     )
 
 
-def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
+def run_mediainfo(file_path: Path, *, check_exists: bool = True) -> dict[str, Any] | None:
     """
     Run mediainfo on a file and return parsed JSON output.
 
     Args:
         file_path: Path to audio file (typically .m4b)
+        check_exists: Stat the file before running mediainfo. Callers that
+            have already verified the path can pass False to skip the extra
+            stat (a real round trip on network filesystems).
 
     Returns:
         Parsed MediaInfo JSON or None on error.
@@ -313,9 +335,9 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
         docs/MIGRATION_BACKLOG.md for rationale and future migration plan.
     """
     settings = get_settings()
-    binary = settings.mediainfo.binary
+    binary = _resolve_mediainfo_binary(settings.mediainfo.binary)
 
-    if not file_path.exists():
+    if check_exists and not file_path.exists():
         logger.error(f"File not found for mediainfo: {file_path}")
         return None
 
@@ -330,7 +352,7 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
     try:
         result = _run_mediainfo_subprocess(cmd)
 
-        data: dict[str, Any] = json.loads(result.stdout)
+        data: dict[str, Any] = jsonio.loads(result.stdout)
         logger.info(f"Got MediaInfo for: {file_path.name}")
         return data
 
@@ -339,14 +361,15 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
         return None
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"mediainfo failed: {e.stderr}")
+        stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else e.stderr
+        logger.error(f"mediainfo failed: {stderr}")
         return None
 
     except subprocess.TimeoutExpired:
         logger.error(f"mediainfo timed out for: {file_path}")
         return None
 
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"Invalid JSON from mediainfo: {e}")
         return None
 
@@ -354,8 +377,7 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
 def save_mediainfo_json(data: dict[str, Any], output_path: Path) -> None:
     """Write MediaInfo data to JSON file."""
     settings = get_settings()
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    jsonio.write_json(data, output_path)
     fix_ownership(output_path, settings.target_uid, settings.target_gid)
     logger.info(f"Saved MediaInfo to: {output_path}")
 
@@ -21,6 +21,7 @@ Future functions (after full provider migration):
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -53,6 +54,7 @@ logger = logging.getLogger(__name__)
 def fetch_metadata_legacy(
     asin: str | None = None,
     m4b_path: Path | None = None,
+    audnex_data: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
     """
     Fetch Audnex book metadata, chapters, and MediaInfo without saving.
@@ -63,21 +65,33 @@ def fetch_metadata_legacy(
     Args:
         asin: Audible ASIN (None to skip Audnex)
         m4b_path: Path to m4b file (None to skip MediaInfo)
+        audnex_data: Already-fetched Audnex book data (skips the book request)
 
     Returns:
         Tuple of (audnex_data, mediainfo_data, audnex_chapters), any may be None on error.
     """
-    audnex_data = None
     mediainfo_data = None
     audnex_chapters = None
 
-    if asin:
-        audnex_data, _ = fetch_audnex_book(asin)  # Region not needed here
-        # Also fetch chapter data from Audnex (authoritative source)
-        audnex_chapters = fetch_audnex_chapters(asin)
+    mediainfo_path = m4b_path if m4b_path and m4b_path.exists() else None
+
+    # The Audnex HTTP calls and the local mediainfo subprocess are independent,
+    # so overlap them: total wait becomes max(audnex, mediainfo), not the sum
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mediainfo") as executor:
+        mediainfo_future = (
+            executor.submit(run_mediainfo, mediainfo_path, check_exists=False)
+            if mediainfo_path
+            else None
+        )
+
+        if asin:
+            if audnex_data is None:
+                audnex_data, _ = fetch_audnex_book(asin)  # Region not needed here
+            # Also fetch chapter data from Audnex (authoritative source)
+            audnex_chapters = fetch_audnex_chapters(asin)
 
-    if m4b_path and m4b_path.exists():
-        mediainfo_data = run_mediainfo(m4b_path)
+        if mediainfo_future:
+            mediainfo_data = mediainfo_future.result()
 
     return audnex_data, mediainfo_data, audnex_chapters
 
@@ -7,6 +7,7 @@ hitting real APIs or running subprocesses.
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Any
 
 from .base import ProviderKind
@@ -56,6 +57,7 @@ class MockProvider:
         confidences: dict[str, dict[FieldName, float]] | None = None,
         errors: dict[str, str] | None = None,
         supported_id_types: set[IdType] | None = None,
+        history_limit: int = 10_000,
     ):
         """Initialize mock provider.
 
@@ -68,6 +70,7 @@ class MockProvider:
             confidences: Mapping of identifier -> field confidence scores
             errors: Mapping of identifier -> error message (causes failure)
             supported_id_types: Set of supported ID types (default: {"asin"})
+            history_limit: Maximum fetch_history entries kept (oldest dropped first)
         """
         self.name = name
         self.priority = priority
@@ -76,9 +79,15 @@ class MockProvider:
         self._responses = responses or {}
         self._confidences = confidences or {}
         self._errors = errors or {}
+        # Identifiers with a configured response or error (single probe in can_lookup)
+        self._known: set[str] = set(self._responses) | set(self._errors)
+        # Responses are fixed once registered, so build each result up front
+        self._precomputed: dict[str, ProviderResult] = {}
+        for identifier in self._responses:
+            self._precompute(identifier)
         self._supported_id_types = supported_id_types or {"asin"}
         self._fetch_count = 0
-        self._fetch_history: list[tuple[LookupContext, IdType]] = []
+        self._fetch_history: deque[tuple[LookupContext, IdType]] = deque(maxlen=history_limit)
 
     def can_lookup(self, ctx: LookupContext, id_type: IdType) -> bool:
         """Check if mock can handle this lookup.
@@ -92,7 +101,7 @@ class MockProvider:
         identifier = ctx.ids.get(id_type)
         if not identifier:
             return False
-        return identifier in self._responses or identifier in self._errors
+        return identifier in self._known
 
     async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
         """Fetch mock data.
@@ -111,20 +120,31 @@ class MockProvider:
             return ProviderResult.failure(self.name, self._errors[identifier])
 
         # Check for configured response
-        if identifier in self._responses:
-            result = ProviderResult(provider=self.name, success=True)
-            fields = self._responses[identifier]
-            confidences = self._confidences.get(identifier, {})
-
-            for field_name, value in fields.items():
-                confidence = confidences.get(field_name, 1.0)
-                result.set_field(field_name, value, confidence)
-
-            return result
+        precomputed = self._precomputed.get(identifier)
+        if precomputed is not None:
+            # Copy the dicts so callers can't mutate the stored result
+            return ProviderResult(
+                provider=precomputed.provider,
+                success=True,
+                fields=dict(precomputed.fields),
+                confidence=dict(precomputed.confidence),
+            )
 
         # No configured response - return empty success
         return ProviderResult.empty(self.name)
 
+    def _precompute(self, identifier: str) -> None:
+        """Build and store the ProviderResult returned for an identifier.
+
+        Raises:
+            ValueError: If a configured confidence is outside [0.0, 1.0]
+        """
+        result = ProviderResult(provider=self.name, success=True)
+        confidences = self._confidences.get(identifier, {})
+        for field_name, value in self._responses[identifier].items():
+            result.set_field(field_name, value, confidences.get(field_name, 1.0))
+        self._precomputed[identifier] = result
+
     @property
     def fetch_count(self) -> int:
         """Number of times fetch() was called."""
@@ -141,7 +161,7 @@ class MockProvider:
     def reset(self) -> None:
         """Reset fetch count and history."""
         self._fetch_count = 0
-        self._fetch_history = []
+        self._fetch_history.clear()
 
     def set_response(
         self,
@@ -157,8 +177,10 @@ class MockProvider:
             confidences: Optional confidence scores per field
         """
         self._responses[identifier] = fields
+        self._known.add(identifier)
         if confidences:
             self._confidences[identifier] = confidences
+        self._precompute(identifier)
 
     def set_error(self, identifier: str, error: str) -> None:
         """Set error response for an identifier.
@@ -172,6 +194,8 @@ class MockProvider:
             error: Error message to return
         """
         self._errors[identifier] = error
+        self._known.add(identifier)
         # Clear any success response to avoid confusion
         self._responses.pop(identifier, None)
         self._confidences.pop(identifier, None)
+        self._precomputed.pop(identifier, None)
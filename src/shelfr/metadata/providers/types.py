@@ -52,7 +52,7 @@ FieldName = Literal[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LookupContext:
     """Everything a provider might need to look up metadata.
 
@@ -136,7 +136,7 @@ class LookupContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResult:
     """Result from a metadata provider lookup.
 
@@ -138,6 +138,8 @@ class AudnexSchema(BaseModel):
     # to find the preferred region's ASIN. Set to null/None to disable.
     # Valid: us, uk, au, ca, de, es, fr, in, it, jp, or null
     preferred_asin_region: str | None = Field(default=DEFAULT_ASIN_REGION)
+    # Seconds to keep successful responses in the on-disk cache (0 disables)
+    cache_ttl_seconds: int = Field(default=604800, ge=0)
 
     @field_validator("base_url")
     @classmethod
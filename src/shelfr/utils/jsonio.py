@@ -0,0 +1,54 @@
+"""Fast JSON encode/decode helpers.
+
+Uses orjson (C implementation, serializes straight to bytes) when it is
+installed and falls back to the stdlib json module otherwise. Output is
+UTF-8 with non-ASCII characters preserved, matching the
+``ensure_ascii=False`` style used for every JSON file shelfr writes.
+
+Install the speedup with: pip install shelfr[speedups]
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["HAS_ORJSON", "dumps", "dumps_pretty", "loads", "write_json"]
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from a str or UTF-8 bytes.
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> str:
+    """Serialize to a compact JSON string (no whitespace between tokens)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def write_json(data: Any, path: Path) -> None:
+    """Write data to path as two-space indented UTF-8 JSON."""
+    path.write_bytes(dumps_pretty(data))
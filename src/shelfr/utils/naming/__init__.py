@@ -30,6 +30,7 @@ from shelfr.utils.naming.constants import (
     MAM_MAX_PATH_LENGTH,
     MIN_SERIES_LENGTH,
     NORMALIZE_MAP,
+    NORMALIZE_TRANS,
     VOLUME_ALIASES,
 )
 from shelfr.utils.naming.filters import (
@@ -157,6 +158,7 @@ __all__ = [
     "MAM_MAX_PATH_LENGTH",
     "MIN_SERIES_LENGTH",
     "NORMALIZE_MAP",
+    "NORMALIZE_TRANS",
     "VOLUME_ALIASES",
     # Filters module
     "extract_non_authors_from_mediainfo",
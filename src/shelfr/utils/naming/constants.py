@@ -58,6 +58,9 @@ NORMALIZE_MAP = {
     "*": "",
 }
 
+# str.translate table for NORMALIZE_MAP (one pass instead of a replace per key)
+NORMALIZE_TRANS = str.maketrans(NORMALIZE_MAP)
+
 # Characters not allowed in filenames (cross-platform safe)
 # Applied AFTER normalization to remove truly illegal characters
 # Note: ":" is NOT included here as it's normalized to " -" by NORMALIZE_MAP
@@ -99,6 +102,16 @@ TRAILING_PUNCT_PATTERN = re.compile(r"\s*[,:;]\s*$")  # Trailing comma, colon, s
 LEADING_PUNCT_PATTERN = re.compile(r"^\s*[,:;]\s*")  # Leading comma, colon, semicolon
 SPACE_BEFORE_PUNCT_PATTERN = re.compile(r"\s+([,:;])")  # Space before punctuation
 
+# Series name suffix patterns, applied in order by clean_series_name()
+SERIES_BRACKET_TAG_PATTERN = re.compile(r"\s*\[[^\]]*\]\s*$")  # "[publication order]"
+SERIES_LIGHT_NOVEL_PAREN_PATTERN = re.compile(r"\s*\([Ll]ight [Nn]ovel\)\s*$")
+SERIES_LIGHT_NOVEL_PATTERN = re.compile(r"\s+[Ll]ight [Nn]ovels?\s*$")
+SERIES_SUFFIX_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"[\s—-]+[Ss]eries\s*$"),
+    re.compile(r"[\s—-]+[Tt]rilogy\s*$"),
+    re.compile(r"[\s—-]+[Ss]aga\s*$"),
+)
+
 # Volume/Book number extraction patterns for folder naming
 # Enhanced to support parts (vol_01p1), ranges (vol_01-03), and novellas (vol_01.5)
 VOL_EXTRACT_PATTERNS: list[re.Pattern[str]] = [
@@ -31,7 +31,7 @@ from shelfr.utils.naming.constants import (
     DEFAULT_CREDIT_WORDS,
     DEFAULT_ROLE_WORDS,
     DUPLICATE_VOL_PATTERN,
-    NORMALIZE_MAP,
+    NORMALIZE_TRANS,
     WHITESPACE_PATTERN,
 )
 from shelfr.utils.naming.string_utils import cleanup_string
@@ -62,9 +62,7 @@ def sanitize_filename(name: str) -> str:
     normalization applies character replacements and whitespace cleanup.
     """
     # Apply character normalization before pathvalidate
-    result = name
-    for char, replacement in NORMALIZE_MAP.items():
-        result = result.replace(char, replacement)
+    result = name.translate(NORMALIZE_TRANS)
 
     # Collapse multiple spaces (using pre-compiled pattern)
     result = WHITESPACE_PATTERN.sub(" ", result)
@@ -17,6 +17,13 @@ import logging
 import re
 from typing import TYPE_CHECKING, Any
 
+from shelfr.utils.naming.constants import (
+    SERIES_BRACKET_TAG_PATTERN,
+    SERIES_LIGHT_NOVEL_PAREN_PATTERN,
+    SERIES_LIGHT_NOVEL_PATTERN,
+    SERIES_SUFFIX_PATTERNS,
+)
+
 if TYPE_CHECKING:
     from shelfr.models import NormalizedBook
 
@@ -48,18 +55,17 @@ def clean_series_name(series_name: str | None, title: str | None = None) -> str
     cleaned = series_name.strip()
 
     # Remove bracket tags like "[publication order]", "[reading order]"
-    cleaned = re.sub(r"\s*\[[^\]]*\]\s*$", "", cleaned)
+    cleaned = SERIES_BRACKET_TAG_PATTERN.sub("", cleaned)
 
     # Remove "(Light Novel)" / "(light novel)" suffix
-    cleaned = re.sub(r"\s*\([Ll]ight [Nn]ovel\)\s*$", "", cleaned)
+    cleaned = SERIES_LIGHT_NOVEL_PAREN_PATTERN.sub("", cleaned)
 
     # Remove " Light Novel" suffix (without parens) - but not if it's the whole name
-    cleaned = re.sub(r"\s+[Ll]ight [Nn]ovels?\s*$", "", cleaned)
+    cleaned = SERIES_LIGHT_NOVEL_PATTERN.sub("", cleaned)
 
     # Remove common series type suffixes
-    cleaned = re.sub(r"[\s—-]+[Ss]eries\s*$", "", cleaned)
-    cleaned = re.sub(r"[\s—-]+[Tt]rilogy\s*$", "", cleaned)
-    cleaned = re.sub(r"[\s—-]+[Ss]aga\s*$", "", cleaned)
+    for pattern in SERIES_SUFFIX_PATTERNS:
+        cleaned = pattern.sub("", cleaned)
 
     # Handle "The" prefix inheritance
     # If title starts with "The " but series doesn't, inherit it
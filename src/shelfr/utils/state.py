@@ -336,8 +336,11 @@ def _save_state_unsafe(state_file: Path, state: dict[str, Any]) -> None:
             logger.debug(f"Preserved backup: {backup_file}")
 
         # Step 2: Write to temporary file with fsync
+        # Serialize up front so the file gets one write() instead of the
+        # per-token writes json.dump() issues
+        payload = json.dumps(state, indent=2, ensure_ascii=False, sort_keys=True)
         with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())  # Force data to disk
 
@@ -13,6 +13,7 @@ Coordinates all processing steps:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from collections.abc import Callable
@@ -49,7 +50,11 @@ from shelfr.libation import (
     run_liberate_with_progress,
     run_scan,
 )
-from shelfr.metadata import fetch_metadata, generate_mam_json_for_release
+from shelfr.metadata import (
+    fetch_audnex_books_batch,
+    fetch_metadata,
+    generate_mam_json_for_release,
+)
 from shelfr.mkbrr import create_torrent
 from shelfr.models import AudiobookRelease, ProcessingResult, ReleaseStatus
 from shelfr.qbittorrent import upload_torrent
@@ -135,9 +140,43 @@ class PipelineResult:
 def _fetch_metadata_with_retry(
     asin: str | None,
     m4b_path: Path | None,
+    audnex_data: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
     """Fetch metadata with retry logic for network failures."""
-    return fetch_metadata(asin=asin, m4b_path=m4b_path)
+    return fetch_metadata(asin=asin, m4b_path=m4b_path, audnex_data=audnex_data)
+
+
+def _prefetch_audnex_metadata(releases: list[AudiobookRelease]) -> None:
+    """
+    Fetch Audnex book data for all pending releases concurrently.
+
+    Populates release.audnex_metadata so the per-release metadata step skips
+    the book request. Only worthwhile for 2+ releases; a single release
+    already overlaps its Audnex request with MediaInfo. Failures are left
+    for the per-release step to retry and report.
+
+    Args:
+        releases: Discovered releases (already-processed ones are ignored)
+    """
+    pending = [
+        release
+        for release in releases
+        if release.asin and not release.audnex_metadata and not is_processed(release.asin)
+    ]
+    if len(pending) < 2:
+        return
+
+    logger.debug("Prefetching Audnex metadata for %d releases", len(pending))
+    try:
+        results = asyncio.run(fetch_audnex_books_batch([r.asin for r in pending if r.asin]))
+    except Exception as e:
+        logger.debug("Audnex prefetch failed, falling back to per-release fetch: %s", e)
+        return
+
+    for release in pending:
+        data, _ = results.get(release.asin or "", (None, None))
+        if data:
+            release.audnex_metadata = data
 
 
 @retry_with_backoff(
@@ -289,6 +328,7 @@ def process_single_release(
                 audnex_data, mediainfo_data, audnex_chapters = _fetch_metadata_with_retry(
                     asin=release.asin,
                     m4b_path=release.main_m4b,
+                    audnex_data=release.audnex_metadata,
                 )
                 release.audnex_metadata = audnex_data
                 release.mediainfo_data = mediainfo_data
@@ -724,6 +764,10 @@ def full_run(
     results = []
     skipped = 0
 
+    # Fetch Audnex data for the whole batch up front (concurrent requests)
+    if not dry_run and not skip_metadata:
+        _prefetch_audnex_metadata(releases)
+
     # Process each release
     for i, release in enumerate(releases, 1):
         console.print()  # Blank line before each release header
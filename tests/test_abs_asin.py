@@ -19,6 +19,7 @@ from shelfr.abs.asin import (
     extract_asin_from_abs_item,
     extract_asin_from_mediainfo,
     extract_asin_with_source,
+    extract_asin_with_span,
     is_valid_asin,
     normalize_asin_to_preferred_region,
     resolve_asin_from_folder,
@@ -148,6 +149,29 @@ class TestExtractAsinWithSource:
         assert extract_asin_with_source("", "test") is None
 
 
+class TestExtractAsinWithSpan:
+    """Tests for extract_asin_with_span()."""
+
+    def test_span_covers_marker(self) -> None:
+        """Span includes the braces/brackets of marker formats."""
+        text = "Book {ASIN.B0DK9TS6D9} [Tag]"
+        asin, start, end = extract_asin_with_span(text)
+        assert asin == "B0DK9TS6D9"
+        assert text[start:end] == "{ASIN.B0DK9TS6D9}"
+
+    def test_bare_asin_span(self) -> None:
+        """Bare ASIN span covers only the ASIN itself."""
+        text = "text B0ABC12345 text"
+        asin, start, end = extract_asin_with_span(text)
+        assert asin == "B0ABC12345"
+        assert text[start:end] == "B0ABC12345"
+
+    def test_no_match(self) -> None:
+        """Return sentinel span when no ASIN is present."""
+        assert extract_asin_with_span("no asin here") == (None, -1, -1)
+        assert extract_asin_with_span("") == (None, -1, -1)
+
+
 class TestExtractAsinFromAbsItem:
     """Tests for extract_asin_from_abs_item()."""
 
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
+import errno
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from shelfr.abs import importer as importer_module
 from shelfr.abs.asin import AsinEntry
 from shelfr.abs.importer import (
+    TRASH_DIR_NAME,
     BatchImportResult,
     ImportResult,
     ParsedFolderName,
@@ -178,6 +183,33 @@ class TestParseMamFolderName:
         # Title should include "(Part One)"
         assert "Part One" in result.title or result.title == "Title (Part One)"
 
+    def test_ripper_tag_in_brackets(self) -> None:
+        """Parse trailing [Tag] ripper tag."""
+        result = parse_mam_folder_name("Author - Title (2020) [H2OKing]")
+        assert result.ripper_tag == "H2OKing"
+        assert result.title == "Title"
+
+    def test_ripper_tag_after_asin(self) -> None:
+        """Ripper tag following the ASIN marker is still extracted."""
+        result = parse_mam_folder_name("Author - Title {ASIN.B0C1234567} [H2OKing]")
+        assert result.asin == "B0C1234567"
+        assert result.ripper_tag == "H2OKing"
+        assert result.title == "Title"
+
+    def test_empty_trailing_brackets_not_ripper_tag(self) -> None:
+        """Empty trailing brackets are not treated as a ripper tag."""
+        result = parse_mam_folder_name("Author - Title []")
+        assert result.ripper_tag is None
+
+    def test_result_is_cached_and_frozen(self) -> None:
+        """Repeated parses share one frozen result."""
+        folder = "Author - Series vol_2 - Title (2020) [ASIN.B0C1234567]"
+        result = parse_mam_folder_name(folder)
+
+        assert parse_mam_folder_name(folder) is result
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.asin = "B0OTHER000"  # type: ignore[misc]
+
 
 # =============================================================================
 # Tests: enrich_from_audnex
@@ -698,6 +730,16 @@ class TestDiscoverStagedBooks:
 
         assert len(found) == len(extensions)
 
+    def test_bare_audio_dotfile_is_not_audio(self, temp_staging: Path) -> None:
+        """A lone dotfile named like an extension (e.g. ".mp3") doesn't make a book."""
+        folder = temp_staging / "Dotfile Only"
+        folder.mkdir()
+        (folder / ".mp3").write_text("not audio")
+
+        found = discover_staged_books(temp_staging)
+
+        assert found == []
+
 
 # =============================================================================
 # Tests: import_single
@@ -806,6 +848,212 @@ class TestImportSingle:
         assert result.status == "success"
         assert not staging_folder.exists()
 
+    def test_existing_target_folder_is_duplicate(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """Target folder already on disk (but not indexed) is reported as duplicate."""
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.mkdir(parents=True)
+        (planned.target_path / "old.m4b").write_text("old")
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+        )
+
+        assert result.status == "duplicate"
+        assert "Target path already exists" in (result.error or "")
+        assert staging_folder.exists()
+        assert (planned.target_path / "old.m4b").exists()
+
+    def test_existing_empty_target_folder_is_duplicate(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """An empty target folder counts as a duplicate and staging is left untouched."""
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        (staging_folder / ".metadata.json").write_text("{}")
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.mkdir(parents=True)
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            ignore_patterns=[".metadata.json"],
+        )
+
+        assert result.status == "duplicate"
+        assert staging_folder.exists()
+        # Ignored files are only removed for books that actually get moved
+        assert (staging_folder / ".metadata.json").exists()
+        assert list(planned.target_path.iterdir()) == []
+
+    def test_file_at_target_path_is_duplicate(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """A regular file where the target folder should go is reported as duplicate."""
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.parent.mkdir(parents=True)
+        planned.target_path.write_text("stray file")
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+        )
+
+        assert result.status == "duplicate"
+        assert staging_folder.exists()
+        assert planned.target_path.read_text() == "stray file"
+
+    def test_rename_enotdir_is_duplicate(
+        self,
+        temp_staging: Path,
+        temp_library: Path,
+        empty_asin_index: dict[str, AsinEntry],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A file appearing at the target between check and rename is a duplicate."""
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+
+        def raise_enotdir(src: object, dst: object) -> None:
+            raise OSError(errno.ENOTDIR, "Not a directory", str(dst))
+
+        monkeypatch.setattr(importer_module.os, "rename", raise_enotdir)
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+        )
+
+        assert result.status == "duplicate"
+        assert staging_folder.exists()
+
+    def test_file_at_target_path_overwrite(
+        self,
+        temp_staging: Path,
+        temp_library: Path,
+        empty_asin_index: dict[str, AsinEntry],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Overwrite policy replaces a regular file sitting at the target path."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(importer_module, "_TRASH_EXECUTOR", executor)
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.parent.mkdir(parents=True)
+        planned.target_path.write_text("stray file")
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            duplicate_policy="overwrite",
+        )
+        executor.shutdown(wait=True)
+
+        assert result.status == "success"
+        assert planned.target_path.is_dir()
+        assert not staging_folder.exists()
+        # The trashed file is purged too, not just trashed folders
+        assert list((temp_library / TRASH_DIR_NAME).iterdir()) == []
+
+    def test_existing_target_folder_overwrite(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """Overwrite policy replaces a target folder that already exists on disk."""
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.mkdir(parents=True)
+        (planned.target_path / "old.m4b").write_text("old")
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            duplicate_policy="overwrite",
+        )
+
+        assert result.status == "success"
+        assert not staging_folder.exists()
+        assert not (planned.target_path / "old.m4b").exists()
+
+    def test_overwrite_purges_trash_in_background(
+        self,
+        temp_staging: Path,
+        temp_library: Path,
+        empty_asin_index: dict[str, AsinEntry],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Overwritten target is moved to the trash folder and deleted off-thread."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(importer_module, "_TRASH_EXECUTOR", executor)
+
+        folder_name = "Andy Weir - Project Hail Mary (2021) [ASIN.B08G9PRS1K]"
+        staging_folder = create_audiobook_folder(temp_staging, folder_name)
+        planned = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+        assert planned.target_path is not None
+        planned.target_path.mkdir(parents=True)
+        (planned.target_path / "old.m4b").write_text("old")
+
+        result = import_single(
+            staging_folder=staging_folder,
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            duplicate_policy="overwrite",
+        )
+        executor.shutdown(wait=True)
+
+        assert result.status == "success"
+        assert planned.target_path.is_dir()
+        assert not (planned.target_path / "old.m4b").exists()
+        assert list((temp_library / TRASH_DIR_NAME).iterdir()) == []
+
     def test_no_asin_homebrew_imports_to_author(
         self,
         temp_staging: Path,
@@ -858,6 +1106,49 @@ class TestImportBatch:
         assert result.failed_count == 0
         assert len(result.results) == 3
 
+    def test_batch_purges_leftover_trash(
+        self,
+        temp_staging: Path,
+        temp_library: Path,
+        empty_asin_index: dict[str, AsinEntry],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Trash left by an earlier run that didn't finish purging is deleted."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(importer_module, "_TRASH_EXECUTOR", executor)
+        trash_dir = temp_library / TRASH_DIR_NAME
+        leftover = trash_dir / "0123456789abcdef"
+        leftover.mkdir(parents=True)
+        (leftover / "old.m4b").write_text("old")
+        (trash_dir / "stray-file").write_text("old")
+
+        folder = create_audiobook_folder(temp_staging, "Author - Book [B0ABC00001]")
+        result = import_batch(
+            staging_folders=[folder],
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+        )
+        executor.shutdown(wait=True)
+
+        assert result.success_count == 1
+        assert list(trash_dir.iterdir()) == []
+
+    def test_batch_dry_run_keeps_leftover_trash(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """Dry run doesn't delete anything, including leftover trash."""
+        leftover = temp_library / TRASH_DIR_NAME / "0123456789abcdef"
+        leftover.mkdir(parents=True)
+
+        import_batch(
+            staging_folders=[],
+            library_root=temp_library,
+            asin_index=empty_asin_index,
+            dry_run=True,
+        )
+
+        assert leftover.exists()
+
     def test_batch_with_duplicates(
         self, temp_staging: Path, temp_library: Path, mock_asin_index: dict[str, AsinEntry]
     ) -> None:
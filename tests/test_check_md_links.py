@@ -0,0 +1,111 @@
+"""Tests for scripts/check_md_links.py."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+
+@pytest.fixture
+def check_md_links(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the script as a module (importable by name for worker processes)."""
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    return importlib.import_module("check_md_links")
+
+
+@pytest.fixture
+def docs_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A tiny repo with a docs/ tree containing valid and broken links."""
+    docs = tmp_path / "docs"
+    (docs / "guide").mkdir(parents=True)
+    (tmp_path / "README.md").write_text("# Readme\n")
+    (docs / "index.md").write_text(
+        "[Guide](guide/setup.md) [Readme](/README.md) [Site](https://example.com)\n"
+        "[Missing](guide/missing.md) [Anchor](#top)\n"
+    )
+    (docs / "guide" / "setup.md").write_text(
+        "[Back](../index.md#intro) [Café ☕](nowhere.md)\n", encoding="utf-8"
+    )
+    (docs / "guide" / "empty.md").write_text("")
+    (docs / "guide" / "notes.mdx").write_text("[Gone](../../src/gone.py)\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _broken_link_lines(caplog: pytest.LogCaptureFixture) -> list[str]:
+    return [r.getMessage() for r in caplog.records if r.getMessage().startswith("  ")]
+
+
+class TestReadLinks:
+    """Tests for the mmap/bytes link scan."""
+
+    def test_extracts_and_decodes_links(self, check_md_links: ModuleType, tmp_path: Path) -> None:
+        md = tmp_path / "a.md"
+        md.write_text("See [Café ☕](docs/ü.md) and [x](y.md#z)\n", encoding="utf-8")
+
+        assert check_md_links._read_links(md) == [("Café ☕", "docs/ü.md"), ("x", "y.md#z")]
+
+    def test_empty_file_has_no_links(self, check_md_links: ModuleType, tmp_path: Path) -> None:
+        md = tmp_path / "empty.md"
+        md.write_bytes(b"")
+
+        assert check_md_links._read_links(md) == []
+
+
+class TestScanFile:
+    """Tests for per-file link checking."""
+
+    def test_reports_broken_links(self, check_md_links: ModuleType, docs_repo: Path) -> None:
+        docs = docs_repo / "docs"
+
+        checked, broken = check_md_links._scan_file(
+            docs / "index.md", docs_dir=docs, repo_root=docs_repo
+        )
+
+        assert checked == 5
+        assert broken == [(Path("index.md"), "guide/missing.md", "Missing")]
+
+
+class TestCheckLinks:
+    """Tests for the serial and parallel check_links paths."""
+
+    def test_parallel_matches_serial(
+        self,
+        check_md_links: ModuleType,
+        docs_repo: Path,
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        caplog.set_level(logging.INFO, logger=check_md_links.logger.name)
+
+        monkeypatch.setattr(check_md_links, "PARALLEL_MIN_FILES", 10_000)
+        serial_rc = check_md_links.check_links()
+        serial = _broken_link_lines(caplog)
+        caplog.clear()
+
+        monkeypatch.setattr(check_md_links, "PARALLEL_MIN_FILES", 1)
+        parallel_rc = check_md_links.check_links()
+        parallel = _broken_link_lines(caplog)
+
+        assert serial_rc == parallel_rc == 1
+        assert parallel == serial
+        assert serial == [
+            "  guide/notes.mdx: [Gone](../../src/gone.py)",
+            "  guide/setup.md: [Café ☕](nowhere.md)",
+            "  index.md: [Missing](guide/missing.md)",
+        ]
+
+    def test_all_links_valid(
+        self, check_md_links: ModuleType, docs_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for md in (docs_repo / "docs").rglob("*.md*"):
+            md.write_text("[Readme](/README.md)\n")
+        monkeypatch.setattr(check_md_links, "PARALLEL_MIN_FILES", 1)
+
+        assert check_md_links.check_links() == 0
@@ -0,0 +1,131 @@
+"""Tests for legacy CLI argument helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from shelfr.cli._app import CleanupStrategy, DuplicatePolicy
+from shelfr.cli._helpers import (
+    cached_argument,
+    cached_option,
+    get_args,
+    make_args_builder,
+    misplaced_dry_run_message,
+)
+
+
+def _ctx(obj: object) -> MagicMock:
+    ctx = MagicMock()
+    ctx.obj = obj
+    return ctx
+
+
+class TestGetArgs:
+    """Tests for get_args."""
+
+    def test_merges_global_options(self) -> None:
+        """Test global options from ctx.obj are copied onto the namespace."""
+        ctx = _ctx({"verbose": True, "config": Path("custom.yaml"), "dry_run": True})
+        args = get_args(ctx, command="status")
+        assert args.verbose is True
+        assert args.config == Path("custom.yaml")
+        assert args.dry_run is True
+        assert args.command == "status"
+
+    def test_defaults_without_ctx_obj(self) -> None:
+        """Test defaults are used when ctx.obj is not a dict."""
+        args = get_args(_ctx(None), command="status")
+        assert args.verbose is False
+        assert args.config == Path("config/config.yaml")
+        assert args.dry_run is False
+
+
+class TestMakeArgsBuilder:
+    """Tests for make_args_builder."""
+
+    def test_binds_command(self) -> None:
+        """Test the command name is baked into the builder."""
+        build = make_args_builder("abs init")
+        args = build(_ctx({}))
+        assert args.command == "abs init"
+
+    def test_enum_fields_unwrapped(self) -> None:
+        """Test Enum options are stored as their values."""
+        build = make_args_builder(
+            "abs import", enum_fields=("duplicate_policy", "cleanup_strategy")
+        )
+        args = build(
+            _ctx({}),
+            duplicate_policy=DuplicatePolicy.skip,
+            cleanup_strategy=None,
+            no_scan=True,
+        )
+        assert args.duplicate_policy == "skip"
+        assert type(args.duplicate_policy) is str
+        assert args.cleanup_strategy is None
+        assert args.no_scan is True
+
+    def test_missing_enum_field_stored_as_none(self) -> None:
+        """Test an omitted Enum option still appears on the namespace."""
+        build = make_args_builder("abs cleanup", enum_fields=("strategy",))
+        args = build(_ctx({}), paths=[])
+        assert args.strategy is None
+
+    def test_matches_get_args(self) -> None:
+        """Test builder output matches the equivalent get_args call."""
+        ctx = _ctx({"verbose": True})
+        build = make_args_builder("abs cleanup", enum_fields=("strategy",))
+        built = build(ctx, paths=[], strategy=CleanupStrategy.hide)
+        expected = get_args(ctx, paths=[], strategy="hide", command="abs cleanup")
+        assert vars(built) == vars(expected)
+
+
+class TestCachedParameterInfo:
+    """Tests for cached_option and cached_argument."""
+
+    def test_identical_declarations_share_instance(self) -> None:
+        """Test identical declarations return the same info object."""
+        first = cached_option("--no-scan", help="Don't scan.")
+        assert cached_option("--no-scan", help="Don't scan.") is first
+        assert cached_option("--no-scan", help="Other help.") is not first
+
+    def test_argument_cached(self) -> None:
+        """Test arguments are cached the same way."""
+        assert cached_argument(help="Paths.") is cached_argument(help="Paths.")
+
+    def test_shared_option_parses_in_both_commands(self) -> None:
+        """Test the abs sub-app and deprecated alias both accept a shared option."""
+        from typer.testing import CliRunner
+
+        from shelfr.cli import app
+
+        runner = CliRunner()
+        for argv in (["abs", "import", "--help"], ["abs-import", "--help"]):
+            result = runner.invoke(app, argv)
+            assert result.exit_code == 0
+            assert "--duplicate-policy" in result.output
+
+
+class TestMisplacedDryRunMessage:
+    """Tests for misplaced_dry_run_message."""
+
+    def test_message_names_command(self) -> None:
+        """Test both the correct and incorrect forms are shown."""
+        text = misplaced_dry_run_message("tools prepare").plain
+        assert "shelfr --dry-run tools prepare" in text
+        assert "shelfr tools prepare --dry-run" in text
+
+    def test_message_cached_per_command(self) -> None:
+        """Test the parsed Text is reused for the same command."""
+        assert misplaced_dry_run_message("run") is misplaced_dry_run_message("run")
+
+    def test_run_with_trailing_dry_run_exits_2(self) -> None:
+        """Test 'shelfr run --dry-run' prints the hint and exits 2."""
+        from typer.testing import CliRunner
+
+        from shelfr.cli import app
+
+        result = CliRunner().invoke(app, ["run", "--dry-run"])
+        assert result.exit_code == 2
+        assert "must come BEFORE" in result.output
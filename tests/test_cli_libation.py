@@ -197,6 +197,12 @@ class TestCmdLibationGuide:
         result = cmd_libation_guide(args)
         assert result == 0
 
+    def test_guide_renderable_is_cached(self) -> None:
+        """Test the static guide body is built once and reused."""
+        from shelfr.commands.libation.guide import _guide_renderable
+
+        assert _guide_renderable() is _guide_renderable()
+
 
 class TestCmdLibationScan:
     """Tests for scan command."""
@@ -5,6 +5,8 @@ These tests validate the new Typer CLI implementation using typer.testing.CliRun
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 from typer.testing import CliRunner
 
@@ -223,3 +225,67 @@ class TestAllCommandsHaveHelp:
         assert result.exit_code in (0, 1), f"Global flag before subapp failed: {result.output}"
         # Should recognize --dry-run (no "Unknown option" error)
         assert "Unknown option" not in result.output
+
+
+class TestLazyExports:
+    """Test backwards-compatible exports resolve lazily."""
+
+    def test_lazy_exports_resolve(self) -> None:
+        """Test legacy handlers are still importable from shelfr.cli."""
+        import shelfr.cli as cli
+        from shelfr.cli_argparse import build_parser
+        from shelfr.commands.abs import cmd_abs_import
+
+        assert cli.build_parser is build_parser
+        assert cli.cmd_abs_import is cmd_abs_import
+        assert "cmd_abs_import" in cli.__all__
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test unknown attributes still raise AttributeError."""
+        import shelfr.cli as cli
+
+        with pytest.raises(AttributeError):
+            _ = cli.not_a_real_export
+
+    def test_commands_package_resolves_handlers_lazily(self) -> None:
+        """Test shelfr.commands handlers resolve to their defining modules."""
+        import shelfr.commands as commands
+        from shelfr.commands.abs.import_ import cmd_abs_import
+        from shelfr.commands.core import cmd_run
+
+        assert commands.cmd_run is cmd_run
+        assert commands.cmd_abs_import is cmd_abs_import
+        assert set(commands.__all__) <= set(dir(commands))
+
+
+class TestDeprecatedAbsAliases:
+    """Test hidden abs-* aliases forward to the abs sub-app."""
+
+    def test_alias_warns_and_forwards(self, runner: CliRunner) -> None:
+        """Test alias prints a deprecation warning and runs the handler."""
+        with patch("shelfr.commands.cmd_abs_check_duplicate", return_value=0) as handler:
+            result = runner.invoke(app, ["abs-dup", "B0DK27WWT8"])
+
+        assert result.exit_code == 0
+        assert "'abs-dup' is deprecated" in result.output
+        args = handler.call_args.args[0]
+        assert args.command == "abs check-asin"
+        assert args.asin == "B0DK27WWT8"
+
+    def test_shared_alias_reports_invoked_name(self, runner: CliRunner) -> None:
+        """Test abs-dup and abs-check-duplicate each warn with their own name."""
+        with patch("shelfr.commands.cmd_abs_check_duplicate", return_value=0):
+            result = runner.invoke(app, ["abs-check-duplicate", "B0DK27WWT8"])
+
+        assert "'abs-check-duplicate' is deprecated" in result.output
+        hidden = [info for info in app.registered_commands if info.name == "abs-dup"]
+        assert len(hidden) == 1
+        assert hidden[0].hidden is True
+
+    def test_alias_options_match_sub_app(self, runner: CliRunner) -> None:
+        """Test aliases expose the same options as the sub-app command."""
+        alias = runner.invoke(app, ["abs-import", "--help"])
+        current = runner.invoke(app, ["abs", "import", "--help"])
+        for flag in ("--duplicate-policy", "--no-scan", "--opf", "--no-opf"):
+            assert flag in alias.output
+            assert flag in current.output
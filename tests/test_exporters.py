@@ -103,6 +103,29 @@ class TestJsonExporter:
 
         assert content["authors"] == ["Author One", "Author Two"]
 
+    def test_extract_names_mixed_items(self, exporter: JsonExporter) -> None:
+        """Test names are pulled from strings, objects and dicts; other items skipped."""
+
+        @dataclass
+        class Genre:
+            name: str
+
+        class Tag(str):
+            pass
+
+        items = ["Plain", Genre(name="Fantasy"), {"name": "From Dict"}, Tag("Sub"), {"x": 1}, 42]
+
+        assert exporter._extract_names(items) == ["Plain", "Fantasy", "From Dict", "Sub"]
+
+    def test_extract_year_formats(self, exporter: JsonExporter) -> None:
+        """Test year extraction from strings, datetimes and bad values."""
+        assert exporter._extract_year("2010-08-31") == 2010
+        assert exporter._extract_year("2010") == 2010
+        assert exporter._extract_year(datetime(1999, 1, 2)) == 1999
+        assert exporter._extract_year("n/a-2010") is None
+        assert exporter._extract_year("99") is None
+        assert exporter._extract_year(None) is None
+
     @pytest.mark.asyncio
     async def test_export_authors_as_person_objects(
         self, exporter: JsonExporter, tmp_path: Path
@@ -402,6 +425,27 @@ class TestJsonExporterChapterFormats:
         assert content["chapters"][0]["title"] == "Chapter 1"
         assert content["chapters"][0]["start"] == 0.0
 
+    @pytest.mark.parametrize("dict_first", [True, False])
+    def test_chapters_mixed_dicts_and_objects(
+        self, exporter: JsonExporter, dict_first: bool
+    ) -> None:
+        """Test a list mixing dicts and objects converts every chapter in order."""
+
+        @dataclass
+        class Chapter:
+            title: str
+            start_time: float
+            end_time: float
+
+        as_dict = {"start": 0.0, "end": 300.0, "title": "From Dict"}
+        as_obj = Chapter("From Object", 300.0, 600.0)
+        chapters = [as_dict, as_obj] if dict_first else [as_obj, as_dict]
+
+        converted = exporter._convert_chapters(chapters)
+
+        expected = ["From Dict", "From Object"] if dict_first else ["From Object", "From Dict"]
+        assert [c.title for c in converted] == expected
+
 
 class TestMetadataExporterProtocol:
     """Tests for MetadataExporter protocol conformance."""
@@ -10,7 +10,12 @@ import pytest
 
 from shelfr.models import AudiobookRelease, ReleaseStatus
 from shelfr.validation import ValidationResult
-from shelfr.workflow import PipelineResult, full_run, process_single_release
+from shelfr.workflow import (
+    PipelineResult,
+    _prefetch_audnex_metadata,
+    full_run,
+    process_single_release,
+)
 
 
 def _create_passing_validation_result() -> ValidationResult:
@@ -375,6 +380,45 @@ class TestFullPipeline:
             mock_liberate.assert_not_called()
 
 
+class TestPrefetchAudnexMetadata:
+    """Tests for the batched Audnex prefetch in full_run."""
+
+    @patch("shelfr.workflow.is_processed")
+    @patch("shelfr.workflow.fetch_audnex_books_batch")
+    def test_populates_pending_releases(self, mock_batch: Mock, mock_is_processed: Mock) -> None:
+        """Unprocessed releases get audnex_metadata from one batched call."""
+        mock_is_processed.side_effect = lambda asin: asin == "B000DONE00"
+
+        async def fake_batch(asins):
+            return {
+                asin: ({"asin": asin}, "us") if asin != "B000MISS00" else (None, None)
+                for asin in asins
+            }
+
+        mock_batch.side_effect = fake_batch
+
+        found = AudiobookRelease(title="Found", asin="B000TEST01")
+        missing = AudiobookRelease(title="Missing", asin="B000MISS00")
+        done = AudiobookRelease(title="Done", asin="B000DONE00")
+        no_asin = AudiobookRelease(title="No ASIN")
+
+        _prefetch_audnex_metadata([found, missing, done, no_asin])
+
+        mock_batch.assert_called_once()
+        assert mock_batch.call_args.args[0] == ["B000TEST01", "B000MISS00"]
+        assert found.audnex_metadata == {"asin": "B000TEST01"}
+        assert missing.audnex_metadata is None
+        assert done.audnex_metadata is None
+
+    @patch("shelfr.workflow.is_processed", return_value=False)
+    @patch("shelfr.workflow.fetch_audnex_books_batch")
+    def test_single_release_not_prefetched(self, mock_batch: Mock, mock_is_processed: Mock) -> None:
+        """A lone release keeps the inline fetch (overlapped with MediaInfo)."""
+        _prefetch_audnex_metadata([AudiobookRelease(title="Only", asin="B000TEST01")])
+
+        mock_batch.assert_not_called()
+
+
 class TestConfigurationValidation:
     """Integration tests for configuration validation."""
 
@@ -0,0 +1,48 @@
+"""Tests for JSON encode/decode helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from shelfr.utils import jsonio
+
+SAMPLE = {"title": "Café – Ω", "chapters": [1, 2.5, None], "nested": {"ok": True}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif not jsonio.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    return str(request.param)
+
+
+class TestJsonio:
+    """Tests for the jsonio helpers under both backends."""
+
+    def test_loads_str_and_bytes(self, backend: str) -> None:
+        text = json.dumps(SAMPLE, ensure_ascii=False)
+        assert jsonio.loads(text) == SAMPLE
+        assert jsonio.loads(text.encode()) == SAMPLE
+
+    def test_loads_invalid_raises_json_decode_error(self, backend: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"not valid json")
+
+    def test_dumps_is_compact_and_keeps_unicode(self, backend: str) -> None:
+        result = jsonio.dumps({"a": [1, 2], "b": "Ω"})
+        assert result == '{"a":[1,2],"b":"Ω"}'
+
+    def test_dumps_pretty_matches_stdlib_layout(self, backend: str) -> None:
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode()
+        assert jsonio.dumps_pretty(SAMPLE) == expected
+
+    def test_write_json_round_trips(self, backend: str, tmp_path: Path) -> None:
+        path = tmp_path / "out.json"
+        jsonio.write_json(SAMPLE, path)
+        assert json.loads(path.read_text(encoding="utf-8")) == SAMPLE
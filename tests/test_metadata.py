@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from shelfr.metadata import (
     AudioFormat,
     _build_series_list,
@@ -19,13 +23,28 @@ from shelfr.metadata import (
     _parse_chapters_from_mediainfo,
     build_mam_json,
     detect_audio_format,
+    fetch_audnex_author,
     fetch_audnex_book,
+    fetch_audnex_books_batch,
+    fetch_audnex_chapters,
     render_bbcode_description,
     run_mediainfo,
     save_audnex_json,
     save_mam_json,
     save_mediainfo_json,
 )
+from shelfr.metadata.audnex import invalidate_cache, reset_client
+from shelfr.metadata.audnex.client import _clear_memory_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_audnex_client():
+    """Reset the Audnex client pool and in-process cache before each test."""
+    reset_client()
+    _clear_memory_cache()
+    yield
+    reset_client()
+    _clear_memory_cache()
 
 
 class TestFetchAudnexBook:
@@ -35,11 +54,13 @@ class TestFetchAudnexBook:
         """Test successful metadata fetch."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "asin": "B09TEST123",
-            "title": "Test Book",
-            "authors": [{"name": "Test Author"}],
-        }
+        mock_response.content = json.dumps(
+            {
+                "asin": "B09TEST123",
+                "title": "Test Book",
+                "authors": [{"name": "Test Author"}],
+            }
+        ).encode()
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
@@ -49,6 +70,7 @@ class TestFetchAudnexBook:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -75,6 +97,7 @@ class TestFetchAudnexBook:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -91,6 +114,7 @@ class TestFetchAudnexBook:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["uk", "us"]  # UK first, US second
 
         call_count = 0
@@ -107,10 +131,12 @@ class TestFetchAudnexBook:
             else:
                 # Second region succeeds
                 response.status_code = 200
-                response.json.return_value = {
-                    "asin": "B09TEST123",
-                    "title": "Test Book",
-                }
+                response.content = json.dumps(
+                    {
+                        "asin": "B09TEST123",
+                        "title": "Test Book",
+                    }
+                ).encode()
                 return response
 
         mock_client = MagicMock()
@@ -129,11 +155,131 @@ class TestFetchAudnexBook:
         assert call_count == 2  # Both regions tried
         assert region == "us"  # Found in US region
 
+    def test_fallback_regions_fetched_concurrently(self):
+        """Test remaining regions overlap after a primary miss and configured order wins."""
+        import threading
+
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_settings.audnex.regions = ["us", "uk", "au"]
+
+        au_started = threading.Event()
+
+        def mock_get(url, params=None):
+            region = params["region"]
+            response = MagicMock()
+            if region == "us":
+                response.status_code = 404
+                return response
+            if region == "uk":
+                # Only succeeds if the "au" request is in flight at the same time
+                response.status_code = 200 if au_started.wait(timeout=5) else 404
+            else:
+                au_started.set()
+                response.status_code = 200
+            response.content = json.dumps({"asin": "B09TEST123", "region": region}).encode()
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get = mock_get
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            result, region = fetch_audnex_book("B09TEST123")
+
+        assert region == "uk"
+        assert result == {"asin": "B09TEST123", "region": "uk"}
+
+    def test_slow_fallback_region_is_not_retried_after_hit(self):
+        """Test a fallback still in flight when another region hits makes one attempt only."""
+        import threading
+
+        from shelfr.metadata.audnex.client import _fetch_audnex_book_region
+
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_settings.audnex.regions = ["us", "uk", "au"]
+
+        au_started = threading.Event()
+        release_au = threading.Event()
+        au_finished = threading.Event()
+        au_calls = 0
+
+        def mock_get(url, params=None):
+            nonlocal au_calls
+            region = params["region"]
+            response = MagicMock()
+            if region == "au":
+                # Slow region: still in flight after "uk" hits, then fails transiently
+                au_calls += 1
+                au_started.set()
+                release_au.wait(timeout=5)
+                response.status_code = 503
+                au_finished.set()
+                return response
+            if region == "uk":
+                # Hit only once "au" is in flight, so it isn't just cancelled in the queue
+                au_started.wait(timeout=5)
+            response.status_code = 404 if region == "us" else 200
+            response.content = json.dumps({"asin": "B09TEST123", "region": region}).encode()
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get = mock_get
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+            # Retries (if any) would fire immediately instead of after a backoff
+            patch.object(_fetch_audnex_book_region.retry, "sleep", lambda _: None),
+        ):
+            result, region = fetch_audnex_book("B09TEST123")
+            assert not au_finished.is_set()  # Returned without waiting on "au"
+
+            release_au.set()
+            assert au_finished.wait(timeout=5)
+            time.sleep(0.2)
+
+        assert region == "uk"
+        assert result == {"asin": "B09TEST123", "region": "uk"}
+        assert au_calls == 1
+
+    def test_primary_region_hit_skips_fallbacks(self):
+        """Test a hit in the first region makes no further requests."""
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_settings.audnex.regions = ["us", "uk", "au"]
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"asin": "B09TEST123"}).encode()
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            _, region = fetch_audnex_book("B09TEST123")
+
+        assert region == "us"
+        assert mock_client.get.call_count == 1
+
     def test_specific_region_no_fallback(self):
         """Test that specifying region skips fallback."""
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us", "uk"]
 
         mock_response = MagicMock()
@@ -155,6 +301,301 @@ class TestFetchAudnexBook:
         # Only called once (no fallback to other regions)
         assert mock_client.get.call_count == 1
 
+    def test_invalid_response_warns_in_background(self, caplog):
+        """Test schema validation runs off the fetch path and still logs a warning."""
+        import logging
+
+        from shelfr.metadata.audnex.client import _validate_in_background
+
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_settings.audnex.regions = ["us"]
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"title": "No ASIN"}).encode()
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+
+        with (
+            caplog.at_level(logging.WARNING, logger="shelfr.metadata.audnex.client"),
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            result, _ = fetch_audnex_book("B09TEST123")
+            # The single validation worker runs jobs in order; wait for ours
+            _validate_in_background("book", "flush", {"asin": "B000000000"}).result(timeout=5)
+
+        assert result == {"title": "No ASIN"}
+        assert "validation warning for B09TEST123" in caplog.text
+
+    def test_client_reused_across_calls(self):
+        """Test repeated lookups share one pooled client."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_settings.audnex.regions = ["us", "uk"]
+
+        with (
+            patch(
+                "shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client
+            ) as mock_client_class,
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            fetch_audnex_book("B09TEST456")
+
+        mock_client_class.assert_called_once()
+        assert mock_client.get.call_count == 4
+
+
+class TestAudnexCache:
+    """Tests for the on-disk Audnex response cache."""
+
+    @pytest.fixture
+    def mock_settings(self, tmp_path, monkeypatch):
+        """Settings with caching enabled and the cache dir under tmp_path."""
+        monkeypatch.setenv("SHELFR_CACHE_DIR", str(tmp_path))
+        settings = MagicMock()
+        settings.audnex.base_url = "https://api.audnex.us"
+        settings.audnex.timeout_seconds = 30
+        settings.audnex.cache_ttl_seconds = 3600
+        settings.audnex.regions = ["us"]
+        return settings
+
+    @staticmethod
+    def _client_returning(payload: dict[str, str]) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(payload).encode()
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        return mock_client
+
+    def test_second_fetch_served_from_disk(self, mock_settings, tmp_path):
+        """Test a cached book skips the network on the next call."""
+        mock_client = self._client_returning({"asin": "B09TEST123", "title": "Cached"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            first = fetch_audnex_book("B09TEST123")
+            second = fetch_audnex_book("B09TEST123")
+
+        assert first == second == ({"asin": "B09TEST123", "title": "Cached"}, "us")
+        assert mock_client.get.call_count == 1
+        assert (tmp_path / "audnex" / "book_B09TEST123.json").exists()
+
+    def test_expired_entry_refetched(self, mock_settings, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        import os
+
+        mock_client = self._client_returning({"asin": "B09TEST123"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            cache_file = tmp_path / "audnex" / "book_B09TEST123.json"
+            os.utime(cache_file, (0, 0))
+            _clear_memory_cache()  # As in a fresh process
+            fetch_audnex_book("B09TEST123")
+
+        assert mock_client.get.call_count == 2
+
+    def test_region_mismatch_misses(self, mock_settings):
+        """Test an explicit region only matches entries cached for it."""
+        mock_client = self._client_returning({"asin": "B09TEST123"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            _, region = fetch_audnex_book("B09TEST123", region="uk")
+
+        assert region == "uk"
+        assert mock_client.get.call_count == 2
+
+    def test_memory_hit_skips_disk_read(self, mock_settings, tmp_path):
+        """Test a repeat lookup in the same process doesn't re-read the file."""
+        mock_client = self._client_returning({"asin": "B09TEST123"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            (tmp_path / "audnex" / "book_B09TEST123.json").write_text("corrupt")
+            result = fetch_audnex_book("B09TEST123")
+
+        assert result == ({"asin": "B09TEST123"}, "us")
+        assert mock_client.get.call_count == 1
+
+    def test_mutating_result_does_not_corrupt_cache(self, mock_settings):
+        """Test callers get their own copy, so edits don't leak into later cache hits."""
+        mock_client = self._client_returning({"asin": "B09TEST123", "title": "Original"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetched, _ = fetch_audnex_book("B09TEST123")
+            fetched["title"] = "Edited by fetcher"
+            first_hit, _ = fetch_audnex_book("B09TEST123")
+            first_hit["title"] = "Edited by reader"
+            second_hit, _ = fetch_audnex_book("B09TEST123")
+
+        assert second_hit == {"asin": "B09TEST123", "title": "Original"}
+        assert second_hit is not first_hit
+        assert mock_client.get.call_count == 1
+
+    def test_chapters_cached(self, mock_settings, tmp_path):
+        """Test chapter responses are cached alongside book metadata."""
+        mock_client = self._client_returning({"asin": "B09TEST123", "chapters": []})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            first = fetch_audnex_chapters("B09TEST123")
+            _clear_memory_cache()
+            second = fetch_audnex_chapters("B09TEST123")
+
+        assert first == second == {"asin": "B09TEST123", "chapters": []}
+        assert mock_client.get.call_count == 1
+        assert (tmp_path / "audnex" / "chapters_B09TEST123.json").exists()
+
+    def test_invalidate_cache_forces_refetch(self, mock_settings, tmp_path):
+        """Test invalidate_cache evicts memory and disk entries for the ASIN."""
+        mock_client = self._client_returning({"asin": "B09TEST123", "chapters": []})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            fetch_audnex_chapters("B09TEST123")
+            invalidate_cache("B09TEST123")
+            assert not list((tmp_path / "audnex").iterdir())
+            fetch_audnex_book("B09TEST123")
+
+        assert mock_client.get.call_count == 3
+
+    def test_region_misses_remembered(self, mock_settings):
+        """Test a 404 region isn't probed again until the ASIN is invalidated."""
+        mock_settings.audnex.regions = ["us", "uk"]
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            assert fetch_audnex_book("B09MISSING") == (None, None)
+            assert fetch_audnex_book("B09MISSING") == (None, None)
+            assert fetch_audnex_book("B09MISSING", region="uk") == (None, None)
+            assert mock_client.get.call_count == 2
+
+            invalidate_cache("B09MISSING")
+            fetch_audnex_book("B09MISSING")
+
+        assert mock_client.get.call_count == 4
+
+    def test_env_var_disables_cache(self, mock_settings, tmp_path, monkeypatch):
+        """Test SHELFR_AUDNEX_CACHE_DISABLE bypasses reads and writes."""
+        monkeypatch.setenv("SHELFR_AUDNEX_CACHE_DISABLE", "1")
+        mock_client = self._client_returning({"asin": "B09TEST123"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            fetch_audnex_book("B09TEST123")
+
+        assert mock_client.get.call_count == 2
+        assert not (tmp_path / "audnex").exists()
+
+    def test_zero_ttl_disables_cache(self, mock_settings, tmp_path):
+        """Test cache_ttl_seconds=0 neither reads nor writes the cache."""
+        mock_settings.audnex.cache_ttl_seconds = 0
+        mock_client = self._client_returning({"asin": "B09TEST123"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            fetch_audnex_book("B09TEST123")
+            fetch_audnex_book("B09TEST123")
+
+        assert mock_client.get.call_count == 2
+        assert not (tmp_path / "audnex").exists()
+
+    def test_author_cached(self, mock_settings):
+        """Test author lookups use the cache too."""
+        mock_client = self._client_returning({"asin": "B001AUTHOR", "name": "Author"})
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            first = fetch_audnex_author("B001AUTHOR")
+            second = fetch_audnex_author("B001AUTHOR")
+
+        assert first == second == {"asin": "B001AUTHOR", "name": "Author"}
+        assert mock_client.get.call_count == 1
+
+
+class TestFetchAudnexBooksBatch:
+    """Tests for concurrent Audnex book fetching."""
+
+    async def test_fetches_each_unique_asin(self):
+        """Test batch returns one entry per unique ASIN."""
+
+        def fake_fetch(asin: str) -> tuple[dict[str, str] | None, str | None]:
+            if asin == "B09MISSING":
+                return None, None
+            return {"asin": asin}, "us"
+
+        with patch(
+            "shelfr.metadata.audnex.client.fetch_audnex_book", side_effect=fake_fetch
+        ) as mock_fetch:
+            results = await fetch_audnex_books_batch(["B09TEST123", "B09MISSING", "B09TEST123"])
+
+        assert mock_fetch.call_count == 2
+        assert results == {
+            "B09TEST123": ({"asin": "B09TEST123"}, "us"),
+            "B09MISSING": (None, None),
+        }
+
+    async def test_error_maps_to_none(self):
+        """Test one failing lookup does not abort the batch."""
+
+        def fake_fetch(asin: str) -> tuple[dict[str, str] | None, str | None]:
+            if asin == "B09BROKEN1":
+                raise RuntimeError("boom")
+            return {"asin": asin}, "uk"
+
+        with patch("shelfr.metadata.audnex.client.fetch_audnex_book", side_effect=fake_fetch):
+            results = await fetch_audnex_books_batch(["B09BROKEN1", "B09TEST123"])
+
+        assert results["B09BROKEN1"] == (None, None)
+        assert results["B09TEST123"] == ({"asin": "B09TEST123"}, "uk")
+
 
 class TestFetchAudnexAuthor:
     """Tests for Audnex author API integration."""
@@ -165,10 +606,12 @@ class TestFetchAudnexAuthor:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "asin": "B001H6KJPW",
-            "name": "Brandon Sanderson",
-        }
+        mock_response.content = json.dumps(
+            {
+                "asin": "B001H6KJPW",
+                "name": "Brandon Sanderson",
+            }
+        ).encode()
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
@@ -178,6 +621,7 @@ class TestFetchAudnexAuthor:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -204,6 +648,7 @@ class TestFetchAudnexAuthor:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -228,15 +673,19 @@ class TestFetchAudnexAuthor:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
             patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
             patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+            patch("tenacity.nap.time.sleep"),
         ):
             result = fetch_audnex_author("B001H6KJPW")
 
         assert result is None
+        # Timeouts are retried before giving up
+        assert mock_client.get.call_count == 4
 
     def test_fetch_author_json_decode_error(self):
         """Test that JSON decode error returns None (catch-all exception)."""
@@ -244,7 +693,7 @@ class TestFetchAudnexAuthor:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
@@ -254,6 +703,7 @@ class TestFetchAudnexAuthor:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -290,6 +740,7 @@ class TestFetchAudnexAuthor:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -301,6 +752,74 @@ class TestFetchAudnexAuthor:
         assert result is None
 
 
+class TestAudnexTransientErrors:
+    """Tests for retrying Audnex gateway errors."""
+
+    @staticmethod
+    def _responses(*status_codes: int) -> list[MagicMock]:
+        responses = []
+        for code in status_codes:
+            response = MagicMock()
+            response.status_code = code
+            response.content = json.dumps({"asin": "B09TEST123", "name": "Author"}).encode()
+            responses.append(response)
+        return responses
+
+    @pytest.fixture
+    def mock_settings(self):
+        settings = MagicMock()
+        settings.audnex.base_url = "https://api.audnex.us"
+        settings.audnex.timeout_seconds = 30
+        settings.audnex.cache_ttl_seconds = 0
+        settings.audnex.regions = ["us"]
+        return settings
+
+    def test_book_retries_gateway_error(self, mock_settings):
+        """Test a 503 is retried and the later 200 is returned."""
+        mock_client = MagicMock()
+        mock_client.get.side_effect = self._responses(503, 502, 200)
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+            patch("tenacity.nap.time.sleep"),
+        ):
+            data, region = fetch_audnex_book("B09TEST123")
+
+        assert data is not None
+        assert region == "us"
+        assert mock_client.get.call_count == 3
+
+    def test_author_gives_up_after_retries(self, mock_settings):
+        """Test persistent gateway errors return None after all attempts."""
+        mock_client = MagicMock()
+        mock_client.get.side_effect = self._responses(504, 504, 504, 504)
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+            patch("tenacity.nap.time.sleep"),
+        ):
+            result = fetch_audnex_author("B09TEST123")
+
+        assert result is None
+        assert mock_client.get.call_count == 4
+
+    def test_not_found_is_not_retried(self, mock_settings):
+        """Test 404 stays a terminal miss."""
+        mock_client = MagicMock()
+        mock_client.get.side_effect = self._responses(404)
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            result = fetch_audnex_author("B09TEST123")
+
+        assert result is None
+        assert mock_client.get.call_count == 1
+
+
 class TestFetchAudnexChapters:
     """Tests for Audnex chapters API integration."""
 
@@ -310,25 +829,27 @@ class TestFetchAudnexChapters:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "asin": "B09TEST123",
-            "runtimeLengthMs": 25050260,
-            "runtimeLengthSec": 25050,
-            "chapters": [
-                {
-                    "lengthMs": 19597,
-                    "startOffsetMs": 0,
-                    "startOffsetSec": 0,
-                    "title": "Opening Credits",
-                },
-                {
-                    "lengthMs": 706513,
-                    "startOffsetMs": 19597,
-                    "startOffsetSec": 19,
-                    "title": "Prologue",
-                },
-            ],
-        }
+        mock_response.content = json.dumps(
+            {
+                "asin": "B09TEST123",
+                "runtimeLengthMs": 25050260,
+                "runtimeLengthSec": 25050,
+                "chapters": [
+                    {
+                        "lengthMs": 19597,
+                        "startOffsetMs": 0,
+                        "startOffsetSec": 0,
+                        "title": "Opening Credits",
+                    },
+                    {
+                        "lengthMs": 706513,
+                        "startOffsetMs": 19597,
+                        "startOffsetSec": 19,
+                        "title": "Prologue",
+                    },
+                ],
+            }
+        ).encode()
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
@@ -338,6 +859,7 @@ class TestFetchAudnexChapters:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -367,6 +889,7 @@ class TestFetchAudnexChapters:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -626,6 +1149,12 @@ class TestHtmlToBbcode:
         result = _html_to_bbcode(text)
         assert "[b]Strong text[/b]" in result
 
+    def test_converts_mixed_case_tags_with_attributes(self):
+        """Test formatting tags match case-insensitively and allow attributes."""
+        text = '<B class="x">Bold</B> <STRIKE>gone</STRIKE> <span>plain</span><br>'
+        result = _html_to_bbcode(text)
+        assert result == "[b]Bold[/b] [s]gone[/s] plain[br]"
+
     def test_converts_italic_tags(self):
         """Test italic tag conversion to BBCode."""
         text = "<p>Read <i>New York Times</i> bestseller</p>"
@@ -1384,6 +1913,7 @@ class TestFetchAudnexEdgeCases:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -1408,6 +1938,7 @@ class TestFetchAudnexEdgeCases:
         mock_settings = MagicMock()
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.cache_ttl_seconds = 0
         mock_settings.audnex.regions = ["us"]
 
         with (
@@ -1435,6 +1966,61 @@ class TestFetchAudnexEdgeCases:
 class TestRunMediainfoEdgeCases:
     """Additional tests for run_mediainfo."""
 
+    def test_binary_resolved_once(self, tmp_path: Path):
+        """Test the PATH lookup for the binary is cached across calls."""
+        from shelfr.metadata.mediainfo.extractor import _resolve_mediainfo_binary
+
+        mock_settings = MagicMock()
+        mock_settings.mediainfo.binary = "mediainfo-test-bin"
+        mock_result = MagicMock()
+        mock_result.stdout = b"{}"
+
+        temp_file = tmp_path / "test.m4b"
+        temp_file.write_bytes(b"fake")
+
+        _resolve_mediainfo_binary.cache_clear()
+        try:
+            with (
+                patch(
+                    "shelfr.metadata.mediainfo.extractor.shutil.which",
+                    return_value="/usr/bin/mediainfo-test-bin",
+                ) as mock_which,
+                patch(
+                    "shelfr.metadata.mediainfo.extractor._run_mediainfo_subprocess",
+                    return_value=mock_result,
+                ) as mock_run,
+                patch(
+                    "shelfr.metadata.mediainfo.extractor.get_settings",
+                    return_value=mock_settings,
+                ),
+            ):
+                run_mediainfo(temp_file)
+                run_mediainfo(temp_file)
+
+            mock_which.assert_called_once_with("mediainfo-test-bin")
+            assert mock_run.call_args[0][0][0] == "/usr/bin/mediainfo-test-bin"
+        finally:
+            _resolve_mediainfo_binary.cache_clear()
+
+    def test_check_exists_false_skips_stat(self, tmp_path: Path):
+        """Test check_exists=False runs mediainfo without stat-ing the file."""
+        mock_settings = MagicMock()
+        mock_settings.mediainfo.binary = "mediainfo"
+        mock_result = MagicMock()
+        mock_result.stdout = b'{"media": null}'
+
+        with (
+            patch(
+                "shelfr.metadata.mediainfo.extractor._run_mediainfo_subprocess",
+                return_value=mock_result,
+            ) as mock_run,
+            patch("shelfr.metadata.mediainfo.extractor.get_settings", return_value=mock_settings),
+        ):
+            result = run_mediainfo(tmp_path / "unchecked.m4b", check_exists=False)
+
+        mock_run.assert_called_once()
+        assert result == {"media": None}
+
     def test_binary_not_found(self, tmp_path: Path):
         """Test handling missing mediainfo binary."""
         mock_settings = MagicMock()
@@ -1498,6 +2084,50 @@ class TestRunMediainfoEdgeCases:
 
         assert result is None
 
+    def test_parses_raw_bytes_output(self, tmp_path: Path):
+        """Test stdout is parsed straight from bytes without a text decode."""
+        import subprocess
+
+        mock_settings = MagicMock()
+        mock_settings.mediainfo.binary = "mediainfo"
+
+        temp_file = tmp_path / "test.m4b"
+        temp_file.write_bytes(b"fake")
+
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout='{"media": {"@ref": "Café"}}'.encode(), stderr=b""
+        )
+
+        with (
+            patch("shelfr.metadata.mediainfo.extractor.subprocess.run", return_value=completed),
+            patch("shelfr.metadata.mediainfo.extractor.get_settings", return_value=mock_settings),
+        ):
+            result = run_mediainfo(temp_file)
+
+        assert result == {"media": {"@ref": "Café"}}
+
+    def test_invalid_utf8_output(self, tmp_path: Path):
+        """Test undecodable output is treated like invalid JSON."""
+        mock_result = MagicMock()
+        mock_result.stdout = b"\xff\xfe{"
+
+        mock_settings = MagicMock()
+        mock_settings.mediainfo.binary = "mediainfo"
+
+        temp_file = tmp_path / "test.m4b"
+        temp_file.write_bytes(b"fake")
+
+        with (
+            patch(
+                "shelfr.metadata.mediainfo.extractor._run_mediainfo_subprocess",
+                return_value=mock_result,
+            ),
+            patch("shelfr.metadata.mediainfo.extractor.get_settings", return_value=mock_settings),
+        ):
+            result = run_mediainfo(temp_file)
+
+        assert result is None
+
 
 class TestInferFictionOrNonfiction:
     """Tests for _infer_fiction_or_nonfiction function."""
@@ -2160,6 +2790,24 @@ class TestMapGenresToCategories:
         # Should NOT match "action" - word boundary prevents false positive
         assert result == []
 
+    def test_fallback_patterns_compiled_once_per_map(self):
+        """Fallback word-boundary patterns are reused across calls."""
+        from shelfr.metadata.mam.categories import _word_boundary_patterns
+
+        mock_settings = MagicMock()
+        mock_settings.categories.genre_map = {"thriller": 50, "sci": 45}
+        _word_boundary_patterns.cache_clear()
+
+        with patch("shelfr.metadata.mam.categories.get_settings", return_value=mock_settings):
+            first = _map_genres_to_categories([{"name": "Psychological Thriller"}])
+            second = _map_genres_to_categories([{"name": "Legal Thriller"}])
+
+        assert first == second == [50]
+        assert _word_boundary_patterns.cache_info().misses == 1
+        # Short keys never take part in the fallback match
+        patterns = _word_boundary_patterns(("thriller", "sci"), 4)
+        assert [key for key, _ in patterns] == ["thriller"]
+
     def test_empty_genres_returns_empty(self):
         """Empty genres list returns empty categories."""
         mock_settings = MagicMock()
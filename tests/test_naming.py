@@ -41,6 +41,10 @@ class TestSanitizeFilename:
         assert sanitize_filename("...Book...") == "Book"
         assert sanitize_filename(". Book .") == "Book"
 
+    def test_normalizes_every_mapped_char(self) -> None:
+        """Test each NORMALIZE_MAP character is replaced in a single pass."""
+        assert sanitize_filename("A\\B|C<D>E*F") == "A-B-CDEF"
+
 
 class TestTruncateFilename:
     """Tests for filename truncation."""
@@ -53,12 +53,14 @@ class TestFetchMetadataLegacy:
         with patch(
             "shelfr.metadata.orchestration.run_mediainfo",
             return_value=mock_mediainfo,
-        ):
+        ) as mock_run:
             audnex, mediainfo, chapters = fetch_metadata_legacy(m4b_path=m4b_file)
 
             assert audnex is None
             assert mediainfo == mock_mediainfo
             assert chapters is None
+            # Path was already checked here, so run_mediainfo skips its own stat
+            mock_run.assert_called_once_with(m4b_file, check_exists=False)
 
     def test_fetch_with_both(self, tmp_path: Path) -> None:
         """Test fetching with both ASIN and m4b path."""
@@ -91,6 +93,49 @@ class TestFetchMetadataLegacy:
             assert mediainfo == mock_mediainfo
             assert chapters == mock_chapters
 
+    def test_audnex_and_mediainfo_overlap(self, tmp_path: Path) -> None:
+        """Test MediaInfo runs concurrently with the Audnex requests."""
+        import threading
+
+        m4b_file = tmp_path / "test.m4b"
+        m4b_file.touch()
+        mediainfo_started = threading.Event()
+
+        def fake_mediainfo(path: Path, **kwargs: object) -> dict[str, str]:
+            mediainfo_started.set()
+            return {"container": "m4a"}
+
+        def fake_fetch_book(asin: str) -> tuple[dict[str, object], str]:
+            # Only sees MediaInfo running if it was started alongside Audnex
+            return {"asin": asin, "overlapped": mediainfo_started.wait(timeout=5)}, "us"
+
+        with (
+            patch("shelfr.metadata.orchestration.fetch_audnex_book", side_effect=fake_fetch_book),
+            patch("shelfr.metadata.orchestration.fetch_audnex_chapters", return_value=None),
+            patch("shelfr.metadata.orchestration.run_mediainfo", side_effect=fake_mediainfo),
+        ):
+            audnex, mediainfo, _ = fetch_metadata_legacy(asin="B08G9PRS1K", m4b_path=m4b_file)
+
+        assert audnex == {"asin": "B08G9PRS1K", "overlapped": True}
+        assert mediainfo == {"container": "m4a"}
+
+    def test_prefetched_audnex_skips_book_request(self) -> None:
+        """Test passing audnex_data skips the book fetch but still gets chapters."""
+        prefetched = {"asin": "B08G9PRS1K", "title": "Prefetched"}
+
+        with (
+            patch("shelfr.metadata.orchestration.fetch_audnex_book") as mock_book,
+            patch(
+                "shelfr.metadata.orchestration.fetch_audnex_chapters",
+                return_value={"chapters": []},
+            ),
+        ):
+            audnex, _, chapters = fetch_metadata_legacy(asin="B08G9PRS1K", audnex_data=prefetched)
+
+        mock_book.assert_not_called()
+        assert audnex is prefetched
+        assert chapters == {"chapters": []}
+
     def test_fetch_with_nonexistent_m4b(self, tmp_path: Path) -> None:
         """Test fetching with nonexistent m4b path."""
         m4b_file = tmp_path / "nonexistent.m4b"
@@ -11,6 +11,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from unittest.mock import patch
@@ -20,6 +21,7 @@ import pytest
 from shelfr.metadata.aggregator import MetadataAggregator
 from shelfr.metadata.providers import (
     AudnexProvider,
+    IdType,
     LookupContext,
     MetadataProvider,
     MockProvider,
@@ -274,6 +276,37 @@ class TestMockProvider:
         assert mock.can_lookup(ctx, "asin") is True
         assert mock.can_lookup(ctx, "isbn") is False
 
+    def test_can_lookup_after_set_response_and_error(self) -> None:
+        """Test identifiers registered after construction are lookupable."""
+        mock = MockProvider()
+        mock.set_response("B08G9PRS1K", {"title": "Test"})
+        mock.set_error("BADASIN", "Not found")
+
+        assert mock.can_lookup(LookupContext.from_asin(asin="B08G9PRS1K"), "asin") is True
+        assert mock.can_lookup(LookupContext.from_asin(asin="BADASIN"), "asin") is True
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_independent_copies(self) -> None:
+        """Test mutating a fetched result doesn't affect later fetches."""
+        mock = MockProvider(
+            responses={"A": {"title": "Test"}},
+            confidences={"A": {"title": 0.8}},
+        )
+        ctx = LookupContext.from_asin(asin="A")
+
+        first = await mock.fetch(ctx, "asin")
+        first.fields["title"] = "Changed"
+        second = await mock.fetch(ctx, "asin")
+
+        assert second.fields == {"title": "Test"}
+        assert second.confidence == {"title": 0.8}
+
+    def test_invalid_confidence_rejected_at_registration(self) -> None:
+        """Test out-of-range confidences fail when the response is set."""
+        mock = MockProvider()
+        with pytest.raises(ValueError, match="confidence"):
+            mock.set_response("A", {"title": "Test"}, {"title": 1.5})
+
     @pytest.mark.asyncio
     async def test_fetch_returns_configured_response(self) -> None:
         """Test fetch returns configured response."""
@@ -331,6 +364,17 @@ class TestMockProvider:
         assert mock.fetch_count == 0
         assert len(mock.fetch_history) == 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_history_is_bounded(self) -> None:
+        """Test fetch_history keeps only the most recent history_limit calls."""
+        mock = MockProvider(responses={"A": {"title": "Test"}}, history_limit=2)
+
+        for asin in ("A", "B", "C"):
+            await mock.fetch(LookupContext.from_asin(asin=asin), "asin")
+
+        assert mock.fetch_count == 3
+        assert [ctx.asin for ctx, _ in mock.fetch_history] == ["B", "C"]
+
 
 # =============================================================================
 # AudnexProvider Tests
@@ -629,6 +673,23 @@ class TestMetadataAggregator:
         assert result.fields["title"] == "Priority Title"
         assert result.sources["title"] == "high_priority"
 
+    @pytest.mark.asyncio
+    async def test_conflict_resolution_by_quality(self) -> None:
+        """Test quality breaks ties when confidence and priority are equal."""
+        registry = ProviderRegistry()
+        for name, summary in (("a", "Short"), ("b", "A much longer summary"), ("c", "Medium one")):
+            registry.register(
+                MockProvider(name=name, priority=50, responses={"A": {"summary": summary}})
+            )
+
+        aggregator = MetadataAggregator(registry, merge_strategy="confidence")
+        ctx = LookupContext.from_asin(asin="A")
+        result = await aggregator.fetch_all(ctx, stop_on_complete=False)
+
+        assert result.fields["summary"] == "A much longer summary"
+        assert result.sources["summary"] == "b"
+        assert result.conflicts[0].resolution_reason == "quality"
+
     @pytest.mark.asyncio
     async def test_priority_strategy(self) -> None:
         """Test merge_strategy='priority' ignores confidence."""
@@ -803,6 +864,108 @@ class TestMetadataAggregator:
         assert result.fields["title"] == "Network Title"
         assert network.fetch_count == 1
 
+    @pytest.mark.asyncio
+    async def test_network_providers_fetch_concurrently(self) -> None:
+        """Test network providers overlap instead of running one after another."""
+        registry = ProviderRegistry()
+        second_started = asyncio.Event()
+
+        class WaitingProvider(MockProvider):
+            async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
+                # Only completes if the next provider was started alongside it
+                await asyncio.wait_for(second_started.wait(), timeout=5)
+                return await super().fetch(ctx, id_type)
+
+        class SignallingProvider(MockProvider):
+            async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
+                second_started.set()
+                return await super().fetch(ctx, id_type)
+
+        registry.register(
+            WaitingProvider(name="first", priority=10, responses={"A": {"publisher": "Pub"}})
+        )
+        registry.register(
+            SignallingProvider(name="second", priority=20, responses={"A": {"title": "Title"}})
+        )
+
+        aggregator = MetadataAggregator(registry)
+        ctx = LookupContext.from_asin(asin="A")
+        result = await aggregator.fetch_all(ctx, required_fields=["title"])
+
+        assert result.fields == {"publisher": "Pub", "title": "Title"}
+
+    @pytest.mark.asyncio
+    async def test_network_early_exit_cancels_remaining(self) -> None:
+        """Test providers after the one filling required fields are cancelled and ignored."""
+        registry = ProviderRegistry()
+        cancelled = asyncio.Event()
+
+        class SlowProvider(MockProvider):
+            async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return await super().fetch(ctx, id_type)
+
+        registry.register(MockProvider(name="fast", priority=10, responses={"A": {"title": "T"}}))
+        registry.register(
+            SlowProvider(name="slow", priority=20, responses={"A": {"publisher": "Slow"}})
+        )
+
+        aggregator = MetadataAggregator(registry)
+        ctx = LookupContext.from_asin(asin="A")
+        result = await aggregator.fetch_all(ctx, required_fields=["title"])
+
+        assert result.fields == {"title": "T"}
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_local_early_exit_cancels_slow_providers(self) -> None:
+        """Test stage 1 stops once required fields are filled, keeping override results."""
+        registry = ProviderRegistry()
+        override_ran = asyncio.Event()
+
+        class SlowProvider(MockProvider):
+            async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
+                await asyncio.sleep(10)
+                return await super().fetch(ctx, id_type)
+
+        class OverrideProvider(MockProvider):
+            async def fetch(self, ctx: LookupContext, id_type: IdType) -> ProviderResult:
+                await asyncio.sleep(0)
+                override_ran.set()
+                return await super().fetch(ctx, id_type)
+
+        registry.register(
+            MockProvider(name="fast", priority=10, kind="local", responses={"A": {"title": "T"}})
+        )
+        registry.register(
+            SlowProvider(name="slow", priority=20, kind="local", responses={"A": {"isbn": "1"}})
+        )
+        registry.register(
+            OverrideProvider(
+                name="sidecar",
+                priority=30,
+                kind="local",
+                is_override=True,
+                responses={"A": {"genres": []}},
+            )
+        )
+        network = MockProvider(name="network", priority=5, responses={"A": {"title": "N"}})
+        registry.register(network)
+
+        aggregator = MetadataAggregator(registry)
+        ctx = LookupContext.from_asin(asin="A")
+        result = await asyncio.wait_for(
+            aggregator.fetch_all(ctx, required_fields=["title"]), timeout=5
+        )
+
+        assert result.fields == {"title": "T", "genres": []}
+        assert override_ran.is_set()
+        assert network.fetch_count == 0
+
     @pytest.mark.asyncio
     async def test_tracks_missing_fields(self) -> None:
         """Test missing fields are tracked."""
@@ -1023,6 +1023,11 @@ class TestExtractRipperTag:
         folder = "Author - Title (2024) [MyTag] [B0123456789]"
         assert _extract_ripper_tag(folder) == "MyTag"
 
+    def test_stacked_asin_markers_any_order(self) -> None:
+        """Strips every trailing ASIN marker, regardless of count or order."""
+        folder = "Title [Tag] {ASIN.B0AAAAAAAA} [B0AAAAAAAA]"
+        assert _extract_ripper_tag(folder) == "Tag"
+
     def test_no_ripper_tag(self) -> None:
         """Returns None when no ripper tag present."""
         assert _extract_ripper_tag("Author - Title (2024) (Narrator)") is None